@@ -8,6 +8,11 @@ extends Node
 
 enum LogLevel { DEBUG, INFO, WARNING, ERROR, NONE = 4 }
 
+const DEFAULT_SETTINGS_PATH: String = "res://config_resources/default_settings.tres"
+const MAIN_MENU_SCENE: String = "res://scenes/main_menu.tscn"
+## Upper bound for Engine.time_scale set by E2E tests via window.setTimeScale.
+const MAX_TIME_SCALE: float = 16.0
+
 # --- TASK #529: Encryption Key Management ---
 ## Centralized key for securing local configuration files.
 ## This ensures consistent encryption/decryption across different game systems.
@@ -31,6 +36,16 @@ var next_scene: String = ""  # Path to the next scene to load via loading screen
 ## Updated when player toggles Keyboard/Gamepad in Key Mapping.
 var current_input_device: String = "keyboard"  # "keyboard" or "gamepad"
 var _is_loading_settings: bool = false  # Guard flag
+# JS callback reference for window.resetGameState (must be stored to prevent GC)
+var _reset_game_state_cb: JavaScriptObject
+# JS callback reference for window.requestEngineMonitors (must be stored to prevent GC)
+var _engine_monitors_cb: JavaScriptObject
+# JS callback reference for window.setTimeScale (must be stored to prevent GC)
+var _set_time_scale_cb: JavaScriptObject
+# Batched game state pushed to window.__skylockState at most once per frame
+var _game_state: Dictionary = {}
+var _game_state_dirty: bool = false
+var _state_channel: JavaScriptObject
 
 
 func _ready() -> void:
@@ -38,7 +53,7 @@ func _ready() -> void:
 	process_mode = Node.PROCESS_MODE_ALWAYS
 
 	# Load the resource here instead of preloading at the top
-	settings = load("res://config_resources/default_settings.tres") as GameSettingsResource
+	settings = load(DEFAULT_SETTINGS_PATH) as GameSettingsResource
 	if settings == null:
 		# Use push_error since Globals logging might not be ready
 		push_error("CRITICAL: 'GameSettingsResource' failed to load at path.")
@@ -57,11 +72,258 @@ func _ready() -> void:
 
 	# Signal Playwright that the engine is ready and initialize current log level state
 	if OS.has_feature("web"):
+		# Boot phase marks: autoloads are ready now; the first drawn frame follows
+		JavaScriptBridge.eval("performance.mark('skylock:godot-ready')")
+		RenderingServer.frame_post_draw.connect(_on_first_frame_drawn, CONNECT_ONE_SHOT)
 		JavaScriptBridge.eval("window.godotInitialized = true")
 		if is_instance_valid(settings):
 			JavaScriptBridge.eval(
 				"window.currentLogLevel = " + JSON.stringify(settings.current_log_level)
 			)
+		# Expose the in-place reset used by Playwright to reuse one booted engine
+		var js_window := JavaScriptBridge.get_interface("window")
+		if js_window:
+			_reset_game_state_cb = JavaScriptBridge.create_callback(
+				Callable(self, "_on_reset_game_state_js")
+			)
+			js_window.resetGameState = _reset_game_state_cb
+			# Engine telemetry for the harness: JS heap numbers miss linear memory
+			_engine_monitors_cb = JavaScriptBridge.create_callback(
+				Callable(self, "_on_engine_monitors_js")
+			)
+			js_window.requestEngineMonitors = _engine_monitors_cb
+			# Lets time-based E2E tests accelerate timers and physics
+			_set_time_scale_cb = JavaScriptBridge.create_callback(
+				Callable(self, "_on_set_time_scale_js")
+			)
+			js_window.setTimeScale = _set_time_scale_cb
+			JavaScriptBridge.eval("window.currentTimeScale = " + str(Engine.time_scale))
+		# Page-side ring buffer defined by custom_shell.html (absent in other shells)
+		_state_channel = JavaScriptBridge.get_interface("__skylockState")
+	if is_instance_valid(settings):
+		report_game_state("log_level", settings.current_log_level)
+	if _state_channel != null:
+		# Scene is reported on change rather than polled every frame
+		get_tree().scene_changed.connect(_report_current_scene)
+		_report_current_scene.call_deferred()
+	else:
+		# Nothing to publish outside the custom web shell (desktop, other shells)
+		set_process(false)
+
+
+func _process(_delta: float) -> void:
+	if _game_state_dirty:
+		_flush_game_state()
+
+
+## Records the active scene in the game state snapshot.
+## :rtype: void
+func _report_current_scene() -> void:
+	var scene: Node = get_tree().current_scene
+	report_game_state("scene", scene.scene_file_path if is_instance_valid(scene) else "")
+
+
+## Records one field of the game state snapshot published to the browser.
+##
+## Unchanged values are ignored; changed ones are batched and pushed once at
+## the end of the frame, replacing per-change JavaScriptBridge.eval calls.
+##
+## :param key: Snapshot field (e.g. "fuel", "speed", "scene", "weapon").
+## :type key: String
+## :param value: JSON-serializable value.
+## :type value: Variant
+## :rtype: void
+func report_game_state(key: String, value: Variant) -> void:
+	if _game_state.has(key):
+		var previous: Variant = _game_state[key]
+		if typeof(previous) == typeof(value) and previous == value:
+			return
+	_game_state[key] = value
+	_game_state_dirty = true
+
+
+## Pushes the batched snapshot to window.__skylockState in one bridge call.
+## :rtype: void
+func _flush_game_state() -> void:
+	_game_state_dirty = false
+	if _state_channel == null:
+		return
+	var snapshot: Dictionary = _game_state.duplicate()
+	snapshot["frame"] = Engine.get_process_frames()
+	snapshot["time_ms"] = Time.get_ticks_msec()
+	_state_channel.push(JSON.stringify(snapshot))
+
+
+## Marks the first rendered frame for the Playwright boot phase breakdown.
+func _on_first_frame_drawn() -> void:
+	JavaScriptBridge.eval("performance.mark('skylock:first-frame')")
+
+
+## Restores the running game to a freshly booted main-menu state without reloading.
+##
+## Resets gameplay settings, key bindings and audio buses to their defaults
+## (persisting them), frees overlay menus parented to the root window, unpauses
+## the tree and reloads the main menu scene.
+## Awaits the scene change so the main menu's JS callbacks are registered on return.
+##
+## :rtype: Dictionary ({"ok": bool, "scene": String, "difficulty": float, "log_level": int})
+func reset_game_state() -> Dictionary:
+	get_tree().paused = false
+	_free_overlay_menus()
+
+	_reset_settings_to_defaults()
+	Settings.reset_to_defaults("keyboard")
+	Settings.reset_to_defaults("gamepad")
+	AudioManager.stop_all_sfx()
+	AudioManager.reset_volumes()
+
+	set_time_scale(1.0)
+	current_input_device = "keyboard"
+	previous_scene = MAIN_MENU_SCENE
+	next_scene = ""
+
+	var err: int = get_tree().change_scene_to_file(MAIN_MENU_SCENE)
+	if err == OK:
+		await get_tree().scene_changed
+	else:
+		log_message("Failed to reload main menu (Error %d)." % err, LogLevel.ERROR)
+
+	var scene: Node = get_tree().current_scene
+	log_message("Game state reset to defaults.", LogLevel.DEBUG)
+	return {
+		"ok": err == OK,
+		"scene": scene.scene_file_path if is_instance_valid(scene) else "",
+		"difficulty": settings.difficulty,
+		"log_level": settings.current_log_level,
+	}
+
+
+## JS callback bound to window.resetGameState for Playwright E2E tests.
+##
+## Runs reset_game_state() and publishes the result, together with the optional
+## caller token, to window.gameStateReset once the main menu is ready.
+##
+## :param args: JS arguments; args[0][0] may carry a caller token (String).
+## :type args: Array
+## :rtype: void
+func _on_reset_game_state_js(args: Array) -> void:
+	var token: String = ""
+	if not args.is_empty() and typeof(args[0]) == TYPE_OBJECT:
+		var raw_token: Variant = args[0][0]
+		if raw_token is String:
+			token = raw_token
+
+	var result: Dictionary = await reset_game_state()
+	result["token"] = token
+	_game_state.erase("fuel")
+	_game_state.erase("speed")
+	_game_state.erase("weapon")
+	JavaScriptBridge.eval("delete window.currentFuel")
+	# Settings were restored under _is_loading_settings, so re-report the level;
+	# flushing now keeps window.currentLogLevel in step with gameStateReset.
+	report_game_state("log_level", settings.current_log_level)
+	_flush_game_state()
+	JavaScriptBridge.eval("window.gameStateReset = " + JSON.stringify(result))
+
+
+## Reads the engine Performance monitors reported to the Playwright harness.
+##
+## Static memory is only tracked by debug/editor builds and reads 0 elsewhere.
+##
+## :rtype: Dictionary (monitor name -> int)
+func get_engine_monitors() -> Dictionary:
+	return {
+		"static_memory_bytes": int(Performance.get_monitor(Performance.MEMORY_STATIC)),
+		"static_memory_max_bytes": int(Performance.get_monitor(Performance.MEMORY_STATIC_MAX)),
+		"object_count": int(Performance.get_monitor(Performance.OBJECT_COUNT)),
+		"resource_count": int(Performance.get_monitor(Performance.OBJECT_RESOURCE_COUNT)),
+		"node_count": int(Performance.get_monitor(Performance.OBJECT_NODE_COUNT)),
+		"orphan_node_count": int(Performance.get_monitor(Performance.OBJECT_ORPHAN_NODE_COUNT)),
+		"draw_calls": int(Performance.get_monitor(Performance.RENDER_TOTAL_DRAW_CALLS_IN_FRAME)),
+	}
+
+
+## JS callback bound to window.requestEngineMonitors for Playwright E2E tests.
+##
+## JS callbacks cannot return values, so the snapshot is published to
+## window.engineMonitors synchronously, before the JS call returns.
+##
+## :param _args: JS arguments (unused).
+## :type _args: Array
+## :rtype: void
+func _on_engine_monitors_js(_args: Array) -> void:
+	JavaScriptBridge.eval("window.engineMonitors = " + JSON.stringify(get_engine_monitors()))
+
+
+## Sets Engine.time_scale, clamped to [0, MAX_TIME_SCALE].
+##
+## Scales process/physics delta and Timer nodes, so gameplay timers such as the
+## fuel tick run faster without changing per-tick logic.
+##
+## :param scale: Requested time scale (1.0 = real time).
+## :type scale: float
+## :rtype: float (the applied time scale)
+func set_time_scale(scale: float) -> float:
+	Engine.time_scale = clampf(scale, 0.0, MAX_TIME_SCALE)
+	if OS.has_feature("web"):
+		JavaScriptBridge.eval("window.currentTimeScale = " + str(Engine.time_scale))
+	return Engine.time_scale
+
+
+## JS callback bound to window.setTimeScale for Playwright E2E tests.
+##
+## :param args: JS arguments; args[0][0] is the requested time scale (Number).
+## :type args: Array
+## :rtype: void
+func _on_set_time_scale_js(args: Array) -> void:
+	if args.is_empty() or typeof(args[0]) != TYPE_OBJECT:
+		return
+	var raw_scale: Variant = args[0][0]
+	if raw_scale is float or raw_scale is int:
+		var applied: float = set_time_scale(float(raw_scale))
+		log_message("Time scale set to: " + str(applied), LogLevel.DEBUG)
+
+
+## Restores every exported GameSettingsResource property from the default resource.
+## Loads an uncached copy so in-memory mutations of Globals.settings are not reused.
+## :param path: Config file path to persist to (default: Settings.CONFIG_PATH).
+## :type path: String
+## :rtype: void
+func _reset_settings_to_defaults(path: String = Settings.CONFIG_PATH) -> void:
+	var defaults: GameSettingsResource = (
+		ResourceLoader.load(DEFAULT_SETTINGS_PATH, "", ResourceLoader.CACHE_MODE_IGNORE)
+		as GameSettingsResource
+	)
+	if defaults == null:
+		defaults = GameSettingsResource.new()
+
+	# Apply silently and persist once instead of once per property
+	_is_loading_settings = true
+	for prop: Dictionary in defaults.get_property_list():
+		var usage: int = prop["usage"]
+		if usage & PROPERTY_USAGE_SCRIPT_VARIABLE and usage & PROPERTY_USAGE_STORAGE:
+			settings.set(prop["name"], defaults.get(prop["name"]))
+	settings.current_fuel = settings.max_fuel
+	if Engine.is_editor_hint() or settings.enable_debug_logging:
+		settings.current_log_level = LogLevel.DEBUG
+	_is_loading_settings = false
+
+	_save_settings(path)
+
+
+## Frees menus added directly to the root window (options, key mapping, dialogs).
+## Autoload singletons and the current scene are left untouched.
+## :rtype: void
+func _free_overlay_menus() -> void:
+	var tree: SceneTree = get_tree()
+	for child: Node in tree.root.get_children():
+		if child == tree.current_scene or ProjectSettings.has_setting("autoload/" + child.name):
+			continue
+		child.queue_free()
+
+	hidden_menus.clear()
+	options_open = false
+	options_instance = null
 
 
 ## Reactive handler for the Observer Pattern connected to GameSettingsResource signals.
@@ -86,19 +348,17 @@ func _on_setting_changed(setting_name: String, new_value: Variant) -> void:
 	# High-frequency setting handling: 'current_fuel' mutates rapidly during gameplay loops.
 	# Bypass standard disk I/O and standard log spam to preserve game performance.
 	if setting_name == "current_fuel":
-		# Push live fuel value directly to browser window scope for Playwright E2E assertions
-		if OS.has_feature("web"):
-			JavaScriptBridge.eval("window.currentFuel = " + JSON.stringify(new_value))
+		# Batched into the per-frame state snapshot (mirrored to window.currentFuel)
+		report_game_state("fuel", new_value)
 
 		# Conditionally log fuel updates ONLY if log level is explicitly set to DEBUG
 		if is_instance_valid(settings) and settings.current_log_level == LogLevel.DEBUG:
 			log_message(log_msg, LogLevel.DEBUG)
 		return
 
-	# Web / E2E state synchronization: Expose current log level to window.currentLogLevel
+	# Web / E2E state synchronization: batched into the snapshot (mirrored to window.currentLogLevel)
 	if setting_name == "current_log_level":
-		if OS.has_feature("web"):
-			JavaScriptBridge.eval("window.currentLogLevel = " + JSON.stringify(new_value))
+		report_game_state("log_level", new_value)
 
 	# Log standard setting mutations at DEBUG level
 	log_message(log_msg, LogLevel.DEBUG)
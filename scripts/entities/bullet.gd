@@ -16,6 +16,7 @@ extends Node2D
 # var shot_sound: AudioStream
 var can_fire: bool = true
 var timer: Timer
+var shots_fired: int = 0
 
 
 # NO @onready for ShotSFX — we’ll create players dynamically
@@ -44,6 +45,8 @@ func fire() -> void:
 
 	var scaled_cooldown: float = fire_rate * Globals.settings.difficulty
 	timer.start(scaled_cooldown)
+	shots_fired += 1
+	Globals.report_game_state("weapon", {"shots": shots_fired, "cooldown": scaled_cooldown})
 
 	# LOG
 	Globals.log_message(
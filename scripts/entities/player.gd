@@ -150,6 +150,7 @@ func _set_speed(target_speed: float) -> void:
 	# Emit signals if speed actually changed
 	if old_speed != current_speed:
 		speed_changed.emit(current_speed, _settings.max_speed)
+		Globals.report_game_state("speed", current_speed)
 
 		# Check for maximum speed limit
 		if current_speed >= _settings.max_speed:
@@ -71,3 +71,69 @@ func test_load_settings_with_other_sections() -> void:
 	config = ConfigFile.new()
 	config.load_encrypted_pass(test_path, globals.save_encryption_pass)
 	assert_float(config.get_value("audio", "master_volume", 1.0)).is_equal(0.4)
+
+
+func test_reset_settings_to_defaults_restores_and_persists() -> void:
+	## Tests the in-place reset used by window.resetGameState restores defaults.
+	##
+	## :rtype: void
+	globals.settings.difficulty = 1.8
+	globals.settings.max_speed = 500.0
+	globals.settings.current_fuel = 10.0
+
+	globals._reset_settings_to_defaults(test_path)
+
+	assert_float(globals.settings.difficulty).is_equal(1.0)
+	assert_float(globals.settings.max_speed).is_equal(713.0)
+	assert_float(globals.settings.current_fuel).is_equal(globals.settings.max_fuel)
+
+	var config: ConfigFile = ConfigFile.new()
+	config.load_encrypted_pass(test_path, globals.save_encryption_pass)
+	assert_float(config.get_value("Settings", "difficulty", 0.0)).is_equal(1.0)
+
+
+func test_get_engine_monitors_reports_counts() -> void:
+	## Tests the Performance monitor snapshot published to window.engineMonitors.
+	##
+	## :rtype: void
+	var monitors: Dictionary = globals.get_engine_monitors()
+	for key: String in [
+		"static_memory_bytes",
+		"static_memory_max_bytes",
+		"object_count",
+		"resource_count",
+		"node_count",
+		"orphan_node_count",
+		"draw_calls",
+	]:
+		assert_bool(monitors.has(key)).is_true()
+		assert_int(monitors[key]).is_greater_equal(0)
+	assert_int(monitors["object_count"]).is_greater(0)
+
+
+func test_set_time_scale_clamps_and_applies() -> void:
+	## Tests the Engine.time_scale hook behind window.setTimeScale.
+	##
+	## :rtype: void
+	assert_float(globals.set_time_scale(4.0)).is_equal(4.0)
+	assert_float(Engine.time_scale).is_equal(4.0)
+	assert_float(globals.set_time_scale(1000.0)).is_equal(globals.MAX_TIME_SCALE)
+	assert_float(globals.set_time_scale(-1.0)).is_equal(0.0)
+	globals.set_time_scale(1.0)
+	assert_float(Engine.time_scale).is_equal(1.0)
+
+
+func test_report_game_state_skips_unchanged_values() -> void:
+	## Tests that the batched state channel only marks real changes dirty.
+	##
+	## :rtype: void
+	globals._game_state_dirty = false
+	globals.report_game_state("speed", 250.0)
+	assert_bool(globals._game_state_dirty).is_true()
+	globals._flush_game_state()
+	assert_bool(globals._game_state_dirty).is_false()
+	globals.report_game_state("speed", 250.0)
+	assert_bool(globals._game_state_dirty).is_false()
+	globals.report_game_state("speed", 300.0)
+	assert_bool(globals._game_state_dirty).is_true()
+	assert_float(globals._game_state["speed"]).is_equal(300.0)
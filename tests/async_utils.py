@@ -0,0 +1,130 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/async_utils.py
+"""Async counterparts of the E2E helpers in tests/test_utils.py.
+
+Built on ``playwright.async_api`` so independent game flows can be driven
+concurrently on several pages of one browser. Each helper mirrors its sync
+namesake step for step; timeouts and log-level mapping are shared. Menu
+navigation goes through ``run_navigation_script`` with the step lists from
+``tests/test_utils.py`` rather than per-menu helpers.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable
+
+from playwright.async_api import Page, expect
+
+from tests.test_utils import (
+    DEFAULT_TIMEOUT,
+    TEST_TIMEOUT,
+    build_navigation_call,
+    check_navigation_result,
+    resolve_log_level,
+    start_game_navigation_steps,
+)
+
+GAME_URL = "http://localhost:8080/index.html"
+
+
+async def wait_for_console_log(
+    logs: list[dict[str, str]],
+    predicate: Callable[[str], bool],
+    start_idx: int,
+    timeout_ms: int = TEST_TIMEOUT,
+) -> None:
+    """Poll until a matching console log arrives or the timeout expires.
+
+    Unlike the sync helper no page round-trip is needed to pump events; yielding
+    to the event loop lets Playwright deliver console messages.
+    """
+    start_time = time.monotonic()
+    while (time.monotonic() - start_time) * 1000 < timeout_ms:
+        if any(predicate(log["text"].lower()) for log in logs[start_idx:]):
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError(
+        "Timed out waiting for expected console log matching "
+        f"predicate after {timeout_ms}ms"
+    )
+
+
+async def init_cdp_coverage(page: Page) -> tuple[Any, bool]:
+    """Initialize V8 coverage profiling via CDP."""
+    try:
+        cdp = await page.context.new_cdp_session(page)
+        await cdp.send("Profiler.enable")
+        await cdp.send(
+            "Profiler.startPreciseCoverage", {"callCount": True, "detailed": True}
+        )
+        return cdp, True
+    except Exception as e:
+        print(f"Warning: Could not start CDP coverage session: {e}")
+        return None, False
+
+
+async def init_page_and_wait_ready(
+    page: Page,
+    url: str = GAME_URL,
+    request: Any | None = None,
+) -> float:
+    """Navigates to the game page and waits for Godot engine initialization.
+    Returns the WASM initialization boot duration in seconds.
+    """
+    start_time = time.perf_counter()
+
+    try:
+        if await page.evaluate("window.godotInitialized === true"):
+            await expect(page.locator("canvas")).to_be_visible(timeout=DEFAULT_TIMEOUT)
+            boot_time = 0.0
+            if request is not None and getattr(request, "node", None) is not None:
+                request.node._wasm_boot_time = boot_time
+            return boot_time
+    except Exception:
+        pass
+
+    await page.goto(url, wait_until="domcontentloaded", timeout=DEFAULT_TIMEOUT)
+    await page.wait_for_function(
+        "() => window.godotInitialized === true", timeout=DEFAULT_TIMEOUT
+    )
+    await expect(page.locator("canvas")).to_be_visible(timeout=DEFAULT_TIMEOUT)
+
+    boot_time = round(time.perf_counter() - start_time, 4)
+
+    if request is not None and getattr(request, "node", None) is not None:
+        request.node._wasm_boot_time = boot_time
+
+    return boot_time
+
+
+async def run_navigation_script(
+    page: Page, steps: list[dict[str, Any]], request: Any | None = None
+) -> list[dict[str, Any]]:
+    """Run declarative menu steps page-side in a single ``evaluate`` round trip."""
+    expression, arg = build_navigation_call(steps)
+    return check_navigation_result(
+        await page.evaluate(expression, arg), request=request
+    )
+
+
+async def start_game_and_wait_ready(
+    page: Page,
+    logs: list[dict[str, str]],
+    difficulty: float | None = None,
+    log_level: str | int = "DEBUG",
+    request: Any | None = None,
+) -> tuple[Any, bool]:
+    """Async E2E setup helper that initializes V8 coverage, loads Godot,
+    configures settings, and starts gameplay.
+    """
+    cdp_session, coverage_started = await init_cdp_coverage(page)
+
+    await init_page_and_wait_ready(page, request=request)
+    await run_navigation_script(
+        page,
+        start_game_navigation_steps(resolve_log_level(log_level), difficulty),
+        request=request,
+    )
+
+    return cdp_session, coverage_started
@@ -8,6 +8,7 @@ import tempfile
 
 import pytest
 
+from tests import conftest as root_conftest
 from tests.test_utils import ARTIFACTS_DIR, PROJECT_ROOT
 
 
@@ -40,3 +41,16 @@ def repo_tmp():
     with tempfile.TemporaryDirectory(dir=ARTIFACTS_DIR) as tmpdir:
         rel_path = os.path.relpath(tmpdir, PROJECT_ROOT).replace("\\", "/")
         yield rel_path
+
+
+@pytest.fixture(autouse=True)
+def detach_live_session_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keeps fake reports fed to conftest hooks away from the live session.
+
+    They must neither reach its metrics stream nor be judged by its budget,
+    and must not read the live fixture timing or memory timeline plugins.
+    """
+    monkeypatch.setitem(root_conftest._SESSION_STATE, "metrics_stream", None)
+    monkeypatch.setitem(root_conftest._SESSION_STATE, "perf_budget", None)
+    monkeypatch.setitem(root_conftest._SESSION_STATE, "fixture_timing", None)
+    monkeypatch.setitem(root_conftest._SESSION_STATE, "memory_timeline", None)
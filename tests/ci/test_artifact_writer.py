@@ -0,0 +1,171 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_artifact_writer.py
+"""Unit tests for the background artifact writer and its conftest integration."""
+
+import gzip
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Generator
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests import conftest
+from tests.perf.artifact_writer import ArtifactWriter
+
+
+@pytest.fixture
+def writer() -> Generator[ArtifactWriter, None, None]:
+    """Provide a writer that is always shut down after the test."""
+    artifact_writer = ArtifactWriter(max_workers=2)
+    yield artifact_writer
+    artifact_writer.shutdown()
+
+
+@pytest.fixture
+def writer_state(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, writer: ArtifactWriter
+) -> ArtifactWriter:
+    """Route conftest artifact handling through an isolated writer."""
+    monkeypatch.setattr(conftest, "ARTIFACTS_DIR", tmp_path)
+    monkeypatch.setattr(conftest, "_FAILED_NODEIDS", set())
+    monkeypatch.setattr(conftest, "_DIAGNOSTICS_TEARDOWN_SEC", {})
+    monkeypatch.setitem(conftest._SESSION_STATE, "artifact_writer", writer)
+    return writer
+
+
+# ==============================================================================
+# ArtifactWriter
+# ==============================================================================
+
+
+def test_write_bytes_creates_file_and_counts_bytes(
+    writer: ArtifactWriter, tmp_path: Path
+) -> None:
+    """Queued payloads land on disk once flushed."""
+    dest = tmp_path / "nested" / "shot.png"
+
+    writer.write_bytes(b"png-data", dest)
+
+    assert writer.flush() == []
+    assert dest.read_bytes() == b"png-data"
+    assert writer.stats["jobs"] == 1
+    assert writer.stats["bytes_written"] == len(b"png-data")
+
+
+def test_move_relocates_finalized_file(writer: ArtifactWriter, tmp_path: Path) -> None:
+    """A plain move leaves only the destination behind."""
+    src = tmp_path / "tmp_video.webm"
+    src.write_bytes(b"video")
+    dest = tmp_path / "video_test.webm"
+
+    writer.move(src, dest)
+
+    assert writer.flush() == []
+    assert not src.exists()
+    assert dest.read_bytes() == b"video"
+
+
+def test_move_with_compress_gzips_and_removes_source(
+    writer: ArtifactWriter, tmp_path: Path
+) -> None:
+    """Compressed moves write ``<dest>.gz`` and drop the uncompressed source."""
+    har = tmp_path / "network.har"
+    har.write_text('{"log": {}}' * 100, encoding="utf-8")
+
+    writer.move(har, har, compress=True)
+
+    assert writer.flush() == []
+    assert not har.exists()
+    gz_path = tmp_path / "network.har.gz"
+    assert gzip.decompress(gz_path.read_bytes()) == b'{"log": {}}' * 100
+
+
+def test_delete_ignores_missing_files(writer: ArtifactWriter, tmp_path: Path) -> None:
+    """Deleting an already-removed recording is not an error."""
+    existing = tmp_path / "discard.webm"
+    existing.write_bytes(b"x")
+
+    writer.delete(existing)
+    writer.delete(tmp_path / "missing.webm")
+
+    assert writer.flush() == []
+    assert not existing.exists()
+
+
+def test_flush_reports_failed_jobs(writer: ArtifactWriter, tmp_path: Path) -> None:
+    """Job failures are collected and surfaced on flush, not raised on submit."""
+    writer.move(tmp_path / "missing.webm", tmp_path / "dest.webm")
+
+    errors = writer.flush()
+
+    assert len(errors) == 1
+    assert "move missing.webm" in errors[0]
+    assert writer.stats["failed_jobs"] == 1
+    assert writer.flush() == []
+
+
+# ==============================================================================
+# conftest integration
+# ==============================================================================
+
+
+def test_capture_failure_screenshot_hands_bytes_to_writer(
+    writer_state: ArtifactWriter, tmp_path: Path
+) -> None:
+    """With a writer the screenshot is taken in memory and written off-thread."""
+    page_obj = MagicMock()
+    page_obj.screenshot.return_value = b"png"
+
+    conftest._capture_failure_screenshot(page_obj, "test_x")
+    writer_state.flush()
+
+    page_obj.screenshot.assert_called_once_with(full_page=True)
+    assert (tmp_path / "failure_test_x.png").read_bytes() == b"png"
+
+
+def test_finalize_video_moves_recording_on_failure(
+    writer_state: ArtifactWriter, tmp_path: Path
+) -> None:
+    """Failed tests keep the recording, moved rather than copied."""
+    recorded = tmp_path / "raw.webm"
+    recorded.write_bytes(b"video")
+    video_handle = MagicMock()
+    video_handle.path.return_value = str(recorded)
+
+    conftest._finalize_video(video_handle, "test_x", test_failed=True)
+    writer_state.flush()
+
+    video_handle.save_as.assert_not_called()
+    assert not recorded.exists()
+    assert (tmp_path / "video_test_x.webm").read_bytes() == b"video"
+
+
+def test_finalize_video_deletes_recording_on_success(
+    writer_state: ArtifactWriter, tmp_path: Path
+) -> None:
+    """Passing tests discard the recording in the background."""
+    recorded = tmp_path / "raw.webm"
+    recorded.write_bytes(b"video")
+    video_handle = MagicMock()
+    video_handle.path.return_value = str(recorded)
+
+    conftest._finalize_video(video_handle, "test_x", test_failed=False)
+    writer_state.flush()
+
+    video_handle.delete.assert_not_called()
+    assert not recorded.exists()
+
+
+def test_cleanup_records_diagnostics_teardown_latency(
+    writer_state: ArtifactWriter,
+) -> None:
+    """Diagnostics teardown time is accumulated per node ID."""
+    page_obj = MagicMock()
+    page_obj.video = None
+    request = SimpleNamespace(node=SimpleNamespace(nodeid="tests/test_a.py::test_x"))
+
+    conftest._cleanup_context_diagnostics(MagicMock(), page_obj, request)
+
+    assert conftest._DIAGNOSTICS_TEARDOWN_SEC["tests/test_a.py::test_x"] >= 0.0
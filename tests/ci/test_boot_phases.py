@@ -0,0 +1,126 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_boot_phases.py
+"""Unit tests for the WASM boot phase breakdown and its terminal summary."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests import conftest
+from tests.ci.test_frame_timing import FakeTerminalReporter
+from tests.perf import boot_phases
+
+SHELL_PATH = Path(__file__).resolve().parents[2] / "custom_shell.html"
+
+
+def _payload() -> dict[str, Any]:
+    return {
+        "marks": {
+            "skylock:shell-start": 40.0,
+            "skylock:wasm-ready": 900.0,
+            "skylock:pck-loaded": 700.0,
+            "skylock:engine-start": 905.0,
+            "skylock:godot-ready": 1400.0,
+            "skylock:first-frame": 1450.5,
+        },
+        "resources": [
+            {
+                "name": "http://localhost:8080/index.pck?v=1",
+                "startTime": 50.0,
+                "responseEnd": 650.0,
+                "encodedBodySize": 2048,
+            },
+            {
+                "name": "http://localhost:8080/index.wasm",
+                "startTime": 45.0,
+                "responseEnd": 600.0,
+                "encodedBodySize": 4096,
+            },
+        ],
+        "transfer_bytes": 7168,
+    }
+
+
+def test_compute_boot_phases_full_breakdown() -> None:
+    """Every phase is derived from its marks and Resource Timing entries."""
+    phases = boot_phases.compute_boot_phases(_payload())
+    assert phases == {
+        "download_ms": 555.0,
+        "compile_instantiate_ms": 300.0,
+        "pck_load_ms": 650.0,
+        "godot_ready_ms": 495.0,
+        "first_frame_ms": 50.5,
+        "total_ms": 1450.5,
+        "wasm_bytes": 4096,
+        "pck_bytes": 2048,
+        "transfer_bytes": 7168,
+    }
+
+
+def test_compute_boot_phases_missing_inputs_are_none() -> None:
+    """Without resource entries or the first-frame mark, phases degrade to None."""
+    payload = _payload()
+    payload["resources"] = []
+    del payload["marks"]["skylock:first-frame"]
+    phases = boot_phases.compute_boot_phases(payload)
+    assert phases["download_ms"] is None
+    assert phases["compile_instantiate_ms"] is None
+    assert phases["first_frame_ms"] is None
+    # PCK load falls back to the shell start mark
+    assert phases["pck_load_ms"] == 660.0
+    assert phases["total_ms"] == 1400.0
+
+
+def test_collect_boot_phases_returns_none_when_not_reported() -> None:
+    """A page that has not booted (or was already reported) yields None."""
+
+    class FakePage:
+        def evaluate(self, script: str) -> None:
+            assert "__bootPhasesReported" in script
+            return None
+
+    assert boot_phases.collect_boot_phases(FakePage()) is None
+
+
+def test_shell_and_globals_emit_expected_marks() -> None:
+    """The marks the breakdown relies on are emitted by the shell and Globals."""
+    shell = SHELL_PATH.read_text(encoding="utf-8")
+    for mark in (
+        "skylock:shell-start",
+        "skylock:wasm-ready",
+        "skylock:pck-loaded",
+        "skylock:engine-start",
+    ):
+        assert mark in shell
+    globals_gd = (SHELL_PATH.parent / "scripts" / "core" / "globals.gd").read_text(
+        encoding="utf-8"
+    )
+    assert "skylock:godot-ready" in globals_gd
+    assert "skylock:first-frame" in globals_gd
+
+
+def test_terminal_summary_lists_boot_phases(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Entries with a breakdown get a row in the "WASM Boot Phases" section."""
+    monkeypatch.setattr(
+        conftest,
+        "_TEST_PROFILING_DATA",
+        [
+            {
+                "nodeid": "tests/a_test.py::test_boot",
+                "duration_sec": 2.0,
+                "outcome": "passed",
+                "wasm_boot_duration_sec": 1.5,
+                "teardown_sec": 0.1,
+                "boot_phases": boot_phases.compute_boot_phases(_payload()),
+            }
+        ],
+    )
+    monkeypatch.setattr(conftest, "_LIFECYCLE_METRICS", [])
+    reporter = FakeTerminalReporter()
+    conftest.pytest_terminal_summary(reporter, 0, None)
+    assert "== WASM Boot Phases ==" in reporter.lines
+    row = next(line for line in reporter.lines if "test_boot" in line and "pck" in line)
+    assert "download 555 ms" in row
+    assert "first_frame 50 ms" in row
@@ -125,3 +125,44 @@ def test_other_always_run_upload_steps_are_unaffected(
     ):
         step = _find_step(test_shard_steps, name)
         assert step["if"] == "always()"
+
+
+def test_preserve_baseline_step_recovers_from_metrics_stream(
+    test_shard_steps: list[dict[str, Any]],
+) -> None:
+    """A killed shard's streamed metrics are rebuilt and uploaded with the baseline."""
+    step = _find_step(test_shard_steps, "Preserve Baseline Profiling Metrics (#776)")
+    script = step["run"]
+
+    assert "python -m tests.perf.metrics_stream recover" in script
+    assert script.index("metrics_stream recover") < script.index('cp "$src" "$dst"')
+
+    upload = _find_step(test_shard_steps, "Upload Profiling Baseline Artifact (#776)")
+    assert "artifacts/metrics_stream.jsonl" in upload["with"]["path"]
+
+
+def test_merge_metrics_job_combines_shard_baselines(workflow: dict[str, Any]) -> None:
+    """Shard baselines are merged into one report even when a shard failed."""
+    job = workflow["jobs"]["merge-metrics"]
+
+    assert job["needs"] == "test-shard"
+    assert job["if"] == "always()"
+
+    download = _find_step(job["steps"], "Download Profiling Baseline Artifacts")
+    assert download["with"]["pattern"] == "metrics-baseline-*"
+
+    script = _find_step(job["steps"], "Merge Shard Baselines")["run"]
+    assert "python -m tests.perf.shard_merge" in script
+    assert "metrics_baseline_*.json" in script
+    assert "$GITHUB_STEP_SUMMARY" in script
+
+
+def test_merge_metrics_job_uploads_offline_dashboard(workflow: dict[str, Any]) -> None:
+    """The self-contained HTML dashboard is rendered and uploaded with the report."""
+    steps = workflow["jobs"]["merge-metrics"]["steps"]
+
+    script = _find_step(steps, "Render Performance Dashboard")["run"]
+    assert "python -m tests.perf.dashboard --baseline" in script
+
+    upload = _find_step(steps, "Upload Shard Metrics Report")
+    assert "artifacts/perf_dashboard.html" in upload["with"]["path"]
@@ -0,0 +1,119 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_cdp_profiler.py
+"""Unit tests for CDP metric deltas and the speedscope profile exporter."""
+
+from types import SimpleNamespace
+from typing import Any
+
+from tests.perf import cdp_profiler
+
+PROFILE = {
+    "nodes": [
+        {"id": 1, "callFrame": {"functionName": "(root)"}, "children": [2, 4]},
+        {
+            "id": 2,
+            "callFrame": {
+                "functionName": "main_loop",
+                "url": "http://localhost:8080/index.js",
+                "lineNumber": 9,
+                "columnNumber": 4,
+            },
+            "children": [3],
+        },
+        {
+            "id": 3,
+            "callFrame": {
+                "functionName": "",
+                "url": "http://localhost:8080/index.js",
+                "lineNumber": 20,
+                "columnNumber": 0,
+            },
+        },
+        {"id": 4, "callFrame": {"functionName": "(idle)", "lineNumber": -1}},
+    ],
+    "samples": [3, 3, 4],
+    "timeDeltas": [5, 100, 250],
+}
+
+
+class FakeCdpSession:
+    """Fake CDP session returning canned Performance/Profiler responses."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self.detached = False
+        self._metric_calls = 0
+
+    def send(self, method: str, params: Any = None) -> Any:
+        """Record the method and answer metric/profile queries."""
+        self.sent.append(method)
+        if method == "Performance.getMetrics":
+            self._metric_calls += 1
+            value = 0.5 if self._metric_calls == 1 else 1.75
+            return {
+                "metrics": [
+                    {"name": "ScriptDuration", "value": value},
+                    {"name": "JSHeapUsedSize", "value": 1024.0},
+                ]
+            }
+        if method == "Profiler.stop":
+            return {"profile": PROFILE}
+        return {}
+
+    def detach(self) -> None:
+        """Mark the session detached."""
+        self.detached = True
+
+
+def test_metrics_delta_only_reports_cumulative_counters() -> None:
+    """Gauges like heap size are not turned into deltas."""
+    before = {"ScriptDuration": 1.0, "TaskDuration": 2.0, "JSHeapUsedSize": 10.0}
+    after = {"ScriptDuration": 1.5, "TaskDuration": 3.25, "JSHeapUsedSize": 99.0}
+
+    assert cdp_profiler.metrics_delta(before, after) == {
+        "ScriptDuration": 0.5,
+        "TaskDuration": 1.25,
+    }
+
+
+def test_to_speedscope_builds_sampled_profile() -> None:
+    """Stacks run root-to-leaf, frames are deduplicated, and (root) is dropped."""
+    payload = cdp_profiler.to_speedscope(PROFILE, "tests/test_a.py::test_x")
+
+    frames = payload["shared"]["frames"]
+    assert [frame["name"] for frame in frames] == [
+        "main_loop",
+        "(anonymous)",
+        "(idle)",
+    ]
+    assert frames[0] == {
+        "name": "main_loop",
+        "file": "http://localhost:8080/index.js",
+        "line": 10,
+        "col": 5,
+    }
+    profile = payload["profiles"][0]
+    assert profile["type"] == "sampled"
+    assert profile["unit"] == "microseconds"
+    assert profile["samples"] == [[0, 1], [0, 1], [2]]
+    assert profile["weights"] == [100, 250, 0]
+    assert profile["endValue"] == 350
+    assert payload["$schema"] == cdp_profiler.SPEEDSCOPE_SCHEMA
+
+
+def test_capture_start_stop_returns_deltas_and_detaches() -> None:
+    """The capture drives Performance/Profiler domains on its own session."""
+    session = FakeCdpSession()
+    page_obj = SimpleNamespace(
+        context=SimpleNamespace(new_cdp_session=lambda page: session)
+    )
+    capture = cdp_profiler.CdpPerfCapture(page_obj, sampling_interval_us=500)
+
+    capture.start()
+    deltas, profile = capture.stop()
+
+    assert deltas == {"ScriptDuration": 1.25}
+    assert profile is PROFILE
+    assert session.detached is True
+    assert "Profiler.setSamplingInterval" in session.sent
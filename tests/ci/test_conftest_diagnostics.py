@@ -128,6 +128,8 @@ def isolate_conftest_state(
     test_artifacts.mkdir(parents=True, exist_ok=True)
     monkeypatch.setattr(conftest, "ARTIFACTS_DIR", test_artifacts)
     monkeypatch.setattr(conftest, "_FAILED_NODEIDS", set())
+    monkeypatch.setattr(conftest, "_DIAGNOSTICS_TEARDOWN_SEC", {})
+    monkeypatch.setitem(conftest._SESSION_STATE, "artifact_writer", None)
     yield test_artifacts
     conftest._FAILED_NODEIDS.clear()  # noqa: SLF001
 
@@ -305,3 +307,100 @@ def test_cleanup_context_diagnostics_close_failure_handled_gracefully(
 
     assert context.closed, "Context close attempt should be recorded"
     assert list(artifacts_dir.glob("video_*.webm")), "Video should still be finalized"
+
+
+# ==============================================================================
+# Per-Test Trace Chunk Tests (shared_page)
+# ==============================================================================
+
+
+class ChunkTracing:
+    """Fake tracing handle that records chunk boundaries and exported paths."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, Any]] = []
+
+    def start_chunk(self, **kwargs: Any) -> None:
+        """Record a chunk start with its title."""
+        self.events.append(("start_chunk", kwargs.get("title")))
+
+    def stop_chunk(self, *, path: str | Path | None = None) -> None:
+        """Record a chunk stop and write the chunk archive when a path is given."""
+        self.events.append(("stop_chunk", path))
+        if path is not None:
+            Path(path).write_text("chunk", encoding="utf-8")
+
+
+def _make_chunk_request(nodeid: str, shared_page: Any) -> Any:
+    """Build a fake function-level request that depends on shared_page."""
+    request = _make_request(nodeid=nodeid)
+    request.fixturenames = ["shared_page"]
+    request.getfixturevalue = lambda name: shared_page
+    return request
+
+
+def _drive_fixture(fixture_def: Any, request: Any, call_failed: bool) -> None:
+    """Run an autouse generator fixture through setup, a test call, and teardown."""
+    gen = fixture_def.__wrapped__(request)
+    next(gen)
+    request.node.rep_call = SimpleNamespace(failed=call_failed, when="call")
+    with pytest.raises(StopIteration):
+        next(gen)
+
+
+def test_trace_chunk_exported_only_for_failing_test(
+    isolate_conftest_state: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Each test gets its own chunk; only the failing one lands in artifacts/."""
+    artifacts_dir = isolate_conftest_state
+    tracing = ChunkTracing()
+    shared_page = SimpleNamespace(context=SimpleNamespace(tracing=tracing))
+    monkeypatch.setattr(
+        conftest, "_SHARED_PAGE_DIAGNOSTICS", {"tests/test_mod.py": True}
+    )
+
+    passing = _make_chunk_request("tests/test_mod.py::test_pass", shared_page)
+    failing = _make_chunk_request("tests/test_mod.py::test_fail", shared_page)
+    _drive_fixture(conftest.shared_page_trace_chunk, passing, call_failed=False)
+    _drive_fixture(conftest.shared_page_trace_chunk, failing, call_failed=True)
+
+    assert [event[0] for event in tracing.events] == [
+        "start_chunk",
+        "stop_chunk",
+        "start_chunk",
+        "stop_chunk",
+    ]
+    assert tracing.events[1] == ("stop_chunk", None)
+    traces = [trace.name for trace in artifacts_dir.glob("trace_*.zip")]
+    assert traces == ["trace_tests_test_mod.py_test_fail.zip"]
+
+
+def test_trace_chunk_skipped_for_lean_shared_page(
+    isolate_conftest_state: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Shared pages created without diagnostics must not touch tracing."""
+    _ = isolate_conftest_state
+    tracing = ChunkTracing()
+    shared_page = SimpleNamespace(context=SimpleNamespace(tracing=tracing))
+    monkeypatch.setattr(
+        conftest, "_SHARED_PAGE_DIAGNOSTICS", {"tests/test_mod.py": False}
+    )
+
+    request = _make_chunk_request("tests/test_mod.py::test_fail", shared_page)
+    _drive_fixture(conftest.shared_page_trace_chunk, request, call_failed=True)
+
+    assert not tracing.events
+
+
+def test_stop_trace_chunk_failure_handled_gracefully(
+    isolate_conftest_state: Path,
+) -> None:
+    """A failing stop_chunk call should issue a UserWarning instead of raising."""
+    _ = isolate_conftest_state
+    context: Any = DummyContext()
+    context.tracing = SimpleNamespace(
+        stop_chunk=lambda **_: (_ for _ in ()).throw(RuntimeError("boom"))
+    )
+
+    with pytest.warns(UserWarning, match="Failed to stop trace chunk"):
+        conftest._stop_trace_chunk(context, "safe_node_id", test_failed=True)
@@ -0,0 +1,109 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_dashboard.py
+"""Unit tests for the offline HTML performance dashboard."""
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests.perf import dashboard, metrics_history
+
+NODEID = "tests/weapon_firing_test.py::test_weapon_firing"
+
+
+def _payload(timestamp: str, duration: float, p95: float) -> dict[str, Any]:
+    return {
+        "timestamp": timestamp,
+        "total_duration_sec": duration + 5.0,
+        "summary": {"passed": 1, "failed": 0, "skipped": 0},
+        "tests": [
+            {
+                "nodeid": NODEID,
+                "duration_sec": duration,
+                "outcome": "passed",
+                "wasm_boot_duration_sec": 2.0,
+                "frame_timing": {"p95_ms": p95},
+                "engine_monitors": {"end": {"static_memory_bytes": 2097152}},
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def conn(tmp_path: Path):
+    connection = metrics_history.connect(tmp_path / "history.sqlite")
+    for number, (duration, p95) in enumerate(
+        [(10.0, 17.0), (12.0, 18.0), (11.0, 33.0)]
+    ):
+        metrics_history.ingest_payload(
+            connection,
+            _payload(f"2026-10-1{number}T00:00:00Z", duration, p95),
+            f"commit{number}",
+            shard="core",
+        )
+    yield connection
+    connection.close()
+
+
+def test_collect_dashboard_data_orders_runs_oldest_first(conn: Any) -> None:
+    """Series are indexed by run position, oldest first, with scaled units."""
+    data = dashboard.collect_dashboard_data(conn)
+
+    assert [run["commit_sha"] for run in data["runs"]] == [
+        "commit0",
+        "commit1",
+        "commit2",
+    ]
+    assert data["wall"] == {"core": [(0, 15.0), (1, 17.0), (2, 16.0)]}
+    frames = data["metrics"]["frame_timing.p95_ms"]
+    assert frames["median"] == [(0, 17.0), (1, 18.0), (2, 33.0)]
+    assert frames["tests"] == {NODEID: [17.0, 18.0, 33.0]}
+    static = data["metrics"]["engine_monitors.end.static_memory_bytes"]
+    assert static["tests"][NODEID] == [2.0, 2.0, 2.0]
+    assert data["metrics"]["boot_phases.total_ms"]["median"] == []
+
+
+def test_collect_dashboard_data_limits_runs(conn: Any) -> None:
+    """Only the most recent runs are charted."""
+    data = dashboard.collect_dashboard_data(conn, runs=2)
+
+    assert [run["commit_sha"] for run in data["runs"]] == ["commit1", "commit2"]
+    assert data["metrics"]["duration_sec"]["median"] == [(0, 12.0), (1, 11.0)]
+
+
+def test_rendered_dashboard_is_self_contained(conn: Any) -> None:
+    """The HTML embeds its charts and never references external resources."""
+    page = dashboard.render_dashboard(dashboard.collect_dashboard_data(conn))
+
+    assert page.startswith("<!DOCTYPE html>")
+    # Wall time, four charted metrics and their four test sparklines
+    assert page.count("<svg") == 9
+    assert not re.search(r"https?://|<script|<link|src=", page)
+    assert NODEID in page
+    assert "No data recorded." in page
+
+
+def test_svg_line_chart_escapes_labels() -> None:
+    """Series names and labels are HTML-escaped."""
+    svg = dashboard.svg_line_chart(
+        {"<shard>": [(0, 1.0), (1, 2.0)]}, ["a", "b&c"], "ms"
+    )
+
+    assert "&lt;shard&gt;" in svg
+    assert "b&amp;c" in svg
+    assert svg.count("<circle") == 2
+
+
+def test_cli_renders_baseline_files(tmp_path: Path) -> None:
+    """Baseline files are charted without a history database."""
+    baseline = tmp_path / "metrics_baseline_core.json"
+    baseline.write_text(json.dumps(_payload("2026-10-19T00:00:00Z", 9.0, 16.0)))
+    output = tmp_path / "dashboard.html"
+
+    assert dashboard.main(["--baseline", str(baseline), "--output", str(output)]) == 0
+    assert NODEID in output.read_text("utf-8")
+    assert dashboard.main(["--db", str(tmp_path / "missing.sqlite")]) == 1
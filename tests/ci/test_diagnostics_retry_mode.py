@@ -0,0 +1,255 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_diagnostics_retry_mode.py
+"""Unit tests for the "on-retry" diagnostics capture mode helpers in conftest.py."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests import conftest
+from tests.perf import fixture_timing
+
+
+class DummyConfig:
+    """Minimal stand-in for pytest.Config exposing getoption()."""
+
+    def __init__(self, **options: Any) -> None:
+        self.options = options
+
+    def getoption(self, name: str, default: Any = None) -> Any:
+        """Return a registered option value or the default."""
+        return self.options.get(name, default)
+
+
+def _make_report(
+    failed: bool = False, skipped: bool = False, duration: float = 0.0
+) -> SimpleNamespace:
+    """Build a minimal stand-in for pytest.TestReport."""
+    return SimpleNamespace(failed=failed, skipped=skipped, duration=duration)
+
+
+@pytest.fixture(autouse=True)
+def isolate_conftest_state(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Isolate ARTIFACTS_DIR and mutable profiling/session state."""
+    monkeypatch.setattr(conftest, "ARTIFACTS_DIR", tmp_path)
+    monkeypatch.setattr(conftest, "_FAILED_NODEIDS", set())
+    monkeypatch.setattr(conftest, "_TEST_PROFILING_DATA", [])
+    monkeypatch.setitem(conftest._SESSION_STATE, "diagnostic_rerun", None)
+    monkeypatch.setitem(conftest._SESSION_STATE, "artifact_writer", None)
+    return tmp_path
+
+
+# ==============================================================================
+# Mode resolution & context options
+# ==============================================================================
+
+
+def test_diagnostics_mode_defaults_to_always_without_config() -> None:
+    """A missing config or unknown value must fall back to always-on diagnostics."""
+    assert conftest._diagnostics_mode(None) == "always"
+    assert conftest._diagnostics_mode(DummyConfig(**{"--diagnostics": "bogus"})) == (
+        "always"
+    )
+
+
+def test_diagnostics_mode_reads_on_retry_option() -> None:
+    """The --diagnostics option selects the on-retry mode."""
+    config = DummyConfig(**{"--diagnostics": "on-retry"})
+
+    assert conftest._diagnostics_mode(config) == "on-retry"
+
+
+def test_diagnostics_enabled_only_during_rerun_in_on_retry_mode() -> None:
+    """Lean contexts are used on first attempts; reruns re-enable diagnostics."""
+    request = SimpleNamespace(config=DummyConfig(**{"--diagnostics": "on-retry"}))
+
+    assert conftest._diagnostics_enabled(request) is False
+
+    conftest._SESSION_STATE["diagnostic_rerun"] = "tests/test_a.py::test_one"
+    assert conftest._diagnostics_enabled(request) is True
+
+
+def test_context_recording_options_disable_video_when_lean() -> None:
+    """Lean contexts must not pass any video recording options."""
+    assert conftest._context_recording_options(False) == {}
+
+    options = conftest._context_recording_options(True)
+    assert options["record_video_dir"] == str(conftest.ARTIFACTS_DIR)
+    assert options["record_video_size"] == {"width": 1280, "height": 720}
+
+
+def test_cleanup_skips_tracing_stop_for_lean_context() -> None:
+    """Contexts without tracing must not call tracing.stop() on teardown."""
+    context = MagicMock()
+    page_obj = MagicMock()
+    page_obj.video = None
+    request = SimpleNamespace(node=SimpleNamespace(nodeid="tests/test_a.py::test_x"))
+
+    conftest._cleanup_context_diagnostics(
+        context, page_obj, request, tracing_active=False
+    )
+
+    context.tracing.stop.assert_not_called()
+    context.close.assert_called_once_with()
+
+
+# ==============================================================================
+# Rerun bookkeeping
+# ==============================================================================
+
+
+def test_record_diagnostic_rerun_attaches_outcome_without_changing_entry() -> None:
+    """The rerun is attached to the original entry; the outcome stays failed."""
+    conftest._TEST_PROFILING_DATA.append(
+        {
+            "nodeid": "tests/test_a.py::test_one",
+            "duration_sec": 1.0,
+            "outcome": "failed",
+        }
+    )
+    reports = [_make_report(duration=0.5), _make_report(duration=1.25)]
+
+    conftest._record_diagnostic_rerun("tests/test_a.py::test_one", reports)
+
+    entry = conftest._TEST_PROFILING_DATA[0]
+    assert entry["outcome"] == "failed"
+    assert entry["diagnostic_rerun"] == {"outcome": "passed", "duration_sec": 1.75}
+
+
+def test_record_diagnostic_rerun_discards_rerun_node_state(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Metrics parked by the rerun's fixtures do not outlive the rerun."""
+    nodeid = "tests/test_a.py::test_one"
+    monkeypatch.setattr(
+        conftest, "_PENDING_TEST_METRICS", {nodeid: {"frame_timing": {}}, "x": {}}
+    )
+    timing_plugin = fixture_timing.FixtureTimingPlugin()
+    timing_plugin.test_timings[nodeid] = {"page": {"setup_sec": 1.0}}
+    monkeypatch.setitem(conftest._SESSION_STATE, "fixture_timing", timing_plugin)
+    monkeypatch.setattr(
+        conftest,
+        "_DIAGNOSTICS_TEARDOWN_SEC",
+        {nodeid: 0.4, "tests/test_a.py": 0.2},
+    )
+    conftest._TEST_PROFILING_DATA.append(
+        {"nodeid": nodeid, "duration_sec": 1.0, "outcome": "failed"}
+    )
+
+    conftest._record_diagnostic_rerun(nodeid, [_make_report(duration=1.0)])
+
+    assert conftest._PENDING_TEST_METRICS == {"x": {}}
+    assert timing_plugin.test_timings == {}
+    assert conftest._DIAGNOSTICS_TEARDOWN_SEC == {}
+
+
+def test_rerun_fixture_timings_are_not_counted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Fixtures set up again by the rerun stay out of the slowest-fixtures table."""
+    monkeypatch.setitem(conftest._SESSION_STATE, "diagnostic_rerun", None)
+    timing_plugin = fixture_timing.FixtureTimingPlugin(
+        paused=lambda: bool(conftest._SESSION_STATE["diagnostic_rerun"])
+    )
+    timing_plugin.current_nodeid = "t::a"
+    fixturedef = SimpleNamespace(argname="page", scope="function")
+
+    conftest._SESSION_STATE["diagnostic_rerun"] = "t::a"
+    timing_plugin.record(fixturedef, "setup", 2.0)
+    assert timing_plugin.timings == {}
+
+    conftest._SESSION_STATE["diagnostic_rerun"] = None
+    timing_plugin.record(fixturedef, "setup", 0.5)
+    assert timing_plugin.timings[("page", "function")]["setup_sec"] == 0.5
+
+
+def test_record_diagnostic_rerun_reports_failed_rerun() -> None:
+    """A rerun that fails again is recorded as failed."""
+    conftest._TEST_PROFILING_DATA.append(
+        {
+            "nodeid": "tests/test_a.py::test_one",
+            "duration_sec": 1.0,
+            "outcome": "failed",
+        }
+    )
+
+    conftest._record_diagnostic_rerun(
+        "tests/test_a.py::test_one", [_make_report(failed=True, duration=0.1)]
+    )
+
+    assert conftest._TEST_PROFILING_DATA[0]["diagnostic_rerun"]["outcome"] == "failed"
+
+
+def test_makereport_ignores_rerun_reports() -> None:
+    """Rerun reports must not create duplicate profiling entries."""
+    item = SimpleNamespace(nodeid="tests/test_a.py::test_one")
+    conftest._SESSION_STATE["diagnostic_rerun"] = item.nodeid
+    report = SimpleNamespace(when="teardown", failed=False, skipped=False, duration=0.1)
+
+    gen = conftest.pytest_runtest_makereport(item, SimpleNamespace(when="teardown"))
+    next(gen)
+    with pytest.raises(StopIteration):
+        gen.send(SimpleNamespace(get_result=lambda: report))
+
+    assert conftest._TEST_PROFILING_DATA == []
+    assert item.rep_teardown is report
+
+
+# ==============================================================================
+# Suite-time saving
+# ==============================================================================
+
+
+def test_load_reference_baseline_rejects_on_retry_payloads(tmp_path: Path) -> None:
+    """Only always-on baselines are valid references for the saving estimate."""
+    always_file = tmp_path / "always.json"
+    always_file.write_text(json.dumps({"tests": []}), encoding="utf-8")
+    lean_file = tmp_path / "lean.json"
+    lean_file.write_text(
+        json.dumps({"tests": [], "diagnostics": {"mode": "on-retry"}}),
+        encoding="utf-8",
+    )
+
+    assert conftest._load_reference_baseline(always_file) == {"tests": []}
+    assert conftest._load_reference_baseline(lean_file) is None
+    assert conftest._load_reference_baseline(tmp_path / "missing.json") is None
+
+
+def test_summarize_diagnostics_saving_compares_common_tests() -> None:
+    """Saving is computed over common tests and includes the rerun cost."""
+    tests = [
+        {"nodeid": "a", "duration_sec": 2.0},
+        {"nodeid": "b", "duration_sec": 3.0, "diagnostic_rerun": {"duration_sec": 1.0}},
+        {"nodeid": "new", "duration_sec": 9.0},
+    ]
+    reference = {
+        "tests": [
+            {"nodeid": "a", "duration_sec": 4.0},
+            {"nodeid": "b", "duration_sec": 5.0},
+        ]
+    }
+
+    summary = conftest._summarize_diagnostics_saving(tests, reference)
+
+    assert summary["reruns"] == 1
+    assert summary["rerun_duration_sec"] == 1.0
+    assert summary["compared_tests"] == 2
+    assert summary["lean_duration_sec"] == 5.0
+    assert summary["reference_duration_sec"] == 9.0
+    assert summary["saving_sec"] == 3.0
+
+
+def test_summarize_diagnostics_saving_without_reference() -> None:
+    """Without a reference only rerun statistics are reported."""
+    summary = conftest._summarize_diagnostics_saving(
+        [{"nodeid": "a", "duration_sec": 1.0}], None
+    )
+
+    assert summary["mode"] == "on-retry"
+    assert summary["saving_sec"] is None
+    assert summary["compared_tests"] == 0
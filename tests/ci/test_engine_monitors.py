@@ -0,0 +1,95 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_engine_monitors.py
+"""Unit tests for Godot Performance monitor snapshots at test boundaries."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests import conftest
+from tests.ci.test_frame_timing import FakeTerminalReporter
+from tests.perf import engine_monitors
+
+GLOBALS_PATH = Path(__file__).resolve().parents[2] / "scripts" / "core" / "globals.gd"
+
+
+class FakePage:
+    """Returns a canned ``window.engineMonitors`` snapshot."""
+
+    def __init__(self, snapshot: Any) -> None:
+        self.snapshot = snapshot
+
+    def evaluate(self, script: str) -> Any:
+        assert "requestEngineMonitors" in script
+        return self.snapshot
+
+
+def _snapshot(**overrides: int) -> dict[str, int]:
+    values = dict.fromkeys(engine_monitors.ENGINE_MONITOR_KEYS, 10)
+    values.update(overrides)
+    return values
+
+
+def test_snapshot_keeps_known_keys_as_ints() -> None:
+    """Unknown keys are dropped and values coerced to int."""
+    raw = dict(_snapshot(), object_count=1234.0, extra=1)
+    snapshot = engine_monitors.snapshot_engine_monitors(FakePage(raw))
+    assert set(snapshot) == set(engine_monitors.ENGINE_MONITOR_KEYS)
+    assert snapshot["object_count"] == 1234
+
+
+def test_snapshot_none_when_not_exposed() -> None:
+    """Pages without the Globals callback yield None."""
+    assert engine_monitors.snapshot_engine_monitors(FakePage(None)) is None
+
+
+def test_monitors_delta() -> None:
+    """Deltas cover cumulative counters only and need both snapshots."""
+    start = _snapshot(node_count=100, orphan_node_count=0)
+    end = _snapshot(node_count=120, orphan_node_count=3, draw_calls=99)
+    delta = engine_monitors.monitors_delta(start, end)
+    assert delta["node_count"] == 20
+    assert delta["orphan_node_count"] == 3
+    assert "draw_calls" not in delta
+    assert engine_monitors.monitors_delta(None, end) is None
+
+
+def test_globals_binds_request_engine_monitors() -> None:
+    """Globals exposes the callback the harness relies on."""
+    source = GLOBALS_PATH.read_text(encoding="utf-8")
+    assert "js_window.requestEngineMonitors" in source
+    assert "window.engineMonitors = " in source
+
+
+def test_terminal_summary_lists_engine_monitors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """End-of-test counts are listed with orphan growth highlighted."""
+    start = _snapshot(orphan_node_count=0)
+    end = _snapshot(orphan_node_count=2)
+    monkeypatch.setattr(
+        conftest,
+        "_TEST_PROFILING_DATA",
+        [
+            {
+                "nodeid": "tests/a_test.py::test_menu",
+                "duration_sec": 1.0,
+                "outcome": "passed",
+                "wasm_boot_duration_sec": 0.0,
+                "teardown_sec": 0.1,
+                "engine_monitors": {
+                    "start": start,
+                    "end": end,
+                    "delta": engine_monitors.monitors_delta(start, end),
+                },
+            }
+        ],
+    )
+    monkeypatch.setattr(conftest, "_LIFECYCLE_METRICS", [])
+    reporter = FakeTerminalReporter()
+    conftest.pytest_terminal_summary(reporter, 0, None)
+    assert "== Godot Engine Monitors ==" in reporter.lines
+    row = next(line for line in reporter.lines if "test_menu" in line)
+    assert "orphans 2 (+2)" in row
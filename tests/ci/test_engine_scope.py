@@ -0,0 +1,175 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_engine_scope.py
+"""Unit tests for session-scoped engine reuse and the resetGameState protocol."""
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from tests import conftest, test_utils
+
+
+class DummyConfig:
+    """Minimal stand-in for pytest.Config exposing getoption()."""
+
+    def __init__(self, **options: Any) -> None:
+        self.options = options
+
+    def getoption(self, name: str, default: Any = None) -> Any:
+        """Return a registered option value or the default."""
+        return self.options.get(name, default)
+
+
+class FakePage:
+    """Fake Playwright page that records evaluated scripts."""
+
+    def __init__(self, has_reset_hook: bool, reset_result: Any = None) -> None:
+        self.has_reset_hook = has_reset_hook
+        self.reset_result = reset_result
+        self.scripts: list[str] = []
+
+    def evaluate(self, script: str, arg: Any = None) -> Any:
+        """Record the script and answer the reset-hook probe."""
+        self.scripts.append(script)
+        if "typeof window.resetGameState === 'function'" == script:
+            return self.has_reset_hook
+        if "window.resetGameState([token])" in script:
+            return self.reset_result
+        return None
+
+
+def _make_request(nodeid: str, page_obj: Any, engine_scope: str = "module") -> Any:
+    """Build a fake request that depends on shared_page."""
+    return SimpleNamespace(
+        node=SimpleNamespace(nodeid=nodeid),
+        config=DummyConfig(**{"--engine-scope": engine_scope}),
+        fixturenames=["shared_page"],
+        getfixturevalue=lambda name: page_obj,
+    )
+
+
+def _drive_fixture(fixture_def: Any, *args: Any) -> Any:
+    """Run a generator fixture through setup and teardown; return its value."""
+    gen = fixture_def.__wrapped__(*args)
+    value = next(gen)
+    with pytest.raises(StopIteration):
+        next(gen)
+    return value
+
+
+# ==============================================================================
+# Option resolution
+# ==============================================================================
+
+
+def test_engine_scope_defaults_to_module() -> None:
+    """A missing config or unknown value keeps one engine boot per module."""
+    assert conftest._engine_scope(None) == "module"
+    assert conftest._engine_scope(DummyConfig(**{"--engine-scope": "bogus"})) == (
+        "module"
+    )
+    assert conftest._engine_scope(DummyConfig(**{"--engine-scope": "session"})) == (
+        "session"
+    )
+
+
+# ==============================================================================
+# Between-test reset
+# ==============================================================================
+
+
+def test_soft_ui_reset_uses_in_engine_reset_hook(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Session-scoped pages are reset in place, not via back buttons."""
+    page_obj = FakePage(has_reset_hook=True)
+    calls: list[Any] = []
+    monkeypatch.setattr(conftest, "reset_game_state", calls.append)
+
+    _drive_fixture(
+        conftest.soft_ui_reset, _make_request("t.py::a", page_obj, "session")
+    )
+
+    assert calls == [page_obj]
+    assert not any("optionsBackPressed" in script for script in page_obj.scripts)
+
+
+def test_soft_ui_reset_keeps_back_button_reset_in_module_scope(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Module-scoped pages keep the lightweight reset even when the hook exists."""
+    page_obj = FakePage(has_reset_hook=True)
+    calls: list[Any] = []
+    monkeypatch.setattr(conftest, "reset_game_state", calls.append)
+
+    _drive_fixture(conftest.soft_ui_reset, _make_request("t.py::a", page_obj))
+
+    assert calls == []
+    assert any("optionsBackPressed" in script for script in page_obj.scripts)
+
+
+def test_soft_ui_reset_falls_back_to_back_button_hooks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Older builds without the hook still get the legacy best-effort reset."""
+    page_obj = FakePage(has_reset_hook=False)
+    calls: list[Any] = []
+    monkeypatch.setattr(conftest, "reset_game_state", calls.append)
+
+    _drive_fixture(
+        conftest.soft_ui_reset, _make_request("t.py::a", page_obj, "session")
+    )
+
+    assert calls == []
+    assert any("optionsBackPressed" in script for script in page_obj.scripts)
+
+
+class FailingPage(FakePage):
+    """Fake page whose storage reset raises."""
+
+    def evaluate(self, script: str, arg: Any = None) -> Any:
+        raise RuntimeError("page crashed")
+
+
+@pytest.mark.parametrize("engine_scope", ["module", "session"])
+def test_soft_ui_reset_warns_on_failure(engine_scope: str) -> None:
+    """A failed reset never passes silently, whatever the engine scope."""
+    request = _make_request("t.py::a", FailingPage(has_reset_hook=True), engine_scope)
+
+    with pytest.warns(UserWarning, match="Game state reset failed"):
+        _drive_fixture(conftest.soft_ui_reset, request)
+
+
+def test_reset_game_state_raises_without_main_menu() -> None:
+    """A confirmation reporting ok=false is surfaced as an error."""
+    page_obj = FakePage(has_reset_hook=True, reset_result={"ok": False})
+
+    with pytest.raises(RuntimeError, match="did not reach the main menu"):
+        test_utils.reset_game_state(page_obj)
+
+
+# ==============================================================================
+# Session-scoped engine
+# ==============================================================================
+
+
+def test_shared_page_reuses_session_page_in_session_scope(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """No engine boot per module; per-test chunks inherit session diagnostics."""
+    monkeypatch.setattr(conftest, "_SHARED_PAGE_DIAGNOSTICS", {"": True})
+    session_page = object()
+    seen_diagnostics: list[bool] = []
+    request = _make_request("tests/test_mod.py", session_page, "session")
+
+    browser = SimpleNamespace(new_context=pytest.fail)
+    gen = conftest.shared_page.__wrapped__(browser, request)
+    assert next(gen) is session_page
+    seen_diagnostics.append(conftest._SHARED_PAGE_DIAGNOSTICS["tests/test_mod.py"])
+    with pytest.raises(StopIteration):
+        next(gen)
+
+    assert seen_diagnostics == [True]
+    assert "tests/test_mod.py" not in conftest._SHARED_PAGE_DIAGNOSTICS
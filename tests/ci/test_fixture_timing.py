@@ -0,0 +1,121 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_fixture_timing.py
+"""Unit tests for per-phase and per-fixture timing in the metrics baseline."""
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from tests import conftest
+from tests.ci.test_frame_timing import FakeTerminalReporter
+from tests.perf import fixture_timing
+
+NODEID = "tests/a_test.py::test_flow"
+
+
+class FakeFixtureDef:
+    """Holds finalizers the way FixtureDef does (run LIFO by finish)."""
+
+    def __init__(self, argname: str, scope: str = "function") -> None:
+        self.argname = argname
+        self.scope = scope
+        self.finalizers: list[Any] = []
+
+    def addfinalizer(self, finalizer: Any) -> None:
+        self.finalizers.append(finalizer)
+
+
+@pytest.fixture
+def timing_state(monkeypatch: pytest.MonkeyPatch) -> Any:
+    clock = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(
+        fixture_timing, "time", SimpleNamespace(perf_counter=lambda: clock.now)
+    )
+    plugin = fixture_timing.FixtureTimingPlugin()
+    plugin.pytest_runtest_logstart(NODEID, ("a_test.py", 0, "test_flow"))
+    monkeypatch.setitem(conftest._SESSION_STATE, "fixture_timing", plugin)
+    return SimpleNamespace(clock=clock, plugin=plugin)
+
+
+def _run_fixture(
+    state: Any, fixturedef: FakeFixtureDef, setup: float, teardown: float
+) -> None:
+    clock, plugin = state.clock, state.plugin
+    hook = plugin.pytest_fixture_setup(fixturedef, None)
+    next(hook)
+    clock.now += setup
+    # The fixture's own teardown is registered during setup, before ours
+    fixturedef.addfinalizer(lambda: setattr(clock, "now", clock.now + teardown))
+    with pytest.raises(StopIteration):
+        hook.send(None)
+    while fixturedef.finalizers:
+        fixturedef.finalizers.pop()()
+    plugin.pytest_fixture_post_finalizer(fixturedef, None)
+
+
+def test_plugin_times_setup_and_teardown(timing_state: Any) -> None:
+    """Setup and teardown are measured separately and aggregated per fixture."""
+    _run_fixture(timing_state, FakeFixtureDef("page"), setup=2.5, teardown=0.5)
+    _run_fixture(timing_state, FakeFixtureDef("page"), setup=1.5, teardown=0.25)
+    _run_fixture(timing_state, FakeFixtureDef("browser_instance", "session"), 2.0, 0.5)
+
+    ranking = timing_state.plugin.slowest_fixtures()
+    assert [row["fixture"] for row in ranking] == ["page", "browser_instance"]
+    assert ranking[0] == {
+        "fixture": "page",
+        "scope": "function",
+        "setup_count": 2,
+        "setup_sec": 4.0,
+        "setup_max_sec": 2.5,
+        "teardown_sec": 0.75,
+        "total_sec": 4.75,
+    }
+    assert timing_state.plugin.test_timings[NODEID]["page"] == {
+        "setup_sec": 4.0,
+        "teardown_sec": 0.75,
+    }
+
+
+def test_profiling_entry_splits_phases(
+    timing_state: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Entries carry setup/call/teardown and the test's non-trivial fixtures."""
+    monkeypatch.setattr(conftest, "_TEST_PROFILING_DATA", [])
+    monkeypatch.setattr(conftest, "_PENDING_TEST_METRICS", {})
+    monkeypatch.setattr(conftest, "_SUMMARY_COUNTS", {"passed": 0})
+    timing_state.plugin.test_timings[NODEID] = {
+        "page": {"setup_sec": 3.2, "teardown_sec": 0.4},
+        "tmp_path": {"setup_sec": 0.0, "teardown_sec": 0.0},
+    }
+    item = SimpleNamespace(
+        nodeid=NODEID,
+        rep_setup=SimpleNamespace(failed=False, skipped=False, duration=3.5),
+        rep_call=SimpleNamespace(failed=False, skipped=False, duration=1.25),
+    )
+    conftest._record_test_profiling(
+        item, SimpleNamespace(failed=False, skipped=False, duration=0.5)
+    )
+    entry = conftest._TEST_PROFILING_DATA[0]
+    assert (entry["setup_sec"], entry["call_sec"], entry["teardown_sec"]) == (
+        3.5,
+        1.25,
+        0.5,
+    )
+    assert entry["duration_sec"] == 5.25
+    assert entry["fixtures"] == {"page": {"setup_sec": 3.2, "teardown_sec": 0.4}}
+
+
+def test_terminal_summary_ranks_slowest_fixtures(
+    timing_state: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The slowest fixtures are listed with scope and totals."""
+    _run_fixture(timing_state, FakeFixtureDef("shared_page", "module"), 8.0, 2.0)
+    monkeypatch.setattr(conftest, "_TEST_PROFILING_DATA", [])
+    monkeypatch.setattr(conftest, "_LIFECYCLE_METRICS", [])
+    reporter = FakeTerminalReporter()
+    conftest.pytest_terminal_summary(reporter, 0, None)
+    assert "== Slowest Fixtures ==" in reporter.lines
+    row = next(line for line in reporter.lines if "shared_page" in line)
+    assert "module" in row and "total 10.0s" in row
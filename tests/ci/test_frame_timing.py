@@ -0,0 +1,116 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_frame_timing.py
+"""Unit tests for frame-time sampling, summarization, and metrics export."""
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from tests import conftest
+from tests.perf import frame_timing
+
+
+class FakeTerminalReporter:
+    """Collects written lines and section titles."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def ensure_newline(self) -> None:
+        """No-op newline guard."""
+
+    def section(self, title: str, **_: Any) -> None:
+        """Record a section header."""
+        self.lines.append(f"== {title} ==")
+
+    def write_line(self, line: str) -> None:
+        """Record a written line."""
+        self.lines.append(line)
+
+
+@pytest.fixture(autouse=True)
+def isolate_conftest_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Isolate profiling globals touched by the frame-timing plumbing."""
+    monkeypatch.setattr(conftest, "_FAILED_NODEIDS", set())
+    monkeypatch.setattr(conftest, "_TEST_PROFILING_DATA", [])
+    monkeypatch.setattr(conftest, "_PENDING_TEST_METRICS", {})
+    monkeypatch.setattr(conftest, "_LIFECYCLE_METRICS", [])
+    monkeypatch.setattr(
+        conftest, "_SUMMARY_COUNTS", {"passed": 0, "failed": 0, "skipped": 0}
+    )
+
+
+def test_summarize_frame_times_percentiles_and_long_frames() -> None:
+    """Nearest-rank percentiles and long frames are computed from raw deltas."""
+    samples = [16.7] * 90 + [33.4] * 8 + [80.0, 120.0]
+
+    stats = frame_timing.summarize_frame_times(samples, total=250)
+
+    assert stats == {
+        "frames": 250,
+        "sampled_frames": 100,
+        "p50_ms": 16.7,
+        "p95_ms": 33.4,
+        "p99_ms": 80.0,
+        "max_ms": 120.0,
+        "long_frames": 2,
+    }
+
+
+def test_summarize_frame_times_empty_returns_none() -> None:
+    """Tests that never rendered a frame report nothing."""
+    assert frame_timing.summarize_frame_times([]) is None
+
+
+def test_sampler_script_embeds_ring_buffer_capacity() -> None:
+    """The init script is rendered with the capacity and JS modulo intact."""
+    script = frame_timing.FRAME_SAMPLER_SCRIPT
+
+    assert f"const capacity = {frame_timing.FRAME_BUFFER_SIZE};" in script
+    assert "% capacity" in script
+    assert "new Float32Array(capacity)" in script
+
+
+def test_collect_frame_stats_summarizes_page_payload() -> None:
+    """The collector reads the page-side buffer through a single evaluate."""
+    page_obj = SimpleNamespace(
+        evaluate=lambda script: {"total": 3, "samples": [10.0, 20.0, 60.0]}
+    )
+
+    stats = frame_timing.collect_frame_stats(page_obj)
+
+    assert stats["frames"] == 3
+    assert stats["long_frames"] == 1
+
+
+def test_pending_metrics_merge_into_profiling_entry() -> None:
+    """Metrics attached by fixtures land in the test's baseline entry."""
+    item: Any = SimpleNamespace(nodeid="tests/test_a.py::test_x")
+    conftest._attach_test_metrics(item.nodeid, "frame_timing", {"p50_ms": 16.7})
+
+    conftest._record_test_profiling(
+        item,
+        SimpleNamespace(when="teardown", failed=False, skipped=False, duration=0.1),
+    )
+
+    assert conftest._TEST_PROFILING_DATA[0]["frame_timing"] == {"p50_ms": 16.7}
+    assert conftest._PENDING_TEST_METRICS == {}
+
+
+def test_terminal_summary_lists_frame_timing() -> None:
+    """Tests with frame statistics get a line in the Frame Timing section."""
+    conftest._TEST_PROFILING_DATA.append(
+        {
+            "nodeid": "tests/test_a.py::test_x",
+            "frame_timing": frame_timing.summarize_frame_times([16.7, 16.7, 70.0]),
+        }
+    )
+    reporter = FakeTerminalReporter()
+
+    conftest.pytest_terminal_summary(reporter, 0, None)
+
+    assert "== Frame Timing ==" in reporter.lines
+    line = next(text for text in reporter.lines if "test_x" in text)
+    assert "p99" in line and "long (>50 ms): 1 / 3" in line
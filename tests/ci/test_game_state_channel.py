@@ -0,0 +1,74 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_game_state_channel.py
+"""Unit tests for the batched push-based game state channel."""
+
+from pathlib import Path
+from typing import Any
+
+from tests import test_utils
+
+ROOT = Path(__file__).resolve().parents[2]
+GLOBALS_PATH = ROOT / "scripts" / "core" / "globals.gd"
+SHELL_PATH = ROOT / "custom_shell.html"
+
+
+class FakePage:
+    """Records evaluate and expose_function calls."""
+
+    def __init__(self, result: Any = None) -> None:
+        self.result = result
+        self.evaluated: list[tuple[str, Any]] = []
+        self.exposed: dict[str, Any] = {}
+
+    def evaluate(self, script: str, arg: Any = None) -> Any:
+        self.evaluated.append((script, arg))
+        return self.result
+
+    def expose_function(self, name: str, callback: Any) -> None:
+        self.exposed[name] = callback
+
+
+def test_wait_for_game_state_single_evaluate() -> None:
+    """The predicate and timeout are sent in one evaluate; the snapshot returns."""
+    page = FakePage({"fuel": 80.0, "seq": 4})
+    state = test_utils.wait_for_game_state(page, "state.fuel < 90", timeout=500)
+    assert state == {"fuel": 80.0, "seq": 4}
+    script, arg = page.evaluated[0]
+    assert "skylock:state" in script
+    assert arg == {"predicate": "state.fuel < 90", "timeout": 500}
+
+
+def test_subscribe_game_state_collects_pushed_snapshots() -> None:
+    """Snapshots forwarded through the exposed binding land in the list."""
+    page = FakePage()
+    snapshots = test_utils.subscribe_game_state(page)
+    ((name, sink),) = page.exposed.items()
+    assert page.evaluated[0][1] == name
+    sink({"speed": 250.0})
+    assert snapshots == [{"speed": 250.0}]
+
+
+def test_globals_reports_fuel_through_channel() -> None:
+    """Fuel changes are batched instead of evaluated on every setting change."""
+    source = GLOBALS_PATH.read_text(encoding="utf-8")
+    handler = source.split("func _on_setting_changed(", 1)[1].split("\nfunc ", 1)[0]
+    assert "JavaScriptBridge.eval" not in handler
+    assert 'report_game_state("fuel", new_value)' in handler
+    assert "_state_channel.push(" in source
+
+
+def test_globals_reports_scene_on_change_not_per_frame() -> None:
+    """The scene is pushed from scene_changed; desktop builds skip _process."""
+    source = GLOBALS_PATH.read_text(encoding="utf-8")
+    process = source.split("func _process(", 1)[1].split("\nfunc ", 1)[0]
+    assert "current_scene" not in process
+    assert "scene_changed.connect(_report_current_scene)" in source
+    assert "set_process(false)" in source
+
+
+def test_shell_defines_state_channel() -> None:
+    """The shell owns the ring buffer Globals pushes into."""
+    shell = SHELL_PATH.read_text(encoding="utf-8")
+    assert "window.__skylockState" in shell
+    assert "new CustomEvent('skylock:state'" in shell
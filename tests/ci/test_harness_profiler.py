@@ -0,0 +1,139 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_harness_profiler.py
+"""Unit tests for the --profile-harness cProfile/tracemalloc profiler."""
+
+import pstats
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tests import conftest
+from tests.ci.test_frame_timing import FakeTerminalReporter
+from tests.perf import harness_profiler
+
+STDLIB = harness_profiler._STDLIB_DIR
+
+
+@pytest.mark.parametrize(
+    ("func", "bucket"),
+    [
+        (("~", 0, "<built-in method time.sleep>"), "sleep"),
+        (
+            ("/venv/site-packages/playwright/_impl/_sync_base.py", 9, "_sync"),
+            "playwright",
+        ),
+        (("C:\\venv\\Lib\\site-packages\\greenlet\\x.py", 1, "f"), "playwright"),
+        (("~", 0, "<method 'switch' of 'greenlet.greenlet' objects>"), "playwright"),
+        (("~", 0, "<method 'poll' of 'select.epoll' objects>"), "playwright"),
+        ((f"{STDLIB}asyncio/base_events.py", 1, "_run_once"), "playwright"),
+        ((f"{STDLIB}selectors.py", 1, "select"), "playwright"),
+        (("/repo/tests/test_utils.py", 12, "wait_for_log"), "harness"),
+        (("/repo/tests/async_utils.py", 51, "init_cdp_coverage"), "harness"),
+        (("/repo/tests/ci/test_playwright_diagnostics.py", 1, "f"), "harness"),
+        (("/repo/tests/asyncio/helpers.py", 1, "f"), "harness"),
+        ((f"{STDLIB}json/encoder.py", 1, "encode"), "harness"),
+        (("~", 0, "<built-in method builtins.sorted>"), "harness"),
+    ],
+)
+def test_classify_function(func: tuple[str, int, str], bucket: str) -> None:
+    """Self time is bucketed by where the function lives."""
+    assert harness_profiler.classify_function(func) == bucket
+
+
+def test_summarize_profile_splits_self_time() -> None:
+    """Buckets sum self time and only harness functions are ranked."""
+    stats = {
+        ("/repo/tests/test_utils.py", 12, "wait_for_log"): (3, 3, 0.4, 1.5, {}),
+        ("/repo/tests/conftest.py", 80, "_record"): (1, 1, 0.1, 0.1, {}),
+        ("/venv/site-packages/playwright/_page.py", 5, "evaluate"): (
+            2,
+            2,
+            0.7,
+            0.9,
+            {},
+        ),
+        ("~", 0, "<built-in method time.sleep>"): (4, 4, 0.8, 0.8, {}),
+    }
+
+    summary = harness_profiler.summarize_profile(stats, top=1)
+
+    assert summary == {
+        "harness_sec": 0.5,
+        "playwright_sec": 0.7,
+        "sleep_sec": 0.8,
+        "calls": 10,
+        "top_functions": [["/repo/tests/test_utils.py:12(wait_for_log)", 0.4, 3]],
+    }
+
+
+def _busy_harness_work() -> list[bytes]:
+    end = time.perf_counter() + 0.05
+    while time.perf_counter() < end:
+        pass
+    return [bytes(1024) for _ in range(512)]
+
+
+def test_profiler_measures_cpu_sleep_and_allocations(tmp_path: Path) -> None:
+    """A real run separates busy harness work from sleeping and sees allocations."""
+    profiler = harness_profiler.HarnessProfiler()
+    profiler.start()
+    kept = _busy_harness_work()
+    time.sleep(0.05)
+    summary = profiler.stop(tmp_path / "run.pstats")
+    profiler.shutdown()
+
+    assert len(kept) == 512
+    assert summary["sleep_sec"] >= 0.04
+    assert summary["harness_sec"] >= 0.03
+    assert summary["wall_sec"] >= summary["cpu_sec"] >= 0.03
+    assert any("_busy_harness_work" in row[0] for row in summary["top_functions"])
+    assert summary["alloc_net_kb"] >= 512
+    assert summary["alloc_peak_mb"] >= 0.5
+    assert summary["top_allocations"][0][1] >= 512
+    assert summary["pstats"] == "run.pstats"
+    assert pstats.Stats(str(tmp_path / "run.pstats")).total_calls > 0
+
+
+def test_terminal_summary_lists_harness_overhead(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Per-test harness vs Playwright vs sleep time gets its own section."""
+    monkeypatch.setattr(conftest, "_LIFECYCLE_METRICS", [])
+    profile = {
+        "wall_sec": 3.0,
+        "cpu_sec": 0.9,
+        "harness_sec": 0.8,
+        "playwright_sec": 1.6,
+        "sleep_sec": 0.5,
+        "calls": 1000,
+        "top_functions": [["/repo/tests/test_utils.py:12(wait_for_log)", 0.6, 40]],
+        "alloc_peak_mb": 4.2,
+        "alloc_net_kb": 12.0,
+        "top_allocations": [],
+        "pstats": "harness_profile_x.pstats",
+    }
+    monkeypatch.setattr(
+        conftest,
+        "_TEST_PROFILING_DATA",
+        [
+            {
+                "nodeid": "tests/a_test.py::test_flow",
+                "duration_sec": 3.0,
+                "outcome": "passed",
+                "harness_profile": profile,
+            }
+        ],
+    )
+    reporter = FakeTerminalReporter()
+    conftest.pytest_terminal_summary(reporter, 0, SimpleNamespace())
+
+    assert "== Harness Overhead ==" in reporter.lines
+    row = next(line for line in reporter.lines if "test_flow" in line)
+    assert "harness 0.800s | playwright 1.600s | sleep 0.500s" in row
+    assert "alloc peak 4.2 MB" in row
+    assert "      hottest: /repo/tests/test_utils.py:12(wait_for_log) 0.600s" in (
+        reporter.lines
+    )
@@ -0,0 +1,61 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_harness_throughput.py
+"""Unit tests for the sync vs. async harness throughput report helpers."""
+
+import asyncio
+import inspect
+
+from tests import async_utils
+from tests.perf.harness_throughput import compare_runs, summarize_run
+
+
+def test_summarize_run_computes_flows_per_minute() -> None:
+    """Throughput is reported in flows per minute."""
+    run = summarize_run("sync", 4, 120.0)
+
+    assert run == {"mode": "sync", "flows": 4, "wall_sec": 120.0, "flows_per_min": 2.0}
+
+
+def test_summarize_run_handles_zero_duration() -> None:
+    """A zero wall time must not divide by zero."""
+    assert summarize_run("async", 0, 0.0)["flows_per_min"] is None
+
+
+def test_compare_runs_reports_speedup() -> None:
+    """Speedup is the sync wall time divided by the async wall time."""
+    report = compare_runs(
+        summarize_run("sync", 4, 120.0), summarize_run("async", 4, 40.0)
+    )
+
+    assert report["speedup"] == 3.0
+    assert report["async"]["flows_per_min"] == 6.0
+
+
+def test_async_helpers_mirror_sync_api() -> None:
+    """The async harness exposes coroutine versions of the sync flow helpers."""
+    for name in (
+        "init_page_and_wait_ready",
+        "run_navigation_script",
+        "start_game_and_wait_ready",
+    ):
+        assert inspect.iscoroutinefunction(getattr(async_utils, name)), name
+
+
+def test_async_wait_for_console_log_sees_late_messages() -> None:
+    """Console entries appended while waiting are picked up without a page."""
+    logs: list[dict[str, str]] = []
+
+    async def _scenario() -> None:
+        async def _emit() -> None:
+            await asyncio.sleep(0.06)
+            logs.append({"type": "log", "text": "Player READY"})
+
+        await asyncio.gather(
+            async_utils.wait_for_console_log(
+                logs, lambda text: "player ready" in text, 0, timeout_ms=2000
+            ),
+            _emit(),
+        )
+
+    asyncio.run(_scenario())
@@ -0,0 +1,201 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_input_replay.py
+"""Unit tests for keyboard input recording and frame-accurate replay."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from tests import conftest
+from tests.ci.test_frame_timing import FakeTerminalReporter
+from tests.perf import input_replay
+
+
+class FakeHandle:
+    """Mimics the JSHandle returned by ``wait_for_function``."""
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def json_value(self) -> Any:
+        return self.value
+
+
+class FakePage:
+    """Simulates a page whose frame counter lags targets by ``lag`` frames.
+
+    Dispatched keys reach the page ``delivery`` frames later; ``drop`` names
+    key codes that never arrive.
+    """
+
+    def __init__(self, lag: int = 0, delivery: int = 0, drop: str = "") -> None:
+        self.lag = lag
+        self.delivery = delivery
+        self.drop = drop
+        self.frame = 100
+        self.keys: list[tuple[str, str]] = []
+        self.arrivals: list[list[Any]] = []
+        self.keyboard = SimpleNamespace(
+            down=lambda code: self._press("down", code),
+            up=lambda code: self._press("up", code),
+        )
+
+    def _press(self, kind: str, code: str) -> None:
+        self.keys.append((kind, code))
+        if code != self.drop:
+            self.arrivals.append([self.frame + self.delivery, 0.0, kind[0], code])
+
+    def evaluate(self, script: str, arg: Any = None) -> Any:
+        if "__inputRecorder.start" in script:
+            self.arrivals = []
+            return self.frame
+        if "__inputRecorder.stop" in script:
+            return self.arrivals
+        if "requestEngineMonitors" in script:
+            return {"node_count": self.frame}
+        if "frames_total" in script:
+            return {
+                "frame": self.frame,
+                "frames_total": None,
+                "js_heap": 1048576.0 * self.frame,
+                "wasm_heap": None,
+            }
+        return None
+
+    def wait_for_function(self, script: str, arg: Any, polling: str) -> FakeHandle:
+        assert polling == "raf"
+        self.frame = max(self.frame, arg + self.lag)
+        return FakeHandle({"frame": self.frame})
+
+
+def _recording() -> dict[str, Any]:
+    return input_replay.build_recording(
+        [[5, "d", "KeyW"], [10, "d", "Space"], [2, "u", "Space"]]
+    )
+
+
+def test_encode_events_delta_frames() -> None:
+    """Absolute frames become deltas; out-of-order frames clamp to zero."""
+    raw = [[12, 1.0, "d", "KeyA"], [12, 2.0, "d", "Space"], [20, 3.0, "u", "KeyA"]]
+    assert input_replay.encode_events(raw, start_frame=10) == [
+        [2, "d", "KeyA"],
+        [0, "d", "Space"],
+        [8, "u", "KeyA"],
+    ]
+
+
+def test_recording_round_trip(tmp_path: Path) -> None:
+    """Saved recordings load back unchanged and keep one event per line."""
+    path = input_replay.save_recording(_recording(), tmp_path / "a.keys.json")
+    assert input_replay.load_recording(path) == _recording()
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 5
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"version": 99, "events": []},
+        {"version": 1, "events": [[-1, "d", "KeyW"]]},
+        {"version": 1, "events": [[1, "press", "KeyW"]]},
+    ],
+)
+def test_load_recording_rejects_invalid(tmp_path: Path, payload: dict) -> None:
+    """Unknown versions and malformed events raise ValueError."""
+    path = tmp_path / "bad.keys.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    with pytest.raises(ValueError):
+        input_replay.load_recording(path)
+
+
+def test_replay_dispatches_on_scheduled_frames() -> None:
+    """Keys go through page.keyboard in order; held keys are released."""
+    page = FakePage()
+    request = SimpleNamespace(node=SimpleNamespace())
+    summary = input_replay.replay_inputs(page, _recording(), request=request)
+    assert page.keys == [
+        ("down", "KeyW"),
+        ("down", "Space"),
+        ("up", "Space"),
+        ("up", "KeyW"),
+    ]
+    assert summary["events"] == 3
+    assert summary["frames"] == 17
+    assert summary["max_drift_frames"] == 0
+    assert summary["js_heap_delta_mb"] == 17.0
+    assert summary["engine_monitors_delta"] == {"node_count": 17}
+    assert request.node._input_replay is summary
+
+
+def test_replay_reports_drift() -> None:
+    """Late frames are reported per event."""
+    summary = input_replay.replay_inputs(FakePage(lag=3), _recording())
+    assert summary["max_drift_frames"] == 3
+    assert summary["late_events"] == 3
+
+
+def test_replay_drift_counts_key_delivery() -> None:
+    """Drift is taken from page-side arrival, so slow key delivery counts."""
+    summary = input_replay.replay_inputs(FakePage(delivery=2), _recording())
+    assert summary["max_drift_frames"] == 2
+    assert summary["late_events"] == 3
+    assert summary["missing_events"] == 0
+
+
+def test_arrival_drifts_flags_missing_events() -> None:
+    """Events that never arrive are None; extra arrivals are ignored."""
+    scheduled = [(10, "d", "KeyW"), (12, "d", "Space"), (15, "u", "KeyW")]
+    arrivals = [[11, 0.0, "d", "KeyW"], [16, 0.0, "u", "KeyW"], [17, 0.0, "u", "KeyA"]]
+
+    assert input_replay.arrival_drifts(scheduled, arrivals) == [1, None, 1]
+    summary = input_replay.replay_inputs(FakePage(drop="Space"), _recording())
+    assert summary["missing_events"] == 2
+    assert summary["events"] == 3
+
+
+def test_checked_in_replays_are_valid() -> None:
+    """Every shipped scenario loads and releases every key it presses."""
+    paths = list(input_replay.REPLAYS_DIR.glob("*.keys.json"))
+    assert paths
+    for path in paths:
+        held: set[str] = set()
+        for _, kind, code in input_replay.load_recording(path)["events"]:
+            (held.add if kind == "d" else held.discard)(code)
+        assert not held, f"{path.name} leaves {held} pressed"
+
+
+def test_terminal_summary_lists_input_replays(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Replay drift and resource deltas get their own summary section."""
+    monkeypatch.setattr(
+        conftest,
+        "_TEST_PROFILING_DATA",
+        [
+            {
+                "nodeid": "tests/gameplay_replay_test.py::test_gameplay_replay[a]",
+                "duration_sec": 12.0,
+                "outcome": "passed",
+                "wasm_boot_duration_sec": 0.0,
+                "teardown_sec": 0.1,
+                "input_replay": {
+                    "events": 40,
+                    "frames": 656,
+                    "max_drift_frames": 1,
+                    "frame_stats": {"p95_ms": 17.2},
+                    "wasm_heap_delta_mb": 0.0,
+                    "engine_monitors_delta": {"node_count": 4},
+                },
+            }
+        ],
+    )
+    monkeypatch.setattr(conftest, "_LIFECYCLE_METRICS", [])
+    reporter = FakeTerminalReporter()
+    conftest.pytest_terminal_summary(reporter, 0, None)
+    assert "== Input Replay ==" in reporter.lines
+    row = next(line for line in reporter.lines if "test_gameplay_replay" in line)
+    assert "40 events / 656 frames" in row
+    assert "max drift 1f" in row
@@ -0,0 +1,110 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_memory_sampling.py
+"""Unit tests for periodic heap sampling and leak heuristics."""
+
+import pytest
+
+from tests import conftest
+from tests.ci.test_frame_timing import FakeTerminalReporter
+from tests.perf import memory_sampling
+
+MB = 1048576
+
+
+def _payload(js_mb_per_sample: float, count: int = 10) -> dict:
+    """Samples every 500 ms with linear JS heap growth and flat WASM memory."""
+    return {
+        "interval": 500,
+        "total": count,
+        "samples": [
+            [1000.0 + i * 500, (50 + i * js_mb_per_sample) * MB, 32 * MB]
+            for i in range(count)
+        ],
+    }
+
+
+def test_sampler_script_embeds_interval_and_capacity() -> None:
+    """The init script carries the configured interval and ring capacity."""
+    script = memory_sampling.memory_sampler_script(250)
+    assert "setInterval(sample, 250)" in script
+    assert f"const capacity = {memory_sampling.SAMPLE_BUFFER_SIZE};" in script
+    assert "HEAP8.length" in script
+
+
+def test_linear_slope() -> None:
+    """Least squares slope; undefined for fewer than two distinct x values."""
+    assert memory_sampling.linear_slope([(0, 1), (1, 3), (2, 5)]) == 2.0
+    assert memory_sampling.linear_slope([(0, 1)]) is None
+    assert memory_sampling.linear_slope([(1, 1), (1, 2)]) is None
+
+
+def test_summarize_flags_steady_growth() -> None:
+    """1 MB per 500 ms is 120 MB/min on the JS heap and is flagged."""
+    summary = memory_sampling.summarize_memory_timeline(_payload(1.0))
+    assert summary["samples"] == 10
+    assert summary["timeline"][0] == [0.0, 50.0, 32.0]
+    assert summary["timeline"][-1] == [4500.0, 59.0, 32.0]
+    assert summary["js_heap_slope_mb_per_min"] == pytest.approx(120.0)
+    assert summary["wasm_heap_slope_mb_per_min"] == 0.0
+    assert summary["leak_suspected"] is True
+
+
+def test_summarize_ignores_flat_and_short_timelines() -> None:
+    """Flat heaps and timelines shorter than MIN_LEAK_SAMPLES are not leaks."""
+    assert not memory_sampling.summarize_memory_timeline(_payload(0.0))[
+        "leak_suspected"
+    ]
+    assert not memory_sampling.summarize_memory_timeline(_payload(1.0, count=4))[
+        "leak_suspected"
+    ]
+    assert memory_sampling.summarize_memory_timeline({"samples": []}) is None
+
+
+def test_summarize_handles_missing_series() -> None:
+    """Browsers without performance.memory report None for the JS series."""
+    payload = _payload(1.0)
+    for row in payload["samples"]:
+        row[1] = None
+    summary = memory_sampling.summarize_memory_timeline(payload)
+    assert summary["js_heap_slope_mb_per_min"] is None
+    assert summary["timeline"][0][1] is None
+    assert summary["leak_suspected"] is False
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        ([10.0, 10.5, 11.2], True),
+        ([10.0, 10.0, 10.2, None, 11.5], True),
+        ([10.0, 12.0, 11.0], False),
+        ([10.0, 10.1, 10.2], False),
+        ([10.0, 20.0], False),
+    ],
+)
+def test_is_monotonic_growth(values: list, expected: bool) -> None:
+    """Growth needs MIN_MODULE_TESTS readings, no drop, and MIN_MODULE_GROWTH_MB."""
+    assert memory_sampling.is_monotonic_growth(values) is expected
+
+
+def test_flag_heap_growth_modules_and_summary(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Modules with monotonic growth are flagged and shown in the summary."""
+    plugin = memory_sampling.MemoryTimelinePlugin(lambda *args: None)
+    plugin.heap_series = {
+        "tests/leaky_test.py": [(10.0, 32.0), (11.0, 32.0), (12.5, 32.0)],
+        "tests/stable_test.py": [(10.0, 32.0), (9.0, 32.0), (10.0, 32.0)],
+    }
+    flagged = plugin.flag_heap_growth_modules()
+    assert flagged == [
+        {"module": "tests/leaky_test.py", "tests": 3, "series": ["js_heap"]}
+    ]
+
+    monkeypatch.setattr(conftest, "_TEST_PROFILING_DATA", [])
+    monkeypatch.setattr(conftest, "_LIFECYCLE_METRICS", [])
+    monkeypatch.setitem(conftest._SESSION_STATE, "heap_growth_modules", flagged)
+    reporter = FakeTerminalReporter()
+    conftest.pytest_terminal_summary(reporter, 0, None)
+    assert "== Memory Growth ==" in reporter.lines
+    assert any("tests/leaky_test.py" in line for line in reporter.lines)
@@ -79,6 +79,7 @@ def isolate_profiling_globals(monkeypatch: pytest.MonkeyPatch) -> None:
         conftest, "_SUMMARY_COUNTS", {"passed": 0, "failed": 0, "skipped": 0}
     )
     monkeypatch.setattr(conftest, "_TEST_PROFILING_DATA", [])
+    monkeypatch.setitem(conftest._SESSION_STATE, "artifact_writer", None)
 
 
 # ==============================================================================
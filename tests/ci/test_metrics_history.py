@@ -0,0 +1,112 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_metrics_history.py
+"""Unit tests for the SQLite metrics_baseline history store."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests.perf import metrics_history
+
+NODEID = "tests/weapon_firing_test.py::test_weapon_firing"
+
+
+def _payload(timestamp: str, duration: float) -> dict[str, Any]:
+    return {
+        "timestamp": timestamp,
+        "total_duration_sec": duration + 5.0,
+        "summary": {"passed": 1, "failed": 0},
+        "tests": [
+            {
+                "nodeid": NODEID,
+                "duration_sec": duration,
+                "outcome": "passed",
+                "wasm_boot_duration_sec": None,
+                "memory_timeline": {
+                    "js_heap_slope_mb_per_min": 0.5,
+                    "leak_suspected": False,
+                    "timeline": [[0.0, 10.0, 32.0]],
+                },
+            }
+        ],
+        "heap_growth_modules": [],
+    }
+
+
+@pytest.fixture
+def conn(tmp_path: Path):
+    connection = metrics_history.connect(tmp_path / "history.sqlite")
+    yield connection
+    connection.close()
+
+
+def test_flatten_metrics_keeps_numeric_leaves() -> None:
+    """Nested numbers get dotted names; ids, bools, None and lists are dropped."""
+    metrics = metrics_history.flatten_metrics(_payload("t", 2.0)["tests"][0])
+    assert metrics == {
+        "duration_sec": 2.0,
+        "memory_timeline.js_heap_slope_mb_per_min": 0.5,
+    }
+
+
+def test_ingest_is_idempotent_per_commit_timestamp_shard(conn) -> None:
+    """Re-ingesting the same run is a no-op; other shards are separate runs."""
+    payload = _payload("2026-01-01T00:00:00Z", 2.0)
+    assert metrics_history.ingest_payload(conn, payload, "abc") == 1
+    assert metrics_history.ingest_payload(conn, payload, "abc") is None
+    assert metrics_history.ingest_payload(conn, payload, "abc", shard="firefox") == 2
+    runs = metrics_history.list_runs(conn)
+    assert [run["shard"] for run in runs] == ["firefox", ""]
+    assert runs[0]["total_duration_sec"] == 7.0
+
+
+def test_query_test_trend_orders_oldest_first(conn) -> None:
+    """Trends span runs in timestamp order and respect the limit."""
+    for index, duration in enumerate((3.0, 2.0, 4.0)):
+        metrics_history.ingest_payload(
+            conn, _payload(f"2026-01-0{index + 1}T00:00:00Z", duration), f"c{index}"
+        )
+    trend = metrics_history.query_test_trend(conn, NODEID, limit=2)
+    assert [row["value"] for row in trend] == [2.0, 4.0]
+    assert [row["commit_sha"] for row in trend] == ["c1", "c2"]
+    assert trend[0]["outcome"] == "passed"
+    assert metrics_history.metric_names(conn, NODEID) == [
+        "duration_sec",
+        "memory_timeline.js_heap_slope_mb_per_min",
+    ]
+    assert metrics_history.metric_values_by_commit(conn, "duration_sec", "c0") == {
+        NODEID: [3.0]
+    }
+
+
+def test_ingest_file_derives_shard(conn, tmp_path: Path) -> None:
+    """CI's per-shard copies keep their suffix as the shard."""
+    path = tmp_path / "metrics_baseline_chromium_1.json"
+    path.write_text(json.dumps(_payload("t1", 1.0)), encoding="utf-8")
+    metrics_history.ingest_file(conn, path, "abc")
+    assert metrics_history.list_runs(conn)[0]["shard"] == "chromium_1"
+
+
+def test_connect_rejects_newer_schema(tmp_path: Path) -> None:
+    """A database from a newer checkout is not silently downgraded."""
+    path = tmp_path / "history.sqlite"
+    connection = metrics_history.connect(path)
+    connection.execute("PRAGMA user_version = 99")
+    connection.close()
+    with pytest.raises(RuntimeError, match="schema 99"):
+        metrics_history.connect(path)
+
+
+def test_cli_ingest_and_trend(tmp_path: Path, capsys) -> None:
+    """The CLI ingests files and prints the per-test trend."""
+    db = tmp_path / "history.sqlite"
+    path = tmp_path / "metrics_baseline.json"
+    path.write_text(json.dumps(_payload("t1", 1.5)), encoding="utf-8")
+    argv = ["--db", str(db)]
+    assert metrics_history.main(argv + ["ingest", str(path), "--commit", "abc"]) == 0
+    assert metrics_history.main(argv + ["trend", NODEID]) == 0
+    assert "1.5000 (passed)" in capsys.readouterr().out
+    assert metrics_history.main(argv + ["trend", "missing"]) == 1
@@ -0,0 +1,158 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_metrics_stream.py
+"""Unit tests for the crash-safe JSONL metrics stream."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from tests import conftest
+from tests.perf import metrics_stream
+
+
+def _entry(nodeid: str, outcome: str = "passed") -> dict[str, Any]:
+    return {
+        "nodeid": nodeid,
+        "duration_sec": 1.5,
+        "outcome": outcome,
+        "wasm_boot_duration_sec": None,
+    }
+
+
+def _write_session(path: Path, finish: bool) -> None:
+    stream = metrics_stream.MetricsStream(path, fsync=False)
+    stream.write("session_start", {"timestamp": "2026-10-19T08:00:00Z"})
+    stream.write("test", _entry("tests/a_test.py::test_a"))
+    stream.write("test", _entry("tests/b_test.py::test_b", "failed"))
+    stream.write(
+        "rerun",
+        {
+            "nodeid": "tests/b_test.py::test_b",
+            "diagnostic_rerun": {"outcome": "failed", "duration_sec": 2.0},
+        },
+    )
+    stream.write("lifecycle", {"test": "test_a", "used_heap_mb": "12.00"})
+    if finish:
+        stream.write(
+            "session_end",
+            {"total_duration_sec": 9.5, "sections": {"heap_growth_modules": []}},
+        )
+    stream.close()
+
+
+def test_materialize_complete_session(tmp_path: Path) -> None:
+    """A finished stream rebuilds the exact baseline payload."""
+    path = tmp_path / metrics_stream.STREAM_FILE_NAME
+    _write_session(path, finish=True)
+
+    records, corrupt = metrics_stream.read_stream(path)
+    payload = metrics_stream.materialize(records, corrupt)
+
+    assert corrupt == 0
+    assert payload["timestamp"] == "2026-10-19T08:00:00Z"
+    assert payload["total_duration_sec"] == 9.5
+    assert payload["summary"] == {"passed": 1, "failed": 1, "skipped": 0}
+    assert [entry["nodeid"] for entry in payload["tests"]] == [
+        "tests/a_test.py::test_a",
+        "tests/b_test.py::test_b",
+    ]
+    assert payload["tests"][1]["diagnostic_rerun"]["duration_sec"] == 2.0
+    assert payload["lifecycle_metrics"] == [{"test": "test_a", "used_heap_mb": "12.00"}]
+    assert payload["heap_growth_modules"] == []
+    assert "recovered" not in payload
+
+
+def test_materialize_recovers_truncated_stream(tmp_path: Path) -> None:
+    """A killed session keeps every intact record and skips the torn last line."""
+    path = tmp_path / metrics_stream.STREAM_FILE_NAME
+    _write_session(path, finish=False)
+    with open(path, "a", encoding="utf-8") as stream:
+        stream.write('{"kind": "test", "t": 1.0, "data": {"nodeid": "tests/c')
+
+    records, corrupt = metrics_stream.read_stream(path)
+    payload = metrics_stream.materialize(records, corrupt)
+
+    assert corrupt == 1
+    assert len(payload["tests"]) == 2
+    assert payload["recovered"] == {
+        "complete": False,
+        "records": len(records),
+        "corrupt_lines": 1,
+    }
+    assert payload["total_duration_sec"] == pytest.approx(
+        records[-1]["t"] - records[0]["t"], abs=1e-3
+    )
+
+
+def test_recover_cli_writes_baseline(tmp_path: Path) -> None:
+    """The recover command materializes metrics_baseline.json from a stream."""
+    path = tmp_path / metrics_stream.STREAM_FILE_NAME
+    output = tmp_path / "metrics_baseline.json"
+    _write_session(path, finish=False)
+
+    assert (
+        metrics_stream.main(["recover", "--stream", str(path), "--output", str(output)])
+        == 0
+    )
+    data = json.loads(output.read_text(encoding="utf-8"))
+    assert data["summary"]["failed"] == 1
+    assert data["recovered"]["complete"] is False
+
+
+def test_recover_cli_fails_without_records(tmp_path: Path) -> None:
+    """Missing or empty streams are reported instead of writing an empty baseline."""
+    path = tmp_path / metrics_stream.STREAM_FILE_NAME
+    output = tmp_path / "metrics_baseline.json"
+    args = ["recover", "--stream", str(path), "--output", str(output)]
+
+    assert metrics_stream.main(args) == 1
+    path.write_text("not json\n", encoding="utf-8")
+    assert metrics_stream.main(args) == 1
+    assert not output.exists()
+
+
+def test_sessionfinish_materializes_from_stream(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Records streamed during the session become the exported baseline."""
+    monkeypatch.setattr(conftest, "ARTIFACTS_DIR", tmp_path)
+    monkeypatch.setattr(conftest, "_TEST_PROFILING_DATA", [])
+    monkeypatch.setattr(conftest, "_LIFECYCLE_METRICS", [])
+    monkeypatch.setattr(
+        conftest, "_SUMMARY_COUNTS", {"passed": 0, "failed": 0, "skipped": 0}
+    )
+    monkeypatch.setitem(conftest._SESSION_STATE, "artifact_writer", None)
+    monkeypatch.setitem(conftest._SESSION_STATE, "start_time", 0.0)
+    monkeypatch.setitem(conftest._SESSION_STATE, "timestamp", "2026-10-19T08:00:00Z")
+
+    stream = metrics_stream.MetricsStream(
+        tmp_path / metrics_stream.STREAM_FILE_NAME, fsync=False
+    )
+    monkeypatch.setitem(conftest._SESSION_STATE, "metrics_stream", stream)
+    conftest._stream_record("session_start", {"timestamp": "2026-10-19T08:00:00Z"})
+    entry = _entry("tests/a_test.py::test_a", "failed")
+    conftest._TEST_PROFILING_DATA.append(entry)
+    conftest._SUMMARY_COUNTS["failed"] += 1
+    conftest._stream_record("test", entry)
+    conftest._record_diagnostic_rerun(
+        entry["nodeid"],
+        [SimpleNamespace(failed=False, skipped=False, duration=0.75)],
+    )
+
+    conftest.pytest_sessionfinish(SimpleNamespace(), exitstatus=1)
+
+    assert conftest._SESSION_STATE["metrics_stream"] is None
+    data = json.loads((tmp_path / "metrics_baseline.json").read_text("utf-8"))
+    assert data["summary"] == {"passed": 0, "failed": 1, "skipped": 0}
+    assert data["tests"][0]["diagnostic_rerun"] == {
+        "outcome": "passed",
+        "duration_sec": 0.75,
+    }
+    kinds = [
+        json.loads(line)["kind"] for line in stream.path.read_text("utf-8").splitlines()
+    ]
+    assert kinds == ["session_start", "test", "rerun", "session_end"]
@@ -0,0 +1,136 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_navigation_orchestrator.py
+"""Unit tests for the single round-trip menu navigation orchestrator."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from tests import async_utils, conftest, test_utils
+
+
+class FakePage:
+    """Records evaluate calls and returns a canned orchestrator result."""
+
+    def __init__(self, result: dict[str, Any]) -> None:
+        self.result = result
+        self.calls: list[tuple[str, Any]] = []
+
+    def evaluate(self, expression: str, arg: Any = None) -> dict[str, Any]:
+        self.calls.append((expression, arg))
+        return self.result
+
+
+class FakeAsyncPage(FakePage):
+    """Async flavour of ``FakePage``."""
+
+    async def evaluate(self, expression: str, arg: Any = None) -> dict[str, Any]:
+        return FakePage.evaluate(self, expression, arg)
+
+
+def _labels(steps: list[dict[str, Any]]) -> list[str]:
+    return [step["label"] for step in steps]
+
+
+def test_start_game_steps_without_difficulty() -> None:
+    """Difficulty steps are only included when a difficulty is requested."""
+    steps = test_utils.start_game_navigation_steps(level_index=2)
+    assert _labels(steps) == [
+        "options",
+        "advanced",
+        "log_level",
+        "advanced_back",
+        "options_back",
+        "start",
+    ]
+    assert steps[2]["call"] == ["changeLogLevel", [2]]
+    assert steps[-1]["waitLog"] == ["hud successfully wired", "player ready"]
+
+
+def test_start_game_steps_with_difficulty() -> None:
+    """The gameplay sub-menu is visited between advanced and options back."""
+    steps = test_utils.start_game_navigation_steps(level_index=0, difficulty=1.5)
+    assert _labels(steps)[4:7] == ["gameplay", "difficulty", "gameplay_back"]
+    difficulty = steps[5]
+    assert difficulty["call"] == ["changeDifficulty", [1.5]]
+    assert difficulty["waitDisplay"] == ["#difficulty-slider", "block"]
+
+
+@pytest.mark.parametrize(("level", "expected"), [("debug", 0), ("WARNING", 2), (4, 4)])
+def test_resolve_log_level(level: str | int, expected: int) -> None:
+    """Names map case-insensitively; indexes pass through."""
+    assert test_utils.resolve_log_level(level) == expected
+
+
+def test_resolve_log_level_rejects_unknown_name() -> None:
+    """Unknown names raise ValueError like the original helper."""
+    with pytest.raises(ValueError, match="Unknown log level"):
+        test_utils.resolve_log_level("verbose")
+
+
+def test_run_navigation_script_single_evaluate_records_timings() -> None:
+    """All steps go out in one evaluate and timings land on request.node."""
+    page = FakePage({"ok": True, "steps": [{"label": "options", "ms": 12.345}]})
+    request = SimpleNamespace(node=SimpleNamespace())
+    steps = test_utils.start_game_navigation_steps(level_index=0)
+
+    timings = test_utils.run_navigation_script(page, steps, request=request)
+
+    assert len(page.calls) == 1
+    expression, (sent_steps, options) = page.calls[0]
+    assert "__navOrchestrator" in expression
+    assert sent_steps == steps
+    assert options == {
+        "waitTimeout": test_utils.TEST_TIMEOUT,
+        "logTimeout": test_utils.DEFAULT_TIMEOUT,
+    }
+    assert timings == [{"label": "options", "ms": 12.3}]
+    assert request.node._navigation_steps == timings
+
+
+def test_run_navigation_script_raises_on_failed_step() -> None:
+    """A failed step raises AssertionError but keeps the partial timings."""
+    page = FakePage(
+        {
+            "ok": False,
+            "failed": "start",
+            "error": "Timed out after 30000ms waiting for console log",
+            "steps": [{"label": "start", "ms": 30000.0}],
+        }
+    )
+    request = SimpleNamespace(node=SimpleNamespace())
+    with pytest.raises(AssertionError, match="Navigation step 'start' failed"):
+        test_utils.run_navigation_script(page, [], request=request)
+    assert request.node._navigation_steps == [{"label": "start", "ms": 30000.0}]
+
+
+def test_async_run_navigation_script() -> None:
+    """The async helper sends the same single evaluate."""
+    page = FakeAsyncPage({"ok": True, "steps": []})
+    result = asyncio.run(async_utils.run_navigation_script(page, [{"label": "x"}]))
+    assert result == []
+    assert page.calls[0][1][0] == [{"label": "x"}]
+
+
+def test_navigation_steps_recorded_in_profiling_entry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Per-step timings stored on the item are exported with the test entry."""
+    monkeypatch.setattr(conftest, "_TEST_PROFILING_DATA", [])
+    monkeypatch.setattr(conftest, "_PENDING_TEST_METRICS", {})
+    monkeypatch.setattr(conftest, "_FAILED_NODEIDS", set())
+    monkeypatch.setattr(conftest, "_SUMMARY_COUNTS", {"passed": 0})
+    rep = SimpleNamespace(duration=0.5, failed=False, skipped=False)
+    item = SimpleNamespace(
+        nodeid="tests/a_test.py::test_nav",
+        rep_setup=rep,
+        rep_call=rep,
+        _navigation_steps=[{"label": "options", "ms": 4.0}],
+    )
+    conftest._record_test_profiling(item, rep)
+    assert conftest._TEST_PROFILING_DATA[0]["navigation_steps"] == [
+        {"label": "options", "ms": 4.0}
+    ]
@@ -0,0 +1,184 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_perf_budget.py
+"""Unit tests for performance budget loading and enforcement."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from tests import conftest
+from tests.ci.test_frame_timing import FakeTerminalReporter
+from tests.perf import budget, frame_timing
+
+NODEID = "tests/weapon_firing_test.py::test_weapon_firing"
+
+
+def _budget_file(tmp_path: Path, **overrides: Any) -> Path:
+    data = {
+        "version": 1,
+        "global": {"wasm_boot_sec": 10.0, "frame_p95_ms": 50.0, "js_heap_mb": 100.0},
+        "tests": {
+            "tests/weapon_*::*": {"frame_p95_ms": 80.0},
+            "tests/weapon_firing_test.py::test_weapon_firing": {"js_heap_mb": None},
+        },
+        "environments": {"ci": {"global": {"wasm_boot_sec": 20.0}}},
+    }
+    data.update(overrides)
+    path = tmp_path / "perf_budget.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def _entry(**metrics: Any) -> dict[str, Any]:
+    return {"nodeid": NODEID, "duration_sec": 1.0, "outcome": "passed", **metrics}
+
+
+def test_checked_in_budget_loads_for_every_environment() -> None:
+    """The repository budget file is valid in each declared environment."""
+    data = json.loads(budget.DEFAULT_BUDGET_PATH.read_text(encoding="utf-8"))
+    for environment in ["", *data["environments"]]:
+        loaded = budget.load_budget(budget.DEFAULT_BUDGET_PATH, environment)
+        assert set(loaded["global"]) == set(budget.BUDGET_METRICS)
+
+
+def test_resolve_limits_layers_patterns_and_environment(tmp_path: Path) -> None:
+    """Test patterns override global ceilings and null removes one."""
+    path = _budget_file(tmp_path)
+
+    limits = budget.resolve_limits(budget.load_budget(path), NODEID)
+    assert limits == {
+        "wasm_boot_sec": (10.0, "global"),
+        "frame_p95_ms": (80.0, "tests/weapon_*::*"),
+    }
+    ci_limits = budget.resolve_limits(budget.load_budget(path, "ci"), NODEID)
+    assert ci_limits["wasm_boot_sec"] == (20.0, "global")
+    other = budget.resolve_limits(budget.load_budget(path), "tests/a_test.py::test_a")
+    assert other["js_heap_mb"] == (100.0, "global")
+
+
+@pytest.mark.parametrize(
+    ("overrides", "environment", "message"),
+    [
+        ({"version": 2}, "", "unsupported budget version"),
+        ({"global": {"cpu_sec": 1.0}}, "", "unknown budget metric 'cpu_sec'"),
+        ({"global": {"js_heap_mb": "lots"}}, "", "must be a number or null"),
+        ({}, "staging", "no budget environment 'staging' (declared: ci)"),
+    ],
+)
+def test_load_budget_rejects_invalid_files(
+    tmp_path: Path, overrides: dict[str, Any], environment: str, message: str
+) -> None:
+    """Malformed budgets fail loudly instead of silently enforcing nothing."""
+    with pytest.raises(
+        ValueError, match=message.replace("(", r"\(").replace(")", r"\)")
+    ):
+        budget.load_budget(_budget_file(tmp_path, **overrides), environment)
+
+
+def test_check_budget_reports_only_recorded_metrics(tmp_path: Path) -> None:
+    """Exceeded ceilings are reported; unrecorded metrics are not checked."""
+    loaded = budget.load_budget(_budget_file(tmp_path))
+    entry = _entry(
+        wasm_boot_duration_sec=12.5,
+        frame_timing={"p95_ms": 40.0},
+        memory_timeline={"timeline": [[0.0, 90.0, 32.0], [500.0, 150.0, 32.0]]},
+    )
+
+    violations = budget.check_budget(entry, loaded)
+
+    assert violations == [
+        {
+            "metric": "wasm_boot_sec",
+            "value": 12.5,
+            "limit": 10.0,
+            "unit": "s",
+            "source": "global",
+        }
+    ]
+    assert budget.describe_violation(violations[0]) == (
+        "wasm_boot_sec: 12.5 s > 10 s (+2.5 s, +25.0%) [global]"
+    )
+
+
+def test_peak_js_heap_and_transfer_bytes_are_extracted() -> None:
+    """JS heap uses the timeline peak; transfer bytes come from boot phases."""
+    entry = _entry(
+        memory_timeline={"timeline": [[0.0, 90.0, 1.0], [1.0, None, 1.0]]},
+        boot_phases={"transfer_bytes": 2048},
+    )
+    extract = {name: spec[1] for name, spec in budget.BUDGET_METRICS.items()}
+
+    assert extract["js_heap_mb"](entry) == 90.0
+    assert extract["transfer_bytes"](entry) == 2048
+    assert extract["frame_p95_ms"](entry) is None
+
+
+@pytest.fixture
+def profiling_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(conftest, "_FAILED_NODEIDS", set())
+    monkeypatch.setattr(conftest, "_TEST_PROFILING_DATA", [])
+    monkeypatch.setattr(conftest, "_LIFECYCLE_METRICS", [])
+    monkeypatch.setattr(
+        conftest, "_SUMMARY_COUNTS", {"passed": 0, "failed": 0, "skipped": 0}
+    )
+    frames = dict(frame_timing.summarize_frame_times([16.7] * 20), p95_ms=95.5)
+    monkeypatch.setattr(
+        conftest, "_PENDING_TEST_METRICS", {NODEID: {"frame_timing": frames}}
+    )
+    monkeypatch.setitem(
+        conftest._SESSION_STATE,
+        "perf_budget",
+        budget.load_budget(_budget_file(tmp_path), "ci"),
+    )
+
+
+def _record(outcome: str = "passed") -> pytest.TestReport:
+    teardown = pytest.TestReport(
+        NODEID, ("x", 0, "x"), {}, outcome, None, "teardown", duration=0.1
+    )
+    item = SimpleNamespace(
+        nodeid=NODEID,
+        rep_setup=SimpleNamespace(failed=False, skipped=False, duration=1.0),
+        rep_call=SimpleNamespace(failed=False, skipped=False, duration=2.0),
+    )
+    conftest._record_test_profiling(item, teardown)
+    return teardown
+
+
+def test_budget_violation_fails_teardown_with_diff(profiling_state: None) -> None:
+    """A passing test over budget is failed at teardown and counted as failed."""
+    teardown = _record()
+
+    assert teardown.failed
+    assert str(teardown.longrepr) == (
+        "Performance budget exceeded (environment: ci)\n"
+        "  frame_p95_ms: 95.5 ms > 80 ms (+15.5 ms, +19.4%) [tests/weapon_*::*]"
+    )
+    entry = conftest._TEST_PROFILING_DATA[0]
+    assert entry["outcome"] == "failed"
+    assert entry["budget_violations"][0]["metric"] == "frame_p95_ms"
+    assert conftest._SUMMARY_COUNTS["failed"] == 1
+    assert NODEID in conftest._FAILED_NODEIDS
+
+    reporter = FakeTerminalReporter()
+    conftest.pytest_terminal_summary(reporter, 1, None)
+    assert "== Performance Budget Violations ==" in reporter.lines
+    assert any("frame_p95_ms: 95.5 ms > 80 ms" in line for line in reporter.lines)
+
+
+def test_within_budget_leaves_report_untouched(
+    profiling_state: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tests inside every ceiling pass unchanged."""
+    monkeypatch.setattr(
+        conftest, "_PENDING_TEST_METRICS", {NODEID: {"frame_timing": {"p95_ms": 20.0}}}
+    )
+    teardown = _record()
+
+    assert teardown.passed
+    assert "budget_violations" not in conftest._TEST_PROFILING_DATA[0]
+    assert conftest._SUMMARY_COUNTS["passed"] == 1
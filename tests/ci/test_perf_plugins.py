@@ -0,0 +1,172 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_perf_plugins.py
+"""Unit tests for the per-test perf plugins and their registration in conftest."""
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from tests import conftest
+from tests.perf import frame_timing, proc_sampler
+
+ALWAYS_ON = [
+    "skylock-fixture-timing",
+    "skylock-frame-timing",
+    "skylock-engine-monitors",
+    "skylock-boot-phases",
+]
+
+
+class FakePluginManager:
+    """Records plugins registered by name."""
+
+    def __init__(self) -> None:
+        self.plugins: dict[str, Any] = {}
+
+    def register(self, plugin: Any, name: str) -> None:
+        """Store the plugin under its name."""
+        self.plugins[name] = plugin
+
+    def has_plugin(self, name: str) -> bool:
+        """Check whether a plugin was registered under the name."""
+        return name in self.plugins
+
+
+class FakeConfig:
+    """Minimal stand-in for pytest.Config with options and a plugin manager."""
+
+    def __init__(self, **options: Any) -> None:
+        self.options = options
+        self.pluginmanager = FakePluginManager()
+
+    def getoption(self, name: str, default: Any = None) -> Any:
+        """Return a registered option value or the default."""
+        return self.options.get(name, default)
+
+
+class FakePage:
+    """Serves a canned frame buffer and records evaluated scripts."""
+
+    def __init__(self, payload: Any = None, error: Exception | None = None) -> None:
+        self.payload = payload
+        self.error = error
+        self.scripts: list[str] = []
+
+    def evaluate(self, script: str) -> Any:
+        """Record the script and answer collect() calls."""
+        self.scripts.append(script)
+        if "collect()" not in script:
+            return None
+        if self.error is not None:
+            raise self.error
+        return self.payload
+
+
+@pytest.fixture(autouse=True)
+def isolate_plugin_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep plugins built by these tests out of the live session state."""
+    monkeypatch.setitem(conftest._SESSION_STATE, "fixture_timing", None)
+    monkeypatch.setitem(conftest._SESSION_STATE, "memory_timeline", None)
+
+
+def _run_call(plugin: Any, item: Any) -> None:
+    hook = plugin.pytest_runtest_call(item)
+    next(hook)
+    with pytest.raises(StopIteration):
+        hook.send(None)
+
+
+def test_only_always_on_plugins_registered_by_default() -> None:
+    """Opt-in samplers and profilers stay unregistered unless enabled."""
+    config = FakeConfig(
+        **{
+            "--heap-sample-ms": 0,
+            "--proc-sample-ms": 0,
+            "--cdp-profile": False,
+            "--profile-harness": False,
+        }
+    )
+
+    conftest._register_perf_plugins(config)
+
+    assert list(config.pluginmanager.plugins) == ALWAYS_ON
+    assert conftest._SESSION_STATE["memory_timeline"] is None
+    assert (
+        conftest._SESSION_STATE["fixture_timing"]
+        is config.pluginmanager.plugins["skylock-fixture-timing"]
+    )
+
+
+def test_enabled_options_register_their_plugins() -> None:
+    """Each opt-in feature registers its plugin when its option is set."""
+    config = FakeConfig(
+        **{
+            "--heap-sample-ms": 500,
+            "--proc-sample-ms": 250,
+            "--cdp-profile": True,
+            "--profile-harness": True,
+        }
+    )
+
+    conftest._register_perf_plugins(config)
+
+    registered = set(config.pluginmanager.plugins)
+    assert registered >= {
+        "skylock-memory-timeline",
+        "skylock-cdp-profile",
+        "skylock-harness-profiler",
+    }
+    assert ("skylock-proc-sampler" in registered) is proc_sampler.PROC_AVAILABLE
+    assert conftest._SESSION_STATE["memory_timeline"] is not None
+
+
+def test_cdp_marker_registers_profiler_after_collection() -> None:
+    """A cdp_profile-marked test enables marker-scoped CDP profiling."""
+    marked = SimpleNamespace(get_closest_marker=lambda name: name == "cdp_profile")
+    plain = SimpleNamespace(get_closest_marker=lambda name: None)
+    config = FakeConfig(**{"--soak-minutes": 1.0})
+
+    conftest.pytest_collection_modifyitems(config, [plain])
+    assert not config.pluginmanager.has_plugin("skylock-cdp-profile")
+
+    conftest.pytest_collection_modifyitems(config, [plain, marked])
+    plugin = config.pluginmanager.plugins["skylock-cdp-profile"]
+    assert plugin._all_tests is False
+
+
+def test_page_plugin_resets_before_and_collects_after_the_call() -> None:
+    """Frame samples are reset before the test body and attached after it."""
+    attached = []
+    plugin = frame_timing.FrameTimingPlugin(lambda *args: attached.append(args))
+    page = FakePage({"samples": [16.7] * 10, "total": 10})
+    item = SimpleNamespace(nodeid="t::a", funcargs={"shared_page": page})
+
+    _run_call(plugin, item)
+
+    assert "reset()" in page.scripts[0] and "collect()" in page.scripts[1]
+    assert attached[0][:2] == ("t::a", "frame_timing")
+    assert attached[0][2]["frames"] == 10
+
+
+def test_page_plugin_skips_tests_without_a_page() -> None:
+    """Tests that never requested a page cost nothing and attach nothing."""
+    attached = []
+    plugin = frame_timing.FrameTimingPlugin(lambda *args: attached.append(args))
+
+    _run_call(plugin, SimpleNamespace(nodeid="t::a", funcargs={"tmp_path": "x"}))
+
+    assert attached == []
+
+
+def test_page_plugin_warns_when_collection_fails() -> None:
+    """A failing read-back is reported as a warning, not a test error."""
+    attached = []
+    plugin = frame_timing.FrameTimingPlugin(lambda *args: attached.append(args))
+    page = FakePage(error=RuntimeError("page closed"))
+    item = SimpleNamespace(nodeid="t::a", funcargs={"page": page})
+
+    with pytest.warns(UserWarning, match="Frame timing capture failed: page closed"):
+        _run_call(plugin, item)
+    assert attached == []
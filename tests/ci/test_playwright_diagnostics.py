@@ -30,15 +30,20 @@ def _isolate_conftest_state(tmp_path: Path):
     original_profiling_data = list(conf._TEST_PROFILING_DATA)
     original_summary_counts = dict(conf._SUMMARY_COUNTS)
     original_artifacts_dir = conf.ARTIFACTS_DIR
+    original_writer = conf._SESSION_STATE.get("artifact_writer")
 
     conf._FAILED_NODEIDS.clear()
     conf._TEST_PROFILING_DATA.clear()
     conf._SUMMARY_COUNTS.clear()
     conf._SUMMARY_COUNTS.update({"passed": 0, "failed": 0, "skipped": 0})
     conf.ARTIFACTS_DIR = tmp_path
+    # These tests pin the synchronous artifact path
+    conf._SESSION_STATE["artifact_writer"] = None
 
     yield conf
 
+    conf._SESSION_STATE["artifact_writer"] = original_writer
+
     conf._FAILED_NODEIDS.clear()
     conf._FAILED_NODEIDS.update(original_failed_nodeids)
     conf._TEST_PROFILING_DATA.clear()
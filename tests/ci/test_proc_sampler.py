@@ -0,0 +1,149 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_proc_sampler.py
+"""Unit tests for /proc sampling of the Chromium process tree."""
+
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tests import conftest
+from tests.ci.test_frame_timing import FakeTerminalReporter
+from tests.perf import proc_sampler
+
+
+def _stat(pid: int, comm: str, ppid: int, utime: int, stime: int, rss: int) -> str:
+    fields = ["S", str(ppid)] + ["0"] * 9 + [str(utime), str(stime)] + ["0"] * 8
+    fields += [str(rss)] + ["0"] * 20
+    return f"{pid} ({comm}) " + " ".join(fields)
+
+
+def _fake_proc(root: Path, processes: dict[int, tuple[str, int, int, int]]) -> Path:
+    for pid, (comm, ppid, ticks, rss) in processes.items():
+        (root / str(pid)).mkdir(parents=True, exist_ok=True)
+        (root / str(pid) / "stat").write_text(_stat(pid, comm, ppid, ticks, 0, rss))
+    (root / "self").mkdir(exist_ok=True)
+    return root
+
+
+def test_parse_stat_handles_parentheses_in_command_name() -> None:
+    """Fields are read after the last ')' so odd command names parse."""
+    text = _stat(42, "chrome (Renderer) x", 7, 120, 30, 2500)
+    assert proc_sampler.parse_stat(text) == ("chrome (Renderer) x", 7, 150, 2500)
+
+
+def test_find_browser_roots_returns_topmost_chromium(tmp_path: Path) -> None:
+    """Only Chromium processes whose parent is not Chromium are roots."""
+    table = {
+        100: ("python", 1, 0, 0),
+        101: ("node", 100, 0, 0),
+        102: ("chrome", 101, 0, 0),
+        103: ("chrome", 102, 0, 0),
+        104: ("chrome_crashpad", 101, 0, 0),
+        200: ("chrome", 1, 0, 0),
+    }
+    assert proc_sampler.find_browser_roots(table, ancestor=100) == {102, 104}
+    assert proc_sampler.descendants(table, {102}) == {102, 103}
+
+
+def test_sampler_accumulates_cpu_across_exited_processes(tmp_path: Path) -> None:
+    """CPU of a renderer that exits mid-test stays counted at its last reading."""
+    proc = _fake_proc(
+        tmp_path,
+        {10: ("chrome", 1, 100, 1000), 11: ("chrome", 10, 50, 3000)},
+    )
+    sampler = proc_sampler.ProcessTreeSampler(lambda: {10}, 60.0, proc_root=proc)
+    sampler.sample()
+    _fake_proc(proc, {10: ("chrome", 1, 150, 1000), 11: ("chrome", 10, 80, 5000)})
+    sampler.sample()
+    (proc / "11" / "stat").unlink()
+    (proc / "11").rmdir()
+    sampler.sample()
+
+    assert [sample[1:] for sample in sampler.samples] == [
+        (0, 4000, 2),
+        (80, 6000, 2),
+        (80, 1000, 1),
+    ]
+
+
+def test_summarize_process_samples_peak_and_average() -> None:
+    """CPU utilisation is per core; RSS is averaged over samples that saw the tree."""
+    tick = proc_sampler._CLK_TCK
+    pages_per_mb = 1048576 / proc_sampler._PAGE_SIZE
+    samples = [
+        (0.0, 0, int(100 * pages_per_mb), 3),
+        (1.0, tick // 2, int(300 * pages_per_mb), 4),
+        (2.0, 2 * tick, int(200 * pages_per_mb), 4),
+    ]
+    summary = proc_sampler.summarize_process_samples(samples)
+
+    assert summary == {
+        "samples": 3,
+        "processes_peak": 4,
+        "cpu_sec": 2.0,
+        "cpu_avg_percent": 100.0,
+        "cpu_peak_percent": 150.0,
+        "rss_avg_mb": 200.0,
+        "rss_peak_mb": 300.0,
+    }
+    assert (
+        proc_sampler.summarize_process_samples([(0.0, 0, 0, 0), (1.0, 0, 0, 0)]) is None
+    )
+
+
+@pytest.mark.skipif(not proc_sampler.PROC_AVAILABLE, reason="requires /proc")
+def test_sampler_measures_a_real_child_process() -> None:
+    """A busy child process is found by name and its CPU time is measured."""
+    child = subprocess.Popen(["sh", "-c", "while :; do :; done"])
+    try:
+        roots = proc_sampler.find_browser_roots(hint="sh")
+        assert child.pid in roots
+        sampler = proc_sampler.ProcessTreeSampler(lambda: {child.pid}, 0.05)
+        sampler.start()
+        end = proc_sampler.time.perf_counter() + 0.5
+        while proc_sampler.time.perf_counter() < end:
+            pass
+        summary = sampler.stop()
+    finally:
+        child.kill()
+        child.wait()
+
+    assert summary["processes_peak"] == 1
+    assert summary["samples"] >= 3
+    assert summary["cpu_sec"] > 0
+    assert summary["rss_peak_mb"] > 0
+
+
+def test_terminal_summary_lists_process_usage(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Per-test Chromium CPU and RSS get their own terminal section."""
+    monkeypatch.setattr(conftest, "_LIFECYCLE_METRICS", [])
+    monkeypatch.setattr(
+        conftest,
+        "_TEST_PROFILING_DATA",
+        [
+            {
+                "nodeid": "tests/a_test.py::test_flow",
+                "duration_sec": 3.0,
+                "outcome": "passed",
+                "browser_process": {
+                    "samples": 12,
+                    "processes_peak": 6,
+                    "cpu_sec": 4.2,
+                    "cpu_avg_percent": 140.0,
+                    "cpu_peak_percent": 210.5,
+                    "rss_avg_mb": 480.2,
+                    "rss_peak_mb": 512.9,
+                },
+            }
+        ],
+    )
+    reporter = FakeTerminalReporter()
+    conftest.pytest_terminal_summary(reporter, 0, SimpleNamespace())
+
+    assert "== Chromium Process Usage ==" in reporter.lines
+    row = next(line for line in reporter.lines if "test_flow" in line and "CPU" in line)
+    assert "CPU 4.2s (avg 140.0%, peak 210.5%)" in row
+    assert "RSS avg 480.2 MB, peak 512.9 MB" in row
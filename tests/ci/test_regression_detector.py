@@ -0,0 +1,124 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_regression_detector.py
+"""Unit tests for the statistical performance regression detector."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tests.perf import metrics_history, regression_detector
+
+NODEID = "tests/a_test.py::test_flow"
+
+
+def _write_runs(directory: Path, durations: list[float], boot: float = 1.0) -> list:
+    paths = []
+    for index, duration in enumerate(durations):
+        path = directory / f"metrics_baseline_{index}.json"
+        payload = {
+            "timestamp": f"2026-01-01T00:00:0{index}Z",
+            "summary": {"passed": 1},
+            "tests": [
+                {
+                    "nodeid": NODEID,
+                    "duration_sec": duration,
+                    "outcome": "passed",
+                    "wasm_boot_duration_sec": boot,
+                },
+                {"nodeid": "tests/a_test.py::test_broken", "outcome": "failed"},
+            ],
+        }
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_mann_whitney_exact_small_samples() -> None:
+    """Complete separation of 3 vs 3 gives the exact p = 1/20."""
+    p_value = regression_detector.mann_whitney_greater([1, 2, 3], [4, 5, 6])
+    assert p_value == pytest.approx(0.05)
+    assert regression_detector.mann_whitney_greater([4, 5, 6], [1, 2, 3]) == 1.0
+
+
+def test_mann_whitney_ties_use_normal_approximation() -> None:
+    """Tied samples fall back to the tie-corrected normal approximation."""
+    p_value = regression_detector.mann_whitney_greater(
+        [1, 1, 2, 2, 3, 3, 4, 4, 5], [3, 3, 4, 4, 5, 5, 6, 6, 7]
+    )
+    assert 0.001 < p_value < 0.02
+
+
+def test_bootstrap_ci_is_deterministic_and_excludes_zero() -> None:
+    """A clear shift yields a positive interval; the seed makes it stable."""
+    baseline = [10.0, 10.2, 9.9, 10.1, 10.0]
+    candidate = [12.0, 12.1, 11.9, 12.2, 12.0]
+    ci = regression_detector.bootstrap_median_diff_ci(baseline, candidate)
+    assert ci == regression_detector.bootstrap_median_diff_ci(baseline, candidate)
+    assert 0 < ci[0] <= 2.0 <= ci[1]
+
+
+@pytest.mark.parametrize("method", ["mannwhitney", "bootstrap"])
+def test_compare_samples_requires_practical_change(method: str) -> None:
+    """Significant but tiny shifts are not regressions."""
+    baseline = [10.0, 10.01, 10.02, 10.03]
+    tiny = [10.05, 10.06, 10.07, 10.08]
+    large = [12.0, 12.1, 12.2, 12.3]
+    small = regression_detector.compare_samples(baseline, tiny, 0.1, method=method)
+    assert small["significant"] and not small["regression"]
+    big = regression_detector.compare_samples(baseline, large, 0.1, method=method)
+    assert big["regression"] and big["status"] == "regression"
+
+
+def test_compare_samples_insufficient() -> None:
+    """Single runs cannot be compared statistically."""
+    result = regression_detector.compare_samples([1.0], [5.0], 0.1)
+    assert result == {
+        "n_baseline": 1,
+        "n_candidate": 1,
+        "regression": False,
+        "status": "insufficient",
+    }
+
+
+def test_load_sample_sets_skips_failed_tests(tmp_path: Path) -> None:
+    """Only passed tests contribute samples."""
+    samples = regression_detector.load_sample_sets(
+        _write_runs(tmp_path, [1.0, 2.0]), ["duration_sec"]
+    )
+    assert samples == {(NODEID, "duration_sec"): [1.0, 2.0]}
+
+
+def test_cli_exits_non_zero_on_regression(tmp_path: Path, capsys) -> None:
+    """Duration regressions gate; unchanged boot times do not."""
+    (tmp_path / "base").mkdir()
+    (tmp_path / "cand").mkdir()
+    base = _write_runs(tmp_path / "base", [10.0, 10.2, 9.8, 10.1])
+    cand = _write_runs(tmp_path / "cand", [13.0, 13.2, 12.8, 13.1])
+    output = tmp_path / "report.json"
+    argv = ["--baseline", *map(str, base), "--candidate", *map(str, cand)]
+    assert regression_detector.main(argv + ["--output", str(output)]) == 1
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["regressions"] == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+    assert (
+        regression_detector.main(
+            ["--baseline", *map(str, base), "--candidate", *map(str, base)]
+            + ["--output", str(output)]
+        )
+        == 0
+    )
+
+
+def test_cli_reads_commits_from_history_db(tmp_path: Path) -> None:
+    """Commits in the metrics history database can be compared directly."""
+    db = tmp_path / "history.sqlite"
+    conn = metrics_history.connect(db)
+    for commit, durations in (("old", [5.0, 5.1, 4.9]), ("new", [5.0, 5.05, 4.95])):
+        for path in _write_runs(tmp_path, durations):
+            metrics_history.ingest_file(conn, path, commit)
+    conn.close()
+    argv = ["--db", str(db), "--baseline-commit", "old", "--candidate-commit", "new"]
+    assert regression_detector.main(argv + ["--output", str(tmp_path / "r.json")]) == 0
@@ -0,0 +1,102 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_settings_seeding.py
+"""Unit tests for pre-seeding user://settings.cfg into IDBFS before boot."""
+
+import re
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests import test_utils
+
+PROJECT_GODOT = Path(__file__).resolve().parents[2] / "project.godot"
+
+
+class FakePage:
+    """Records routing, navigation, and evaluate calls."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, Any]] = []
+
+    def route(self, url: str, handler: Any) -> None:
+        self.events.append(("route", url))
+
+    def unroute(self, url: str, handler: Any) -> None:
+        self.events.append(("unroute", url))
+
+    def goto(self, url: str, **_: Any) -> None:
+        self.events.append(("goto", url))
+
+    def evaluate(self, script: str, arg: Any = None) -> int:
+        self.events.append(("evaluate", arg))
+        return 1
+
+
+def test_build_settings_config_formats_variants() -> None:
+    """Values are written as Godot Variant literals; log level names resolve."""
+    text = test_utils.build_settings_config(
+        {
+            "difficulty": 2.0,
+            "log_level": "warning",
+            "enable_debug_logging": False,
+            "max_fuel": 150,
+        }
+    )
+    assert text == (
+        "[Settings]\n\n"
+        "difficulty=2.0\n"
+        "log_level=2\n"
+        "enable_debug_logging=false\n"
+        "max_fuel=150\n"
+    )
+
+
+def test_seed_settings_config_writes_before_boot() -> None:
+    """A routed same-origin blank page is used to write IDBFS, then unrouted."""
+    page = FakePage()
+    test_utils.seed_settings_config(
+        page, {"difficulty": 0.5}, url="http://localhost:8080/index.html"
+    )
+    seed_url = "http://localhost:8080/__seed_settings__.html"
+    assert [event[0] for event in page.events] == [
+        "route",
+        "goto",
+        "evaluate",
+        "unroute",
+    ]
+    assert page.events[0][1] == seed_url
+    payload = page.events[2][1]
+    assert payload["database"] == test_utils.IDBFS_DATABASE
+    assert payload["dir"] == test_utils.GODOT_USER_DIR
+    assert payload["files"] == {"settings.cfg": "[Settings]\n\ndifficulty=0.5\n"}
+
+
+def test_seed_settings_config_rejects_relative_url() -> None:
+    """An origin is required to address the game's IndexedDB."""
+    with pytest.raises(ValueError, match="origin"):
+        test_utils.seed_settings_config(FakePage(), {}, url="index.html")
+
+
+def test_user_dir_matches_project_name() -> None:
+    """user:// maps to the app_userdata directory named after the project."""
+    match = re.search(
+        r'^config/name="([^"]+)"', PROJECT_GODOT.read_text(encoding="utf-8"), re.M
+    )
+    assert match is not None
+    assert test_utils.GODOT_USER_DIR.endswith(f"/app_userdata/{match.group(1)}")
+
+
+def test_start_preseeded_game_only_presses_start(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Seeded games skip the options menus and only run the Start step."""
+    sent: list[list[dict[str, Any]]] = []
+    monkeypatch.setattr(
+        test_utils,
+        "run_navigation_script",
+        lambda page, steps, request=None: sent.append(steps),
+    )
+    test_utils.start_preseeded_game(object())
+    assert [step["label"] for step in sent[0]] == ["start"]
@@ -0,0 +1,120 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_shard_merge.py
+"""Unit tests for the cross-shard metrics merger."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from tests.perf import shard_merge
+
+BOOT = "tests/boot_test.py::test_boot"
+MENU = "tests/menu_test.py::test_menu"
+SALT = "tests/ci/test_salt.py::test_salt"
+
+
+def _payload(timestamp: str, total: float, tests: dict[str, float]) -> dict[str, Any]:
+    return {
+        "timestamp": timestamp,
+        "total_duration_sec": total,
+        "summary": {"passed": len(tests), "failed": 0, "skipped": 0},
+        "tests": [
+            {"nodeid": nodeid, "duration_sec": duration, "outcome": "passed"}
+            for nodeid, duration in tests.items()
+        ],
+    }
+
+
+def _write(path: Path, payload: dict[str, Any]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def _runs(tmp_path: Path) -> list[dict[str, Any]]:
+    paths = [
+        _write(
+            tmp_path / "run1" / "metrics_baseline_core.json",
+            _payload("t1", 100.0, {BOOT: 40.0, MENU: 30.0}),
+        ),
+        _write(
+            tmp_path / "run2" / "metrics_baseline_core.json",
+            _payload("t2", 120.0, {BOOT: 50.0, MENU: 35.0}),
+        ),
+        _write(
+            tmp_path / "run3" / "metrics_baseline_core.json",
+            _payload("t3", 110.0, {BOOT: 45.0, MENU: 32.0}),
+        ),
+        _write(
+            tmp_path / "run1" / "metrics_baseline_ci.json",
+            _payload("t1", 20.0, {SALT: 5.0}),
+        ),
+        # A second download of the same ci run is ignored
+        _write(
+            tmp_path / "run1" / "ci" / "metrics_baseline_ci.json",
+            _payload("t1", 20.0, {SALT: 5.0}),
+        ),
+    ]
+    return shard_merge.load_shard_runs(paths)
+
+
+def test_load_shard_runs_dedupes_copies(tmp_path: Path) -> None:
+    """The same shard run found twice is only merged once."""
+    runs = _runs(tmp_path)
+
+    assert [run["shard"] for run in runs] == ["core", "core", "core", "ci"]
+
+
+def test_merge_reports_percentiles_per_test(tmp_path: Path) -> None:
+    """Repeated runs produce nearest-rank p50/p90/max per test."""
+    report = shard_merge.merge_shard_runs(_runs(tmp_path))
+
+    boot = report["tests"][0]
+    assert boot["nodeid"] == BOOT
+    assert boot["shard"] == "core"
+    assert boot["runs"] == 3
+    assert boot["outcomes"] == {"passed": 3}
+    assert (boot["p50_sec"], boot["p90_sec"], boot["max_sec"]) == (45.0, 50.0, 50.0)
+
+
+def test_merge_estimates_critical_path_and_imbalance(tmp_path: Path) -> None:
+    """The slowest shard bounds the suite; imbalance compares shard p50 times."""
+    report = shard_merge.merge_shard_runs(_runs(tmp_path), top=1)
+
+    core = report["shards"]["core"]
+    assert core["p50_sec"] == 110.0
+    assert core["test_sec"] == 77.0
+    assert core["overhead_sec"] == 33.0
+
+    critical = report["critical_path"]
+    assert critical["shard"] == "core"
+    assert critical["estimated_wall_sec"] == 110.0
+    assert critical["estimated_wall_p90_sec"] == 120.0
+    assert critical["slowest_tests"] == [
+        {"nodeid": BOOT, "p50_sec": 45.0, "share": round(45.0 / 110.0, 4)}
+    ]
+
+    imbalance = report["imbalance"]
+    assert imbalance["mean_sec"] == 65.0
+    assert imbalance["spread_sec"] == 90.0
+    assert imbalance["ratio"] == round(110.0 / 65.0, 4)
+    assert imbalance["idle_runner_sec"] == 90.0
+
+
+def test_cli_writes_json_and_markdown(tmp_path: Path) -> None:
+    """The CLI writes both report formats and fails when nothing was found."""
+    _runs(tmp_path)
+    out_json = tmp_path / "report.json"
+    out_md = tmp_path / "report.md"
+    paths = [str(path) for path in sorted(tmp_path.glob("run*/metrics_baseline_*"))]
+
+    args = ["--json", str(out_json), "--markdown", str(out_md)]
+    assert shard_merge.main(paths + args) == 0
+
+    assert json.loads(out_json.read_text("utf-8"))["critical_path"]["shard"] == "core"
+    markdown = out_md.read_text("utf-8")
+    assert "**Critical path:** `core` shard" in markdown
+    assert f"| `{BOOT}` | core | 3 | 45.0 | 50.0 | 50.0 |" in markdown
+
+    assert shard_merge.main([str(tmp_path / "missing.json")] + args) == 1
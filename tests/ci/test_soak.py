@@ -0,0 +1,132 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_soak.py
+"""Unit tests for the long-running soak mode and its drift detection."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from tests import conftest
+from tests.ci.test_frame_timing import FakeTerminalReporter
+from tests.perf import soak
+
+
+def _samples(growth: dict[str, float], minutes: int = 10) -> list[dict[str, Any]]:
+    """One sample per minute with linear growth per series."""
+    return [
+        {
+            "t_sec": minute * 60.0,
+            **{
+                key: 100.0 + growth.get(key, 0.0) * minute
+                for key in soak.SOAK_DRIFT_THRESHOLDS
+            },
+        }
+        for minute in range(minutes + 1)
+    ]
+
+
+def test_fit_soak_trends_skips_warmup() -> None:
+    """Slopes are per minute and ignore warm-up samples."""
+    samples = _samples({"node_count": 2.0, "wasm_heap_mb": 0.0})
+    samples[0]["wasm_heap_mb"] = 0.0  # boot transient
+    trends = soak.fit_soak_trends(samples, warmup_sec=60.0)
+    assert trends["node_count"] == pytest.approx(2.0)
+    assert trends["wasm_heap_mb"] == pytest.approx(0.0)
+
+
+def test_fit_soak_trends_needs_enough_samples() -> None:
+    """Too few steady-state samples yield no trend rather than noise."""
+    trends = soak.fit_soak_trends(_samples({}, minutes=3), warmup_sec=60.0)
+    assert set(trends.values()) == {None}
+
+
+def test_find_drift_flags_series_over_threshold() -> None:
+    """Only slopes above their limit are reported."""
+    trends = soak.fit_soak_trends(
+        _samples({"orphan_node_count": 1.0, "node_count": 1.0})
+    )
+    violations = soak.find_drift(trends)
+    assert len(violations) == 1
+    assert violations[0].startswith("orphan_node_count grew +1.000/min")
+
+
+def test_write_soak_timeseries_flattens_samples(tmp_path: Path) -> None:
+    """The artifact stores column names once and one row per sample."""
+    report = {"minutes": 1, "samples": _samples({}, minutes=1)}
+    path = soak.write_soak_timeseries(report, tmp_path / "soak.json")
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    assert payload["columns"] == list(soak.SOAK_COLUMNS)
+    assert payload["samples"][1][0] == 60.0
+    assert len(payload["samples"][1]) == len(soak.SOAK_COLUMNS)
+
+
+def test_run_soak_loops_scenario_and_samples(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The scenario loops until the deadline with samples between loops."""
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(soak, "time", SimpleNamespace(perf_counter=lambda: clock.now))
+
+    def fake_replay(page: Any, recording: dict[str, Any]) -> dict[str, Any]:
+        clock.now += 11.0
+        return {"max_drift_frames": 1, "missing_events": 0}
+
+    def fake_sample(page: Any, t_sec: float, frames_total: Any) -> tuple:
+        return {"t_sec": t_sec, "node_count": 10}, 0
+
+    monkeypatch.setattr(soak.input_replay, "replay_inputs", fake_replay)
+    monkeypatch.setattr(soak, "take_soak_sample", fake_sample)
+
+    report = soak.run_soak(object(), minutes=1.0, interval_sec=30.0)
+
+    assert report["loops"] == 6
+    assert [sample["t_sec"] for sample in report["samples"]] == [0.0, 33.0, 66.0]
+    assert report["max_drift_frames"] == 1
+    assert report["missing_events"] == 0
+    assert report["violations"] == []
+
+
+def test_soak_tests_skipped_without_minutes() -> None:
+    """Soak-marked items get a skip marker unless --soak-minutes is set."""
+    item = SimpleNamespace(
+        markers=[],
+        get_closest_marker=lambda name: name == "soak" or None,
+    )
+    item.add_marker = item.markers.append
+    config = SimpleNamespace(getoption=lambda name, default=None: 0.0)
+    conftest.pytest_collection_modifyitems(config, [item])
+    assert item.markers[0].name == "skip"
+
+
+def test_terminal_summary_lists_soak_trends(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fitted slopes and drift violations appear in the summary."""
+    monkeypatch.setattr(
+        conftest,
+        "_TEST_PROFILING_DATA",
+        [
+            {
+                "nodeid": "tests/soak_test.py::test_gameplay_soak",
+                "duration_sec": 600.0,
+                "outcome": "failed",
+                "wasm_boot_duration_sec": 0.0,
+                "teardown_sec": 0.1,
+                "soak": {
+                    "minutes": 10.0,
+                    "loops": 54,
+                    "trends": {"node_count": 0.1, "orphan_node_count": 1.0},
+                    "violations": ["orphan_node_count grew +1.000/min"],
+                    "artifact": "artifacts/soak_timeseries.json",
+                },
+            }
+        ],
+    )
+    monkeypatch.setattr(conftest, "_LIFECYCLE_METRICS", [])
+    reporter = FakeTerminalReporter()
+    conftest.pytest_terminal_summary(reporter, 0, None)
+    assert "== Soak Resource Trends ==" in reporter.lines
+    row = next(line for line in reporter.lines if "test_gameplay_soak" in line)
+    assert "10.0 min, 54 loops" in row
+    assert "node_count +0.10/min" in row
+    assert any("drift: orphan_node_count" in line for line in reporter.lines)
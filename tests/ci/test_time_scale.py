@@ -0,0 +1,40 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/ci/test_time_scale.py
+"""Unit tests for the window.setTimeScale hook and its harness helper."""
+
+from pathlib import Path
+from typing import Any
+
+from tests import test_utils
+
+GLOBALS_PATH = Path(__file__).resolve().parents[2] / "scripts" / "core" / "globals.gd"
+
+
+class FakePage:
+    """Echoes Globals' clamped time scale."""
+
+    def __init__(self) -> None:
+        self.evaluated: list[Any] = []
+
+    def evaluate(self, script: str, arg: Any = None) -> float:
+        assert "window.setTimeScale([scale])" in script
+        self.evaluated.append(arg)
+        return min(max(arg, 0.0), 16.0)
+
+
+def test_set_time_scale_returns_applied_scale() -> None:
+    """The helper returns the scale Globals actually applied."""
+    page = FakePage()
+    assert test_utils.set_time_scale(page, 4) == 4.0
+    assert test_utils.set_time_scale(page, 100.0) == 16.0
+    assert page.evaluated == [4, 100.0]
+
+
+def test_globals_binds_set_time_scale_and_resets_it() -> None:
+    """Globals exposes window.setTimeScale and restores 1.0 on in-place reset."""
+    source = GLOBALS_PATH.read_text(encoding="utf-8")
+    assert "js_window.setTimeScale" in source
+    assert "Engine.time_scale = clampf(scale, 0.0, MAX_TIME_SCALE)" in source
+    reset_body = source.split("func reset_game_state()", 1)[1].split("\nfunc ", 1)[0]
+    assert "set_time_scale(1.0)" in reset_body
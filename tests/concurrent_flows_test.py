@@ -0,0 +1,50 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/concurrent_flows_test.py
+"""
+Concurrent Flows Test (Playwright async API, Python)
+====================================================
+
+Overview
+--------
+Boots two isolated game pages in one browser and drives independent
+settings-and-start flows on them concurrently through ``tests.async_utils``.
+Each page runs its own context, so difficulty changes on one page must not
+leak into the other.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from tests.async_utils import start_game_and_wait_ready
+
+
+@pytest.mark.asyncio
+async def test_concurrent_independent_flows(async_game_pages: Any) -> None:
+    """Two pages reach gameplay concurrently with different difficulties."""
+    pages = await async_game_pages(2)
+    logs: list[list[dict[str, str]]] = [[] for _ in pages]
+    for page_logs, page_obj in zip(logs, pages):
+        page_obj.on(
+            "console",
+            lambda msg, sink=page_logs: sink.append(
+                {"type": msg.type, "text": msg.text}
+            ),
+        )
+
+    difficulties = (2.0, 0.5)
+    await asyncio.gather(
+        *(
+            start_game_and_wait_ready(page_obj, page_logs, difficulty=difficulty)
+            for page_obj, page_logs, difficulty in zip(pages, logs, difficulties)
+        )
+    )
+
+    for page_obj, page_logs, difficulty in zip(pages, logs, difficulties):
+        await page_obj.wait_for_function("() => typeof window.currentFuel === 'number'")
+        assert any(
+            f"setting 'difficulty' updated to: {difficulty}" in log["text"].lower()
+            for log in page_logs
+        ), f"Difficulty {difficulty} was not applied on its own page"
@@ -3,6 +3,7 @@
 # tests/conftest.py
 """Shared pytest fixtures, configs, and metrics for E2E tests."""
 
+import asyncio
 import json
 import os
 import re
@@ -11,9 +12,15 @@ import subprocess
 import time
 import warnings
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, AsyncGenerator, Awaitable, Callable, Generator
 
 import pytest
+import pytest_asyncio
+from _pytest.runner import runtestprotocol
+from playwright.async_api import Browser as AsyncBrowser
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.async_api import Page as AsyncPage
+from playwright.async_api import async_playwright
 from playwright.sync_api import (
     Browser,
     BrowserContext,
@@ -22,7 +29,30 @@ from playwright.sync_api import (
     sync_playwright,
 )
 
-from tests.test_utils import init_page_and_wait_ready
+from tests import async_utils
+from tests.perf import (
+    artifact_writer,
+    boot_phases,
+    budget,
+    cdp_profiler,
+    engine_monitors,
+    fixture_timing,
+    frame_timing,
+    harness_profiler,
+    input_replay,
+    memory_sampling,
+    metrics_stream,
+    proc_sampler,
+    soak,
+)
+from tests.perf.artifact_writer import DEFAULT_WORKERS, ArtifactWriter
+from tests.test_utils import (
+    CHROMIUM_LAUNCH_ARGS,
+    init_cdp_coverage,
+    init_page_and_wait_ready,
+    reset_game_state,
+    seed_settings_config,
+)
 
 # Project paths and artifacts configuration
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -36,6 +66,13 @@ _LIFECYCLE_METRICS = []
 _SESSION_STATE: dict[str, Any] = {
     "start_time": 0.0,
     "timestamp": "",
+    "diagnostic_rerun": None,
+    "artifact_writer": None,
+    "fixture_timing": None,
+    "memory_timeline": None,
+    "metrics_stream": None,
+    "perf_budget": None,
+    "browser_pids": set(),
 }
 _TEST_PROFILING_DATA: list[dict] = []
 _SUMMARY_COUNTS = {"passed": 0, "failed": 0, "skipped": 0}
@@ -46,6 +83,32 @@ _TRACKED_PIDS: set[int] = set()
 # Set of failed test node IDs across session execution
 _FAILED_NODEIDS: set[str] = set()
 
+# Diagnostics capture modes: "always" records video/tracing for every context,
+# "on-retry" runs lean and reruns failures once with full diagnostics enabled.
+DIAGNOSTICS_MODES = ("always", "on-retry")
+
+# Routes blocking dialogs to the console so Godot's main loop never stalls
+DIALOG_STUB_SCRIPT = """
+    window.alert = (msg) => console.log('[STUBBED ALERT]: ' + msg);
+    window.confirm = (msg) => {
+        console.log('[STUBBED CONFIRM]: ' + msg);
+        return true;
+    };
+"""
+
+# Lifetime of the booted Godot engine behind ``shared_page``
+ENGINE_SCOPES = ("module", "session")
+VIEWPORT_SIZE = {"width": 1280, "height": 720}
+
+# Module node IDs whose shared_page context was created with diagnostics enabled
+_SHARED_PAGE_DIAGNOSTICS: dict[str, bool] = {}
+
+# Time spent in diagnostics teardown per node ID (test or module), in seconds
+_DIAGNOSTICS_TEARDOWN_SEC: dict[str, float] = {}
+
+# Per-test metrics collected by fixtures, merged into the profiling entry
+_PENDING_TEST_METRICS: dict[str, dict[str, Any]] = {}
+
 
 # ==============================================================================
 # Helper Functions
@@ -64,6 +127,109 @@ def track_process_pid(pid: int) -> None:
         _TRACKED_PIDS.add(pid)
 
 
+def _diagnostics_mode(config: Any) -> str:
+    """Resolve the active diagnostics capture mode from the pytest config.
+
+    Parameters
+    ----------
+    config : pytest.Config
+        The active pytest configuration (``None`` falls back to "always").
+
+    Returns
+    -------
+    str
+        One of ``DIAGNOSTICS_MODES``.
+    """
+    mode = "always"
+    if config is not None:
+        try:
+            mode = config.getoption("--diagnostics", default="always") or "always"
+        except (AttributeError, ValueError):
+            mode = "always"
+    return mode if mode in DIAGNOSTICS_MODES else "always"
+
+
+def _heap_sample_ms(config: Any) -> int:
+    """Return the page-side memory sampler interval; 0 disables the sampler."""
+    try:
+        interval = config.getoption(
+            "--heap-sample-ms", default=memory_sampling.DEFAULT_SAMPLE_INTERVAL_MS
+        )
+    except (AttributeError, ValueError):
+        interval = memory_sampling.DEFAULT_SAMPLE_INTERVAL_MS
+    return max(int(interval or 0), 0)
+
+
+def _install_page_samplers(context: BrowserContext, config: pytest.Config) -> None:
+    """Add the frame-time and (if enabled) memory sampler init scripts."""
+    context.add_init_script(frame_timing.FRAME_SAMPLER_SCRIPT)
+    interval = _heap_sample_ms(config)
+    if interval:
+        context.add_init_script(memory_sampling.memory_sampler_script(interval))
+
+
+def _engine_scope(config: Any) -> str:
+    """Resolve how long a booted engine is reused by ``shared_page``.
+
+    Parameters
+    ----------
+    config : pytest.Config
+        The active pytest configuration (``None`` falls back to "module").
+
+    Returns
+    -------
+    str
+        One of ``ENGINE_SCOPES``.
+    """
+    scope = "module"
+    if config is not None:
+        try:
+            scope = config.getoption("--engine-scope", default="module") or "module"
+        except (AttributeError, ValueError):
+            scope = "module"
+    return scope if scope in ENGINE_SCOPES else "module"
+
+
+def _diagnostics_enabled(request: pytest.FixtureRequest) -> bool:
+    """Decide whether a new browser context should record video and tracing.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        The requesting test fixture context.
+
+    Returns
+    -------
+    bool
+        True in "always" mode, or while a failed test is being rerun in
+        "on-retry" mode.
+    """
+    if _diagnostics_mode(getattr(request, "config", None)) == "always":
+        return True
+    return bool(_SESSION_STATE.get("diagnostic_rerun"))
+
+
+def _context_recording_options(diagnostics: bool) -> dict[str, Any]:
+    """Build the video recording keyword arguments for ``Browser.new_context``.
+
+    Parameters
+    ----------
+    diagnostics : bool
+        Whether video recording should be enabled.
+
+    Returns
+    -------
+    dict[str, Any]
+        Recording options, empty when diagnostics are disabled.
+    """
+    if not diagnostics:
+        return {}
+    return {
+        "record_video_dir": str(ARTIFACTS_DIR),
+        "record_video_size": dict(VIEWPORT_SIZE),
+    }
+
+
 def _is_test_failed(
     request: pytest.FixtureRequest, include_module_failures: bool = False
 ) -> tuple[bool, str]:
@@ -135,9 +301,68 @@ def _stop_tracing(context: BrowserContext, safe_nodeid: str, test_failed: bool)
         )
 
 
+def _stop_trace_chunk(
+    context: BrowserContext, safe_nodeid: str, test_failed: bool
+) -> None:
+    """Close the active per-test trace chunk, exporting it only on failure.
+
+    Parameters
+    ----------
+    context : BrowserContext
+        The shared Playwright BrowserContext whose tracing stays active.
+    safe_nodeid : str
+        Sanitized node ID for file naming.
+    test_failed : bool
+        Flag indicating if the test failed.
+    """
+    try:
+        if test_failed:
+            trace_path = ARTIFACTS_DIR / f"trace_{safe_nodeid}.zip"
+            context.tracing.stop_chunk(path=str(trace_path))
+        else:
+            context.tracing.stop_chunk()
+    except Exception as exc:  # noqa: BLE001
+        warnings.warn(
+            f"Failed to stop trace chunk for {safe_nodeid}: {exc}",
+            UserWarning,
+            stacklevel=2,
+        )
+
+
+def _capture_failure_screenshot(page_obj: Page, safe_nodeid: str) -> None:
+    """Capture a full-page failure screenshot into ``artifacts/``.
+
+    With the background artifact writer active only the browser round-trip
+    happens here; the PNG bytes are written to disk on a writer thread.
+
+    Parameters
+    ----------
+    page_obj : Page
+        The active Playwright Page instance.
+    safe_nodeid : str
+        Sanitized node ID for file naming.
+    """
+    screenshot_path = ARTIFACTS_DIR / f"failure_{safe_nodeid}.png"
+    writer = _SESSION_STATE.get("artifact_writer")
+    try:
+        if writer is not None:
+            writer.write_bytes(page_obj.screenshot(full_page=True), screenshot_path)
+        else:
+            page_obj.screenshot(path=str(screenshot_path), full_page=True)
+    except Exception as exc:  # noqa: BLE001
+        warnings.warn(
+            f"Failed to capture failure screenshot for {safe_nodeid}: {exc}",
+            UserWarning,
+            stacklevel=2,
+        )
+
+
 def _finalize_video(video_handle: Any, safe_nodeid: str, test_failed: bool) -> None:
     """Save or delete video recording based on test outcome post-context close.
 
+    With the background artifact writer active, the finalized recording is moved
+    (or deleted) on a writer thread instead of being copied via ``save_as``.
+
     Parameters
     ----------
     video_handle : Any
@@ -150,6 +375,24 @@ def _finalize_video(video_handle: Any, safe_nodeid: str, test_failed: bool) -> N
     if not video_handle:
         return
 
+    writer = _SESSION_STATE.get("artifact_writer")
+    if writer is not None:
+        try:
+            # The recording is complete on disk once its context has been closed
+            recorded_path = Path(video_handle.path())
+        except Exception as exc:  # noqa: BLE001
+            warnings.warn(
+                f"Failed to resolve video path for {safe_nodeid}: {exc}",
+                UserWarning,
+                stacklevel=2,
+            )
+            return
+        if test_failed:
+            writer.move(recorded_path, ARTIFACTS_DIR / f"video_{safe_nodeid}.webm")
+        else:
+            writer.delete(recorded_path)
+        return
+
     if test_failed:
         video_path = ARTIFACTS_DIR / f"video_{safe_nodeid}.webm"
         try:
@@ -176,6 +419,7 @@ def _cleanup_context_diagnostics(
     page_obj: Page,
     request: pytest.FixtureRequest,
     include_module_failures: bool = False,
+    tracing_active: bool = True,
 ) -> None:
     """Conditionally retain trace, screenshot, and video on failure, or purge on pass.
 
@@ -189,7 +433,11 @@ def _cleanup_context_diagnostics(
         The requesting test fixture context.
     include_module_failures : bool, default=False
         Whether to include module-level failure matching.
+    tracing_active : bool, default=True
+        Whether tracing was started on the context (False for lean contexts
+        created in "on-retry" diagnostics mode).
     """
+    start_time = time.perf_counter()
     test_failed, target_nodeid = _is_test_failed(
         request, include_module_failures=include_module_failures
     )
@@ -198,17 +446,10 @@ def _cleanup_context_diagnostics(
 
     try:
         if test_failed:
-            screenshot_path = ARTIFACTS_DIR / f"failure_{safe_nodeid}.png"
-            try:
-                page_obj.screenshot(path=str(screenshot_path), full_page=True)
-            except Exception as exc:  # noqa: BLE001
-                warnings.warn(
-                    f"Failed to capture failure screenshot for {safe_nodeid}: {exc}",
-                    UserWarning,
-                    stacklevel=2,
-                )
+            _capture_failure_screenshot(page_obj, safe_nodeid)
 
-        _stop_tracing(context, safe_nodeid, test_failed)
+        if tracing_active:
+            _stop_tracing(context, safe_nodeid, test_failed)
     finally:
         # Close context FIRST so Playwright finalizes video file streams on disk
         try:
@@ -222,6 +463,11 @@ def _cleanup_context_diagnostics(
 
         _finalize_video(video_handle, safe_nodeid, test_failed)
 
+        nodeid = request.node.nodeid
+        _DIAGNOSTICS_TEARDOWN_SEC[nodeid] = _DIAGNOSTICS_TEARDOWN_SEC.get(
+            nodeid, 0.0
+        ) + (time.perf_counter() - start_time)
+
 
 def _determine_final_outcome(item: pytest.Item, rep_teardown: pytest.TestReport) -> str:
     """Determine overall test outcome across setup, call, and teardown phases.
@@ -252,6 +498,24 @@ def _determine_final_outcome(item: pytest.Item, rep_teardown: pytest.TestReport)
     return "passed"
 
 
+def _attach_test_metrics(nodeid: str, key: str, value: Any) -> None:
+    """Queue a per-test metric for the test's ``metrics_baseline.json`` entry.
+
+    Fixtures and the ``tests/perf`` plugins finish before the teardown report
+    is made, so metrics are parked here and merged by ``_record_test_profiling``.
+
+    Parameters
+    ----------
+    nodeid : str
+        The node ID of the test the metric belongs to.
+    key : str
+        Entry key to store the metric under.
+    value : Any
+        JSON-serializable metric value.
+    """
+    _PENDING_TEST_METRICS.setdefault(nodeid, {})[key] = value
+
+
 def _record_test_profiling(item: pytest.Item, rep_teardown: pytest.TestReport) -> None:
     """Record test profiling metrics at teardown phase (#776).
 
@@ -277,16 +541,313 @@ def _record_test_profiling(item: pytest.Item, rep_teardown: pytest.TestReport) -
     wasm_boot = getattr(item, "_wasm_boot_time", None)
     wasm_boot_sec = round(wasm_boot, 4) if wasm_boot is not None else None
 
-    _TEST_PROFILING_DATA.append(
+    # Module-scoped context cleanup runs during the last test's teardown phase
+    module_nodeid = item.nodeid.split("::")[0]
+    diagnostics_teardown = _DIAGNOSTICS_TEARDOWN_SEC.pop(item.nodeid, 0.0)
+    if module_nodeid != item.nodeid:
+        diagnostics_teardown += _DIAGNOSTICS_TEARDOWN_SEC.pop(module_nodeid, 0.0)
+
+    entry = {
+        "nodeid": item.nodeid,
+        "duration_sec": round(duration, 4),
+        "outcome": final_outcome,
+        "wasm_boot_duration_sec": wasm_boot_sec,
+        "setup_sec": round(rep_setup.duration, 4) if rep_setup else None,
+        "call_sec": round(rep_call.duration, 4) if rep_call else None,
+        "teardown_sec": round(rep_teardown.duration, 4),
+        "diagnostics_teardown_sec": round(diagnostics_teardown, 4),
+    }
+    navigation_steps = getattr(item, "_navigation_steps", None)
+    if navigation_steps is not None:
+        entry["navigation_steps"] = navigation_steps
+    replay = getattr(item, "_input_replay", None)
+    if replay is not None:
+        entry["input_replay"] = replay
+    soak_report = getattr(item, "_soak_report", None)
+    if soak_report is not None:
+        entry["soak"] = {
+            key: soak_report[key]
+            for key in ("minutes", "loops", "trends", "violations", "artifact")
+        }
+    timing_plugin = _SESSION_STATE.get("fixture_timing")
+    fixtures = timing_plugin.pop_test_timings(item.nodeid) if timing_plugin else {}
+    if fixtures:
+        entry["fixtures"] = fixtures
+    entry.update(_PENDING_TEST_METRICS.pop(item.nodeid, {}))
+    if final_outcome != "skipped" and _apply_perf_budget(entry, rep_teardown):
+        if final_outcome == "passed":
+            final_outcome = entry["outcome"] = "failed"
+            _FAILED_NODEIDS.add(item.nodeid)
+    _TEST_PROFILING_DATA.append(entry)
+    _stream_record("test", entry)
+
+    _SUMMARY_COUNTS[final_outcome] = _SUMMARY_COUNTS.get(final_outcome, 0) + 1
+
+
+def _apply_perf_budget(entry: dict[str, Any], rep_teardown: pytest.TestReport) -> bool:
+    """Check a profiling entry against the performance budget.
+
+    Violations are stored on the entry and fail the teardown report, so the
+    test is reported as an error with a ``value > limit`` diff per metric.
+
+    Parameters
+    ----------
+    entry : dict[str, Any]
+        The test's ``metrics_baseline.json`` entry.
+    rep_teardown : pytest.TestReport
+        The teardown phase report, failed in place on violation.
+
+    Returns
+    -------
+    bool
+        True when at least one ceiling was exceeded.
+    """
+    perf_budget = _SESSION_STATE.get("perf_budget")
+    if perf_budget is None:
+        return False
+    violations = budget.check_budget(entry, perf_budget)
+    if not violations:
+        return False
+    entry["budget_violations"] = violations
+    message = budget.format_violations(violations, perf_budget["environment"])
+    if rep_teardown.failed:
+        rep_teardown.longrepr = f"{rep_teardown.longrepr}\n\n{message}"
+    else:
+        rep_teardown.outcome = "failed"
+        rep_teardown.longrepr = message
+    return True
+
+
+def _record_diagnostic_rerun(nodeid: str, reports: list[Any]) -> None:
+    """Attach the outcome of an "on-retry" diagnostic rerun to its profiling entry.
+
+    The rerun never changes the reported test outcome; it only exists to capture
+    tracing, video, and HAR artifacts for a test that already failed. Its
+    teardown report is never recorded, so per-test metrics its fixtures parked
+    for the node are discarded here.
+
+    Parameters
+    ----------
+    nodeid : str
+        The node ID of the rerun test.
+    reports : list[pytest.TestReport]
+        Setup, call, and teardown reports produced by the rerun.
+    """
+    if any(rep.failed for rep in reports):
+        outcome = "failed"
+    elif any(rep.skipped for rep in reports):
+        outcome = "skipped"
+    else:
+        outcome = "passed"
+
+    _PENDING_TEST_METRICS.pop(nodeid, None)
+    timing_plugin = _SESSION_STATE.get("fixture_timing")
+    if timing_plugin is not None:
+        timing_plugin.pop_test_timings(nodeid)
+    _DIAGNOSTICS_TEARDOWN_SEC.pop(nodeid, None)
+    module_nodeid = nodeid.split("::")[0]
+    if module_nodeid != nodeid:
+        _DIAGNOSTICS_TEARDOWN_SEC.pop(module_nodeid, None)
+
+    rerun_info = {
+        "outcome": outcome,
+        "duration_sec": round(sum(rep.duration for rep in reports), 4),
+    }
+    for entry in reversed(_TEST_PROFILING_DATA):
+        if entry["nodeid"] == nodeid:
+            entry["diagnostic_rerun"] = rerun_info
+            break
+    _stream_record("rerun", {"nodeid": nodeid, "diagnostic_rerun": rerun_info})
+
+
+def _stream_record(kind: str, data: dict[str, Any]) -> None:
+    """Append a record to the session's crash-safe metrics stream, if open.
+
+    Parameters
+    ----------
+    kind : str
+        Record kind understood by ``metrics_stream.materialize``.
+    data : dict[str, Any]
+        Record payload.
+    """
+    stream = _SESSION_STATE.get("metrics_stream")
+    if stream is None:
+        return
+    try:
+        stream.write(kind, data)
+    except Exception as exc:  # noqa: BLE001 - the in-memory copy still exists
+        warnings.warn(
+            f"Failed to append {kind} record to metrics stream: {exc}",
+            UserWarning,
+            stacklevel=2,
+        )
+
+
+def _load_reference_baseline(path: Path) -> dict[str, Any] | None:
+    """Load an always-on diagnostics metrics baseline used for saving estimates.
+
+    Parameters
+    ----------
+    path : Path
+        Path to a ``metrics_baseline.json`` file.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The parsed payload, or None when missing, unreadable, or recorded in
+        "on-retry" mode itself.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    mode = payload.get("diagnostics", {}).get("mode", "always")
+    return payload if mode == "always" else None
+
+
+def _summarize_diagnostics_saving(
+    tests: list[dict[str, Any]], reference: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Compare a lean "on-retry" run against an always-on reference run.
+
+    Parameters
+    ----------
+    tests : list[dict[str, Any]]
+        Profiling entries recorded during the current lean run.
+    reference : dict[str, Any] | None
+        Metrics payload of an always-on diagnostics run, if available.
+
+    Returns
+    -------
+    dict[str, Any]
+        Rerun counts/cost and, when a reference is available, the duration of
+        the tests common to both runs and the resulting net saving.
+    """
+    reruns = [t["diagnostic_rerun"] for t in tests if "diagnostic_rerun" in t]
+    rerun_cost = round(sum(r["duration_sec"] for r in reruns), 4)
+    summary: dict[str, Any] = {
+        "mode": "on-retry",
+        "reruns": len(reruns),
+        "rerun_duration_sec": rerun_cost,
+        "compared_tests": 0,
+        "lean_duration_sec": None,
+        "reference_duration_sec": None,
+        "saving_sec": None,
+    }
+    if not reference:
+        return summary
+
+    ref_durations = {
+        t["nodeid"]: t["duration_sec"]
+        for t in reference.get("tests", [])
+        if isinstance(t, dict) and "nodeid" in t and "duration_sec" in t
+    }
+    common = [t for t in tests if t["nodeid"] in ref_durations]
+    if not common:
+        return summary
+
+    lean = sum(t["duration_sec"] for t in common)
+    ref = sum(ref_durations[t["nodeid"]] for t in common)
+    summary.update(
         {
-            "nodeid": item.nodeid,
-            "duration_sec": round(duration, 4),
-            "outcome": final_outcome,
-            "wasm_boot_duration_sec": wasm_boot_sec,
+            "compared_tests": len(common),
+            "lean_duration_sec": round(lean, 4),
+            "reference_duration_sec": round(ref, 4),
+            "saving_sec": round(ref - lean - rerun_cost, 4),
         }
     )
+    return summary
+
+
+def _save_artifact(name: str, payload: bytes) -> None:
+    """Write an artifact file, in the background when the writer is running."""
+    dest = ARTIFACTS_DIR / name
+    writer = _SESSION_STATE.get("artifact_writer")
+    if writer is not None:
+        writer.write_bytes(payload, dest)
+    else:
+        dest.write_bytes(payload)
 
-    _SUMMARY_COUNTS[final_outcome] = _SUMMARY_COUNTS.get(final_outcome, 0) + 1
+
+def _register_cdp_profiler(config: pytest.Config, all_tests: bool) -> None:
+    """Register the CDP profiling plugin once per session.
+
+    Parameters
+    ----------
+    config : pytest.Config
+        The global pytest configuration object.
+    all_tests : bool
+        Profile every test (``--cdp-profile``) instead of marked ones only.
+    """
+    if config.pluginmanager.has_plugin("skylock-cdp-profile"):
+        return
+    config.pluginmanager.register(
+        cdp_profiler.CdpProfilePlugin(
+            _attach_test_metrics,
+            _save_artifact,
+            sampling_interval_us=config.getoption(
+                "--cdp-sampling-interval",
+                default=cdp_profiler.DEFAULT_SAMPLING_INTERVAL_US,
+            ),
+            all_tests=all_tests,
+        ),
+        "skylock-cdp-profile",
+    )
+
+
+def _register_perf_plugins(config: pytest.Config) -> None:
+    """Register the per-test metric plugins whose feature is enabled.
+
+    Frame timing, engine monitors, boot phases and fixture timing are part of
+    every baseline; the samplers and profilers are opt-in.
+
+    Parameters
+    ----------
+    config : pytest.Config
+        The global pytest configuration object.
+    """
+    register = config.pluginmanager.register
+    timing_plugin = fixture_timing.FixtureTimingPlugin(
+        paused=lambda: bool(_SESSION_STATE.get("diagnostic_rerun"))
+    )
+    _SESSION_STATE["fixture_timing"] = timing_plugin
+    register(timing_plugin, "skylock-fixture-timing")
+    register(
+        frame_timing.FrameTimingPlugin(_attach_test_metrics), "skylock-frame-timing"
+    )
+    register(
+        engine_monitors.EngineMonitorsPlugin(_attach_test_metrics),
+        "skylock-engine-monitors",
+    )
+    register(boot_phases.BootPhasesPlugin(_attach_test_metrics), "skylock-boot-phases")
+
+    if _heap_sample_ms(config):
+        memory_plugin = memory_sampling.MemoryTimelinePlugin(_attach_test_metrics)
+        _SESSION_STATE["memory_timeline"] = memory_plugin
+        register(memory_plugin, "skylock-memory-timeline")
+
+    proc_interval_ms = config.getoption("--proc-sample-ms", default=0)
+    if proc_sampler.PROC_AVAILABLE and proc_interval_ms > 0:
+        register(
+            proc_sampler.ProcessUsagePlugin(
+                _attach_test_metrics,
+                lambda: _SESSION_STATE["browser_pids"],
+                proc_interval_ms / 1000.0,
+            ),
+            "skylock-proc-sampler",
+        )
+
+    if config.getoption("--cdp-profile", default=False):
+        _register_cdp_profiler(config, all_tests=True)
+
+    if config.getoption("--profile-harness", default=False):
+        register(
+            harness_profiler.HarnessProfilerPlugin(_attach_test_metrics, ARTIFACTS_DIR),
+            "skylock-harness-profiler",
+        )
 
 
 # ==============================================================================
@@ -294,8 +855,152 @@ def _record_test_profiling(item: pytest.Item, rep_teardown: pytest.TestReport) -
 # ==============================================================================
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register harness command-line options.
+
+    Parameters
+    ----------
+    parser : pytest.Parser
+        The pytest command-line parser.
+    """
+    group = parser.getgroup("skylock", "SkyLockAssault E2E harness")
+    group.addoption(
+        "--diagnostics",
+        action="store",
+        default=os.getenv("PW_DIAGNOSTICS", "always"),
+        choices=DIAGNOSTICS_MODES,
+        help=(
+            "Playwright diagnostics capture: 'always' records video/tracing for "
+            "every test, 'on-retry' runs lean and reruns failures once with "
+            "tracing, video, and HAR enabled (env: PW_DIAGNOSTICS)."
+        ),
+    )
+    group.addoption(
+        "--engine-scope",
+        action="store",
+        default=os.getenv("PW_ENGINE_SCOPE", "module"),
+        choices=ENGINE_SCOPES,
+        help=(
+            "Lifetime of the Godot engine behind shared_page: 'module' boots once "
+            "per test module, 'session' boots once and restores state in place "
+            "with window.resetGameState() (env: PW_ENGINE_SCOPE)."
+        ),
+    )
+    group.addoption(
+        "--artifact-workers",
+        action="store",
+        type=int,
+        default=int(os.getenv("PW_ARTIFACT_WORKERS", str(DEFAULT_WORKERS))),
+        help=(
+            "Background threads that write, move, and compress diagnostic "
+            "artifacts after teardown; 0 writes synchronously "
+            "(env: PW_ARTIFACT_WORKERS)."
+        ),
+    )
+    group.addoption(
+        "--heap-sample-ms",
+        action="store",
+        type=int,
+        default=int(
+            os.getenv(
+                "PW_HEAP_SAMPLE_MS", str(memory_sampling.DEFAULT_SAMPLE_INTERVAL_MS)
+            )
+        ),
+        help=(
+            "Interval of the page-side JS heap / WASM memory sampler used for "
+            "per-test leak detection; 0 disables it (env: PW_HEAP_SAMPLE_MS)."
+        ),
+    )
+    group.addoption(
+        "--proc-sample-ms",
+        action="store",
+        type=int,
+        default=int(
+            os.getenv(
+                "PW_PROC_SAMPLE_MS", str(proc_sampler.DEFAULT_PROC_SAMPLE_INTERVAL_MS)
+            )
+        ),
+        help=(
+            "Interval of the /proc CPU and RSS sampler for the Chromium process "
+            "tree; 0 disables it (env: PW_PROC_SAMPLE_MS)."
+        ),
+    )
+    group.addoption(
+        "--soak-minutes",
+        action="store",
+        type=float,
+        default=float(os.getenv("PW_SOAK_MINUTES", "0")),
+        help=(
+            "Run soak-marked tests for this many minutes of looped gameplay "
+            "and fail on resource drift; 0 skips them (env: PW_SOAK_MINUTES)."
+        ),
+    )
+    group.addoption(
+        "--soak-interval",
+        action="store",
+        type=float,
+        default=float(
+            os.getenv("PW_SOAK_INTERVAL_SEC", str(soak.DEFAULT_SOAK_INTERVAL_SEC))
+        ),
+        help=("Seconds between soak resource samples (env: PW_SOAK_INTERVAL_SEC)."),
+    )
+    group.addoption(
+        "--cdp-profile",
+        action="store_true",
+        default=os.getenv("PW_CDP_PROFILE", "0") == "1",
+        help=(
+            "Record CDP Performance.getMetrics deltas and a sampled CPU profile "
+            "(speedscope JSON in artifacts/) for every test (env: PW_CDP_PROFILE=1)."
+        ),
+    )
+    group.addoption(
+        "--cdp-sampling-interval",
+        action="store",
+        type=int,
+        default=cdp_profiler.DEFAULT_SAMPLING_INTERVAL_US,
+        help="V8 CPU sampling interval in microseconds for --cdp-profile.",
+    )
+    group.addoption(
+        "--profile-harness",
+        action="store_true",
+        default=os.getenv("PW_PROFILE_HARNESS", "0") == "1",
+        help=(
+            "Run cProfile and tracemalloc over each test's Python code and report "
+            "harness CPU and allocations apart from time blocked on Playwright "
+            "(env: PW_PROFILE_HARNESS=1)."
+        ),
+    )
+    group.addoption(
+        "--perf-budget",
+        action="store",
+        default=os.getenv("PW_PERF_BUDGET", str(budget.DEFAULT_BUDGET_PATH)),
+        help=(
+            "Performance budget JSON enforced on every test's metrics; an empty "
+            "value disables it (env: PW_PERF_BUDGET)."
+        ),
+    )
+    group.addoption(
+        "--perf-budget-env",
+        action="store",
+        default=os.getenv("PW_PERF_BUDGET_ENV", ""),
+        help=(
+            "Budget 'environments' entry layered over the base ceilings, "
+            "e.g. 'ci' (env: PW_PERF_BUDGET_ENV)."
+        ),
+    )
+    group.addoption(
+        "--diagnostics-reference",
+        action="store",
+        default=None,
+        help=(
+            "metrics_baseline.json from an always-on run used to report the "
+            "'on-retry' suite-time saving (default: previous artifacts baseline)."
+        ),
+    )
+
+
 def pytest_configure(config: pytest.Config) -> None:
-    """Register custom pytest markers for network tracing and profiling.
+    """Register custom markers and the enabled per-test perf plugins.
 
     Parameters
     ----------
@@ -307,6 +1012,58 @@ def pytest_configure(config: pytest.Config) -> None:
         "record_har: Mark tests that should record HAR files "
         "for network tracing in Playwright.",
     )
+    config.addinivalue_line(
+        "markers",
+        "cdp_profile: Capture CDP performance metrics and a CPU profile "
+        "for this test even without --cdp-profile.",
+    )
+    config.addinivalue_line(
+        "markers",
+        "soak: Long-running gameplay soak; skipped unless --soak-minutes is set.",
+    )
+    config.addinivalue_line(
+        "markers",
+        "seed_settings(**settings): [Settings] values written to user://settings.cfg "
+        "before the seeded_page fixture boots the engine.",
+    )
+
+    _register_perf_plugins(config)
+
+    budget_path = config.getoption("--perf-budget", default="")
+    if budget_path:
+        try:
+            _SESSION_STATE["perf_budget"] = budget.load_budget(
+                Path(budget_path), config.getoption("--perf-budget-env", default="")
+            )
+        except (OSError, ValueError) as exc:
+            raise pytest.UsageError(f"Invalid performance budget: {exc}") from exc
+
+    workers = config.getoption("--artifact-workers", default=DEFAULT_WORKERS)
+    if workers and workers > 0:
+        _SESSION_STATE["artifact_writer"] = ArtifactWriter(max_workers=workers)
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
+    """Enable marker-driven CDP profiling and skip soak tests unless requested.
+
+    Parameters
+    ----------
+    config : pytest.Config
+        The global pytest configuration object.
+    items : list[pytest.Item]
+        Collected test items.
+    """
+    if any(item.get_closest_marker("cdp_profile") for item in items):
+        _register_cdp_profiler(config, all_tests=False)
+
+    if config.getoption("--soak-minutes", default=0) > 0:
+        return
+    skip_soak = pytest.mark.skip(
+        reason="Soak mode disabled; pass --soak-minutes N to enable"
+    )
+    for item in items:
+        if item.get_closest_marker("soak"):
+            item.add_marker(skip_soak)
 
 
 def pytest_sessionstart(session) -> None:
@@ -321,6 +1078,55 @@ def pytest_sessionstart(session) -> None:
     _SESSION_STATE["start_time"] = time.perf_counter()
     _SESSION_STATE["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
+    # Journal every record as it is produced so a killed shard keeps its metrics
+    try:
+        _SESSION_STATE["metrics_stream"] = metrics_stream.MetricsStream(
+            ARTIFACTS_DIR / metrics_stream.STREAM_FILE_NAME
+        )
+    except OSError as exc:
+        warnings.warn(
+            f"Failed to open metrics stream: {exc}", UserWarning, stacklevel=2
+        )
+    _stream_record("session_start", {"timestamp": _SESSION_STATE["timestamp"]})
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Rerun failed tests once with full diagnostics in "on-retry" mode.
+
+    The first attempt is reported normally, so a failure stays a failure even if
+    the diagnostic rerun passes. The rerun is not logged; its outcome and cost are
+    only attached to the profiling entry of the test.
+
+    Parameters
+    ----------
+    item : pytest.Item
+        The test item to run.
+    nextitem : pytest.Item | None
+        The next scheduled test item (drives fixture teardown scope).
+
+    Returns
+    -------
+    bool | None
+        True when the protocol was handled here, None to defer to pytest.
+    """
+    if _diagnostics_mode(item.config) != "on-retry":
+        return None
+
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    reports = runtestprotocol(item, nextitem=nextitem, log=True)
+
+    if any(rep.failed for rep in reports):
+        _SESSION_STATE["diagnostic_rerun"] = item.nodeid
+        try:
+            rerun_reports = runtestprotocol(item, nextitem=nextitem, log=False)
+        finally:
+            _SESSION_STATE["diagnostic_rerun"] = None
+        _record_diagnostic_rerun(item.nodeid, rerun_reports)
+
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -338,6 +1144,10 @@ def pytest_runtest_makereport(item, call):
     report = outcome.get_result()
     setattr(item, f"rep_{report.when}", report)
 
+    # Diagnostic reruns are attached to the original entry by the protocol hook
+    if _SESSION_STATE.get("diagnostic_rerun") == item.nodeid:
+        return
+
     # Record setup and call failures immediately before fixture teardowns run
     if report.when in {"setup", "call"} and report.failed:
         _FAILED_NODEIDS.add(item.nodeid)
@@ -368,8 +1178,69 @@ def pytest_sessionfinish(session, exitstatus):
         "summary": _SUMMARY_COUNTS,
         "tests": _TEST_PROFILING_DATA,
     }
+    if _LIFECYCLE_METRICS:
+        metrics_payload["lifecycle_metrics"] = _LIFECYCLE_METRICS
 
     metrics_file = ARTIFACTS_DIR / "metrics_baseline.json"
+
+    # Drain background artifact writes so every retained file exists on exit
+    writer = _SESSION_STATE.get("artifact_writer")
+    if writer is not None:
+        _SESSION_STATE["artifact_writer"] = None
+        for error in writer.shutdown():
+            warnings.warn(
+                f"Artifact writer job failed: {error}", UserWarning, stacklevel=2
+            )
+        if writer.stats["jobs"]:
+            writer_stats = dict(
+                writer.stats, busy_sec=round(writer.stats["busy_sec"], 4)
+            )
+            _SESSION_STATE["artifact_writer_stats"] = writer_stats
+            metrics_payload["artifact_writer"] = writer_stats
+
+    timing_plugin = _SESSION_STATE.get("fixture_timing")
+    if timing_plugin is not None and timing_plugin.timings:
+        metrics_payload["fixture_timings"] = timing_plugin.slowest_fixtures()
+
+    memory_plugin = _SESSION_STATE.get("memory_timeline")
+    heap_growth = memory_plugin.flag_heap_growth_modules() if memory_plugin else []
+    _SESSION_STATE["heap_growth_modules"] = heap_growth
+    if heap_growth:
+        metrics_payload["heap_growth_modules"] = heap_growth
+
+    # Compare lean "on-retry" runs against an always-on reference before overwriting
+    config = getattr(session, "config", None)
+    if _diagnostics_mode(config) == "on-retry":
+        reference_opt = config.getoption("--diagnostics-reference", default=None)
+        reference_file = Path(reference_opt) if reference_opt else metrics_file
+        diagnostics_summary = _summarize_diagnostics_saving(
+            _TEST_PROFILING_DATA, _load_reference_baseline(reference_file)
+        )
+        _SESSION_STATE["diagnostics_summary"] = diagnostics_summary
+        metrics_payload["diagnostics"] = diagnostics_summary
+
+    # Materialize the baseline from the stream; it is the durable source of truth
+    stream = _SESSION_STATE.get("metrics_stream")
+    if stream is not None:
+        _stream_record(
+            "session_end",
+            {
+                "total_duration_sec": total_duration,
+                "sections": metrics_stream.session_sections(metrics_payload),
+            },
+        )
+        _SESSION_STATE["metrics_stream"] = None
+        try:
+            stream.close()
+            metrics_payload = metrics_stream.materialize(
+                *metrics_stream.read_stream(stream.path)
+            )
+        except Exception as exc:  # noqa: BLE001 - fall back to in-memory data
+            warnings.warn(
+                f"Failed to materialize metrics stream: {exc}",
+                UserWarning,
+                stacklevel=2,
+            )
     try:
         with open(metrics_file, "w", encoding="utf-8") as f:
             json.dump(metrics_payload, f, indent=2)
@@ -432,6 +1303,62 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
         terminalreporter.write_line(f"Baseline JSON Exported: {metrics_file}")
         terminalreporter.ensure_newline()
 
+    # Output fixture timing and diagnostics teardown latency
+    timing_plugin = _SESSION_STATE.get("fixture_timing")
+    if timing_plugin is not None:
+        fixture_timing.write_terminal_summary(
+            terminalreporter,
+            timing_plugin.slowest_fixtures(fixture_timing.SLOWEST_FIXTURES_SHOWN),
+        )
+    artifact_writer.write_terminal_summary(
+        terminalreporter,
+        _TEST_PROFILING_DATA,
+        _SESSION_STATE.get("artifact_writer_stats"),
+    )
+
+    # Output "on-retry" diagnostics rerun cost and suite-time saving
+    diagnostics_summary = _SESSION_STATE.get("diagnostics_summary")
+    if diagnostics_summary:
+        terminalreporter.ensure_newline()
+        terminalreporter.section("Diagnostics On-Retry Mode", sep="=", bold=True)
+        terminalreporter.write_line(
+            f"Diagnostic Reruns    : {diagnostics_summary['reruns']} "
+            f"({diagnostics_summary['rerun_duration_sec']}s)"
+        )
+        if diagnostics_summary["saving_sec"] is None:
+            terminalreporter.write_line(
+                "Suite-Time Saving    : n/a (no always-on reference baseline; "
+                "pass --diagnostics-reference)"
+            )
+        else:
+            reference = diagnostics_summary["reference_duration_sec"]
+            saving = diagnostics_summary["saving_sec"]
+            percent = round(100.0 * saving / reference, 1) if reference else 0.0
+            terminalreporter.write_line(
+                f"Compared Tests       : {diagnostics_summary['compared_tests']} | "
+                f"Lean: {diagnostics_summary['lean_duration_sec']}s | "
+                f"Always-On Reference: {reference}s"
+            )
+            terminalreporter.write_line(
+                f"Suite-Time Saving    : {saving}s ({percent}%) incl. rerun cost"
+            )
+        terminalreporter.ensure_newline()
+
+    # Output the per-test perf sections, each written by its tests/perf module
+    entries = _TEST_PROFILING_DATA
+    frame_timing.write_terminal_summary(terminalreporter, entries)
+    memory_sampling.write_terminal_summary(
+        terminalreporter, entries, _SESSION_STATE.get("heap_growth_modules") or []
+    )
+    engine_monitors.write_terminal_summary(terminalreporter, entries)
+    input_replay.write_terminal_summary(terminalreporter, entries)
+    budget.write_terminal_summary(terminalreporter, entries)
+    soak.write_terminal_summary(terminalreporter, entries)
+    boot_phases.write_terminal_summary(terminalreporter, entries)
+    proc_sampler.write_terminal_summary(terminalreporter, entries)
+    harness_profiler.write_terminal_summary(terminalreporter, entries, ARTIFACTS_DIR)
+    cdp_profiler.write_terminal_summary(terminalreporter, entries, ARTIFACTS_DIR)
+
     # Output Task #773 Memory & Lifecycle Summary
     if _LIFECYCLE_METRICS:
         terminalreporter.ensure_newline()
@@ -493,14 +1420,14 @@ def capture_lifecycle_metrics(request):
             heap_info = page_obj.evaluate(heap_script)
 
             if heap_info:
-                _LIFECYCLE_METRICS.append(
-                    {
-                        "test": request.node.name,
-                        "used_heap_mb": heap_info["used"],
-                        "total_heap_mb": heap_info["total"],
-                        "limit_mb": heap_info["limit"],
-                    }
-                )
+                lifecycle_entry = {
+                    "test": request.node.name,
+                    "used_heap_mb": heap_info["used"],
+                    "total_heap_mb": heap_info["total"],
+                    "limit_mb": heap_info["limit"],
+                }
+                _LIFECYCLE_METRICS.append(lifecycle_entry)
+                _stream_record("lifecycle", lifecycle_entry)
         except Exception as exc:  # noqa: BLE001 - metrics are best-effort
             warnings.warn(
                 f"Heap metric capture failed: {exc}",
@@ -511,7 +1438,13 @@ def capture_lifecycle_metrics(request):
 
 @pytest.fixture(autouse=True)
 def soft_ui_reset(request):
-    """Execute a lightweight UI state reset between tests using window hooks.
+    """Restore a clean main-menu state between tests sharing a booted engine.
+
+    With ``--engine-scope=session`` the page outlives its module, so the
+    in-engine ``window.resetGameState()`` hook restores settings, audio buses
+    and the main menu in place. Module-scoped pages (and builds without the
+    hook) get the lightweight reset: clearing storage and invoking the menu
+    back-button callbacks.
 
     Parameters
     ----------
@@ -525,6 +1458,13 @@ def soft_ui_reset(request):
             page_obj.evaluate("""() => {
                 localStorage.clear();
                 sessionStorage.clear();
+            }""")
+            if _engine_scope(request.config) == "session" and page_obj.evaluate(
+                "typeof window.resetGameState === 'function'"
+            ):
+                reset_game_state(page_obj)
+                return
+            page_obj.evaluate("""() => {
                 const hooks = [
                     'audioBackPressed',
                     'controlsBackPressed',
@@ -538,8 +1478,38 @@ def soft_ui_reset(request):
                     }
                 });
             }""")
-        except Exception:
-            pass
+        except Exception as exc:  # noqa: BLE001
+            warnings.warn(
+                f"Game state reset failed after {request.node.nodeid}: {exc}",
+                UserWarning,
+                stacklevel=2,
+            )
+
+
+def _browser_launch_options(request: pytest.FixtureRequest) -> dict[str, Any]:
+    """Build Chromium launch options, honoring a ``browser_type_launch_args`` override.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        The requesting fixture context.
+
+    Returns
+    -------
+    dict[str, Any]
+        Keyword arguments for ``chromium.launch`` (sync or async API).
+    """
+    launch_options: dict[str, Any] = {
+        "headless": True,
+        "args": list(CHROMIUM_LAUNCH_ARGS),
+    }
+    if "browser_type_launch_args" in request.fixturenames:
+        override = request.getfixturevalue("browser_type_launch_args")
+        if isinstance(override, dict):
+            launch_options.update(override)
+        elif isinstance(override, list):
+            launch_options["args"] = override
+    return launch_options
 
 
 @pytest.fixture(scope="session")
@@ -554,51 +1524,63 @@ def browser_instance(
     playwright_instance: Playwright, request: pytest.FixtureRequest
 ) -> Generator[Browser, None, None]:
     """Session-scoped Chromium launch fixture to minimize startup overhead."""
-    launch_options = {
-        "headless": True,
-        "args": [
-            "--enable-unsafe-swiftshader",
-            "--disable-gpu",
-            "--use-gl=swiftshader",
-        ],
-    }
-    if "browser_type_launch_args" in request.fixturenames:
-        override = request.getfixturevalue("browser_type_launch_args")
-        if isinstance(override, dict):
-            launch_options.update(override)
-        elif isinstance(override, list):
-            launch_options["args"] = override
-
-    browser = playwright_instance.chromium.launch(**launch_options)
+    browser = playwright_instance.chromium.launch(**_browser_launch_options(request))
+    if proc_sampler.PROC_AVAILABLE:
+        _SESSION_STATE["browser_pids"] = proc_sampler.find_browser_roots()
     yield browser
+    _SESSION_STATE["browser_pids"] = set()
     browser.close()
 
 
-@pytest.fixture(scope="module")
-def shared_page(
+def _boot_shared_page(
     browser_instance: Browser, request: pytest.FixtureRequest
 ) -> Generator[Page, None, None]:
-    """Module-scoped page fixture. Boots Godot WASM once per module."""
+    """Boot Godot WASM in a fresh context and tear it down with diagnostics.
+
+    Shared by the module-scoped ``shared_page`` and the session-scoped
+    ``session_page`` fixtures. When diagnostics are enabled, tracing runs for the
+    lifetime of the context but each test records into its own chunk (see
+    ``shared_page_trace_chunk``); the owner-level chunk only covers the engine boot
+    and is kept if booting fails.
+
+    Parameters
+    ----------
+    browser_instance : Browser
+        The session-scoped Chromium browser.
+    request : pytest.FixtureRequest
+        The owning (module or session) fixture request.
+    """
+    # Session-scoped requests have an empty node ID; it prefixes every failure
+    module_nodeid = request.node.nodeid
+    owner_label = module_nodeid or "session"
+    diagnostics = _diagnostics_enabled(request)
     context = browser_instance.new_context(
-        viewport={"width": 1280, "height": 720},
-        record_video_dir=str(ARTIFACTS_DIR),
-        record_video_size={"width": 1280, "height": 720},
+        viewport=dict(VIEWPORT_SIZE),
+        **_context_recording_options(diagnostics),
     )
-    context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    if diagnostics:
+        context.tracing.start(
+            screenshots=True,
+            snapshots=True,
+            sources=True,
+            title=f"{owner_label} boot",
+        )
+    _SHARED_PAGE_DIAGNOSTICS[module_nodeid] = diagnostics
+    _install_page_samplers(context, request.config)
     page_obj = context.new_page()
 
-    page_obj.add_init_script("""
-        window.alert = (msg) => console.log('[STUBBED ALERT]: ' + msg);
-        window.confirm = (msg) => {
-            console.log('[STUBBED CONFIRM]: ' + msg);
-            return true;
-        };
-    """)
+    page_obj.add_init_script(DIALOG_STUB_SCRIPT)
     page_obj.on("dialog", lambda dialog: dialog.dismiss())
 
-    init_page_and_wait_ready(page_obj)
-
+    boot_failed = False
     try:
+        try:
+            init_page_and_wait_ready(page_obj)
+        except Exception:
+            # Attribute boot failures to the owner so video/screenshot are kept
+            boot_failed = True
+            _FAILED_NODEIDS.add(owner_label)
+            raise
         yield page_obj
     finally:
         try:
@@ -617,9 +1599,183 @@ def shared_page(
         except Exception:
             pass
 
+        _SHARED_PAGE_DIAGNOSTICS.pop(module_nodeid, None)
+        if diagnostics:
+            # Per-test chunks were already exported; only the boot chunk remains
+            safe_module = re.sub(r"[^A-Za-z0-9._-]+", "_", owner_label)
+            _stop_tracing(context, f"{safe_module}_boot", boot_failed)
         _cleanup_context_diagnostics(
-            context, page_obj, request, include_module_failures=True
+            context,
+            page_obj,
+            request,
+            include_module_failures=True,
+            tracing_active=False,
+        )
+
+
+@pytest.fixture(scope="session")
+def session_page(
+    browser_instance: Browser, request: pytest.FixtureRequest
+) -> Generator[Page, None, None]:
+    """Session-scoped page fixture. Boots Godot WASM once for the whole suite.
+
+    Only used when ``--engine-scope=session``; state is restored between tests
+    by ``soft_ui_reset`` through the in-engine ``window.resetGameState()`` hook.
+    """
+    yield from _boot_shared_page(browser_instance, request)
+
+
+@pytest.fixture(scope="module")
+def shared_page(
+    browser_instance: Browser, request: pytest.FixtureRequest
+) -> Generator[Page, None, None]:
+    """Module-scoped page fixture. Boots Godot WASM once per module.
+
+    With ``--engine-scope=session`` the already-booted ``session_page`` is handed
+    out instead, so the whole suite pays for a single engine boot.
+    """
+    if _engine_scope(request.config) != "session":
+        yield from _boot_shared_page(browser_instance, request)
+        return
+
+    page_obj = request.getfixturevalue("session_page")
+    module_nodeid = request.node.nodeid
+    # Per-test trace chunks are keyed by module; inherit the session setting
+    _SHARED_PAGE_DIAGNOSTICS[module_nodeid] = _SHARED_PAGE_DIAGNOSTICS.get("", False)
+    try:
+        yield page_obj
+    finally:
+        _SHARED_PAGE_DIAGNOSTICS.pop(module_nodeid, None)
+
+
+@pytest.fixture(autouse=True)
+def shared_page_trace_chunk(request):
+    """Record one trace chunk per test on a diagnostics-enabled shared_page.
+
+    Chunks are exported to ``artifacts/trace_<nodeid>.zip`` only when that exact
+    test failed and discarded otherwise, so trace size stays bounded by the
+    longest single test instead of growing with the whole module.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        The requesting test fixture context.
+    """
+    if "shared_page" not in request.fixturenames:
+        yield
+        return
+
+    page_obj = request.getfixturevalue("shared_page")
+    module_nodeid = request.node.nodeid.split("::")[0]
+    if not _SHARED_PAGE_DIAGNOSTICS.get(module_nodeid, False):
+        yield
+        return
+
+    context = page_obj.context
+    safe_nodeid = re.sub(r"[^A-Za-z0-9._-]+", "_", request.node.nodeid)
+    try:
+        # Starting a chunk discards anything recorded since the previous one
+        context.tracing.start_chunk(title=request.node.nodeid)
+    except Exception as exc:  # noqa: BLE001
+        warnings.warn(
+            f"Failed to start trace chunk for {safe_nodeid}: {exc}",
+            UserWarning,
+            stacklevel=2,
+        )
+        yield
+        return
+
+    yield
+
+    test_failed, _ = _is_test_failed(request, include_module_failures=False)
+    _stop_trace_chunk(context, safe_nodeid, test_failed)
+
+
+@pytest.fixture(autouse=True)
+def shared_page_rerun_tracing(request):
+    """Trace a diagnostic rerun in place on a lean, already-booted shared_page.
+
+    In "on-retry" mode the module context is created without video or tracing.
+    Video cannot be enabled on an existing context, so a rerun of a shared_page
+    test records a dedicated trace chunk and a final screenshot instead.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        The requesting test fixture context.
+    """
+    if (
+        _SESSION_STATE.get("diagnostic_rerun") != request.node.nodeid
+        or "shared_page" not in request.fixturenames
+    ):
+        yield
+        return
+
+    page_obj = request.getfixturevalue("shared_page")
+    module_nodeid = request.node.nodeid.split("::")[0]
+    if _SHARED_PAGE_DIAGNOSTICS.get(module_nodeid, False):
+        # Context was (re)created during the rerun with full diagnostics already
+        yield
+        return
+
+    context = page_obj.context
+    safe_nodeid = re.sub(r"[^A-Za-z0-9._-]+", "_", request.node.nodeid)
+    try:
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    except Exception as exc:  # noqa: BLE001
+        warnings.warn(
+            f"Failed to start rerun tracing for {safe_nodeid}: {exc}",
+            UserWarning,
+            stacklevel=2,
         )
+        yield
+        return
+
+    yield
+
+    _capture_failure_screenshot(page_obj, safe_nodeid)
+    _stop_tracing(context, safe_nodeid, test_failed=True)
+
+
+@pytest.fixture(scope="function")
+def seeded_page(page: Page, request: pytest.FixtureRequest) -> Page:
+    """Boot the game on a fresh page with pre-seeded settings.
+
+    Writes the ``seed_settings`` marker's values to ``user://settings.cfg`` in
+    IndexedDB before the engine starts, so gameplay tests can press Start
+    (``start_preseeded_game``) without navigating the options menus. Tests
+    that also request ``seeded_coverage`` get V8 coverage of the engine boot.
+
+    Parameters
+    ----------
+    page : Page
+        The per-test page; its engine must not be booted yet.
+    request : pytest.FixtureRequest
+        The requesting test fixture context.
+    """
+    marker = request.node.get_closest_marker("seed_settings")
+    seed_settings_config(page, dict(marker.kwargs) if marker else {})
+    if "seeded_coverage" in request.fixturenames:
+        # Started before the game navigation so boot-time coverage is recorded
+        request.node._cdp_coverage = init_cdp_coverage(page)
+    init_page_and_wait_ready(page, request=request)
+    return page
+
+
+@pytest.fixture(scope="function")
+def seeded_coverage(
+    seeded_page: Page, request: pytest.FixtureRequest
+) -> tuple[Any, bool]:
+    """V8 precise coverage session ``seeded_page`` started before the engine boot.
+
+    Returns
+    -------
+    tuple[Any, bool]
+        ``(cdp_session, coverage_started)`` as from ``init_cdp_coverage``; the
+        test harvests and stops the coverage itself.
+    """
+    _ = seeded_page
+    return request.node._cdp_coverage
 
 
 @pytest.fixture(scope="function")
@@ -627,25 +1783,111 @@ def page(
     browser_instance: Browser, request: pytest.FixtureRequest
 ) -> Generator[Page, None, None]:
     """Provide clean browser context isolation for each test function."""
+    diagnostics = _diagnostics_enabled(request)
     har_path = None
-    if request.node.get_closest_marker("record_har"):
+    if request.node.get_closest_marker("record_har") or (
+        diagnostics and _diagnostics_mode(request.config) == "on-retry"
+    ):
         nodeid = request.node.nodeid
         safe_nodeid = re.sub(r"[^A-Za-z0-9._-]+", "_", nodeid)
         har_path = ARTIFACTS_DIR / f"{safe_nodeid}.har"
 
     context: BrowserContext = browser_instance.new_context(
-        viewport={"width": 1280, "height": 720},
+        viewport=dict(VIEWPORT_SIZE),
         record_har_path=str(har_path) if har_path else None,
-        record_video_dir=str(ARTIFACTS_DIR),
-        record_video_size={"width": 1280, "height": 720},
+        **_context_recording_options(diagnostics),
     )
 
-    context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    if diagnostics:
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    _install_page_samplers(context, request.config)
     page_obj: Page = context.new_page()
 
     try:
         yield page_obj
     finally:
         _cleanup_context_diagnostics(
-            context, page_obj, request, include_module_failures=False
+            context,
+            page_obj,
+            request,
+            include_module_failures=False,
+            tracing_active=diagnostics,
         )
+
+        # HAR is written on context close; gzip it off the critical path
+        writer = _SESSION_STATE.get("artifact_writer")
+        if har_path and writer is not None and har_path.exists():
+            writer.move(har_path, har_path, compress=True)
+
+
+@pytest_asyncio.fixture
+async def async_browser(
+    request: pytest.FixtureRequest,
+) -> AsyncGenerator[AsyncBrowser, None]:
+    """Chromium driven through ``playwright.async_api`` for concurrent flows.
+
+    Function-scoped because pytest-asyncio gives each test its own event loop;
+    the sync ``browser_instance`` is unaffected and can coexist in one session.
+    """
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(**_browser_launch_options(request))
+        try:
+            yield browser
+        finally:
+            await browser.close()
+
+
+@pytest_asyncio.fixture
+async def async_game_pages(
+    async_browser: AsyncBrowser, request: pytest.FixtureRequest
+) -> AsyncGenerator[Callable[[int], Awaitable[list[AsyncPage]]], None]:
+    """Factory booting N isolated game pages of one browser concurrently.
+
+    Each page gets its own context (separate IndexedDB settings), so flows on
+    different pages never share state. On failure every page leaves a
+    ``failure_<nodeid>_page<N>.png`` screenshot in ``artifacts/``.
+    """
+    contexts: list[AsyncBrowserContext] = []
+    pages: list[AsyncPage] = []
+
+    async def _boot_one() -> AsyncPage:
+        context = await async_browser.new_context(viewport=dict(VIEWPORT_SIZE))
+        contexts.append(context)
+        page_obj = await context.new_page()
+        pages.append(page_obj)
+        await page_obj.add_init_script(DIALOG_STUB_SCRIPT)
+        page_obj.on("dialog", lambda dialog: dialog.dismiss())
+        await async_utils.init_page_and_wait_ready(page_obj)
+        return page_obj
+
+    async def _open(count: int) -> list[AsyncPage]:
+        return list(await asyncio.gather(*(_boot_one() for _ in range(count))))
+
+    try:
+        yield _open
+    finally:
+        test_failed, target_nodeid = _is_test_failed(request)
+        if test_failed:
+            safe_nodeid = re.sub(r"[^A-Za-z0-9._-]+", "_", target_nodeid)
+            for index, page_obj in enumerate(pages):
+                try:
+                    data = await page_obj.screenshot(full_page=True)
+                except Exception as exc:  # noqa: BLE001
+                    warnings.warn(
+                        f"Failed to capture failure screenshot for {safe_nodeid}: "
+                        f"{exc}",
+                        UserWarning,
+                        stacklevel=2,
+                    )
+                    continue
+                dest = ARTIFACTS_DIR / f"failure_{safe_nodeid}_page{index}.png"
+                writer = _SESSION_STATE.get("artifact_writer")
+                if writer is not None:
+                    writer.write_bytes(data, dest)
+                else:
+                    dest.write_bytes(data)
+        for context in contexts:
+            try:
+                await context.close()
+            except Exception:
+                pass
@@ -17,21 +17,28 @@ import os
 import time
 from typing import Any
 
+import pytest
 from playwright.sync_api import Page, expect
 
 from tests.test_utils import (
     DEFAULT_TIMEOUT,
-    start_game_and_wait_ready,
+    set_time_scale,
+    start_preseeded_game,
+    wait_for_game_state,
 )
 
+# Fuel ticks come from a Godot Timer, so per-tick consumption is unchanged
+FUEL_TIME_SCALE = 4.0
 
-def test_fuel_depletion(shared_page: Page) -> None:
+
+@pytest.mark.seed_settings(difficulty=2.0, log_level="DEBUG")
+def test_fuel_depletion(seeded_page: Page, seeded_coverage: tuple[Any, bool]) -> None:
     """
     Validate fuel depletes monotonically under difficulty 2.0 after starting the level.
 
-    Navigates menus via DOM overlays/callbacks, sets difficulty to 2.0, starts
-    the game, and samples `window.currentFuel` over time to verify depletion rate
-    and monotonicity.
+    Boots with difficulty 2.0 and DEBUG logging pre-seeded in user://settings.cfg,
+    starts the game directly at FUEL_TIME_SCALE game speed, and samples
+    `window.currentFuel` over time to verify depletion rate and monotonicity.
     """
     logs: list[dict[str, str]] = []
 
@@ -39,48 +46,43 @@ def test_fuel_depletion(shared_page: Page) -> None:
         """Console message handler to capture logs."""
         logs.append({"type": msg.type, "text": msg.text})
 
-    shared_page.on("console", on_console)
+    seeded_page.on("console", on_console)
 
-    cdp_session = None
-    coverage_started = False
+    # Coverage was started by seeded_page before the engine booted
+    cdp_session, coverage_started = seeded_coverage
 
     try:
-        # 1. Initialize CDP coverage, load page, configure settings & start game
-        cdp_session, coverage_started = start_game_and_wait_ready(
-            page=shared_page,
-            logs=logs,
-            difficulty=2.0,
-            log_level="DEBUG",
-        )
+        # 1. Start the game with pre-seeded settings
+        start_preseeded_game(seeded_page)
+        applied_scale = set_time_scale(seeded_page, FUEL_TIME_SCALE)
+        assert (
+            applied_scale == FUEL_TIME_SCALE
+        ), f"Time scale not applied: {applied_scale}"
 
         # 2. Verify canvas visibility
-        canvas = shared_page.locator("canvas")
+        canvas = seeded_page.locator("canvas")
         expect(canvas).to_be_visible(timeout=DEFAULT_TIMEOUT)
 
-        # 3. Focus Canvas and sample window.currentFuel deterministically as it ticks
+        # 3. Focus Canvas and sample fuel from the game state channel as it ticks
         canvas.focus()
 
-        # Wait deterministically until window.currentFuel is initialized
-        shared_page.wait_for_function(
-            "() => typeof window.currentFuel === 'number'",
-            timeout=DEFAULT_TIMEOUT,
-        )
+        # Wait for the first fuel value in the pushed game state snapshots
+        state = wait_for_game_state(seeded_page, "typeof state.fuel === 'number'")
 
         fuel_samples: list[float] = []
         sample_count = 5
 
         # Record initial reading
-        last_val = float(shared_page.evaluate("() => window.currentFuel"))
+        last_val = float(state["fuel"])
         fuel_samples.append(last_val)
 
-        # Collect subsequent samples by waiting for value updates (ticks)
+        # Collect subsequent samples as snapshots announce new fuel ticks
         for _ in range(sample_count - 1):
-            shared_page.wait_for_function(
-                f"() => typeof window.currentFuel === 'number' "
-                f"&& window.currentFuel !== {last_val}",
-                timeout=DEFAULT_TIMEOUT,
+            state = wait_for_game_state(
+                seeded_page,
+                f"typeof state.fuel === 'number' && state.fuel !== {last_val}",
             )
-            last_val = float(shared_page.evaluate("() => window.currentFuel"))
+            last_val = float(state["fuel"])
             fuel_samples.append(last_val)
 
         # Sanity check: fuel values must be numeric and within [0, 100]
@@ -104,7 +106,7 @@ def test_fuel_depletion(shared_page: Page) -> None:
         print(f"Test suite failed: {str(e)}")
         os.makedirs("artifacts", exist_ok=True)
         timestamp: int = int(time.time())
-        shared_page.screenshot(
+        seeded_page.screenshot(
             path=f"artifacts/test_fuel_depletion_failure_{timestamp}.png"
         )
         log_file = f"artifacts/test_fuel_depletion_failure_console_logs_{timestamp}.txt"
@@ -0,0 +1,59 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/gameplay_replay_test.py
+"""
+Gameplay Replay Test (Playwright, Python)
+=========================================
+
+Overview
+--------
+Replays a recorded keyboard scenario (``tests/replays/*.keys.json``) against a
+running level, frame-accurately through ``page.keyboard``, as a repeatable
+gameplay benchmark. Frame time, heap and Godot node counts over the replay are
+exported with the test's ``metrics_baseline.json`` entry.
+"""
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from tests.perf import input_replay
+from tests.test_utils import DEFAULT_TIMEOUT, start_preseeded_game
+
+# Scheduling slack before a replay stops counting as frame-accurate
+MAX_DRIFT_FRAMES = 2
+
+
+@pytest.mark.seed_settings(log_level="WARNING")
+@pytest.mark.parametrize(
+    "scenario",
+    sorted(path.name for path in input_replay.REPLAYS_DIR.glob("*.keys.json")),
+)
+def test_gameplay_replay(
+    seeded_page: Page, request: pytest.FixtureRequest, scenario: str
+) -> None:
+    """
+    E2E: Replays a recorded input scenario and checks it stayed frame-accurate.
+
+    Steps:
+    - Boot with WARNING logging so per-frame debug logs do not skew timings.
+    - Start the level from the Main Menu and focus the canvas.
+    - Replay the recording and verify every event reached the page within
+      ``MAX_DRIFT_FRAMES`` of its recorded frame.
+    """
+    recording = input_replay.load_recording(input_replay.REPLAYS_DIR / scenario)
+
+    start_preseeded_game(seeded_page, request)
+    canvas = seeded_page.locator("canvas")
+    expect(canvas).to_be_visible(timeout=DEFAULT_TIMEOUT)
+    canvas.focus()
+
+    summary = input_replay.replay_inputs(seeded_page, recording, request=request)
+
+    assert summary["events"] == len(recording["events"])
+    assert (
+        summary["missing_events"] == 0
+    ), f"{summary['missing_events']} replayed key events never reached the page"
+    assert summary["frames"] >= input_replay.recording_frames(recording)
+    assert (
+        summary["max_drift_frames"] <= MAX_DRIFT_FRAMES
+    ), f"Replay drifted {summary['max_drift_frames']} frames behind the recording"
@@ -0,0 +1,4 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/__init__.py
+"""Performance and diagnostics tooling shared by the Playwright E2E harness."""
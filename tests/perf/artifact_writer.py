@@ -0,0 +1,171 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/artifact_writer.py
+"""Background thread-pool writer for Playwright diagnostic artifacts.
+
+Playwright's sync API must stay on the main thread, so screenshots, trace
+exports, and context closing still happen there. Everything that only touches
+the filesystem afterwards (writing screenshot bytes, moving finalized videos,
+deleting discarded recordings, compressing HAR files) is handed to this writer
+so teardown can return as soon as the browser work is done.
+"""
+
+import gzip
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable
+
+DEFAULT_WORKERS = 2
+
+
+class ArtifactWriter:
+    """Finalize artifact files on a small thread pool and flush on demand.
+
+    Parameters
+    ----------
+    max_workers : int, default=DEFAULT_WORKERS
+        Number of background writer threads.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="artifact-writer"
+        )
+        self._lock = threading.Lock()
+        self._pending: list[Future] = []
+        self._errors: list[str] = []
+        self.stats: dict[str, Any] = {
+            "jobs": 0,
+            "failed_jobs": 0,
+            "bytes_written": 0,
+            "busy_sec": 0.0,
+        }
+
+    def _submit(self, description: str, job: Callable[[], int]) -> Future:
+        """Queue a filesystem job and account for its runtime and output size."""
+
+        def _run() -> None:
+            start = time.perf_counter()
+            try:
+                written = job()
+            except Exception as exc:  # noqa: BLE001 - surfaced on flush()
+                with self._lock:
+                    self.stats["failed_jobs"] += 1
+                    self._errors.append(f"{description}: {exc}")
+                written = 0
+            with self._lock:
+                self.stats["bytes_written"] += written
+                self.stats["busy_sec"] += time.perf_counter() - start
+
+        with self._lock:
+            self.stats["jobs"] += 1
+            future = self._executor.submit(_run)
+            self._pending.append(future)
+        return future
+
+    def write_bytes(self, data: bytes, dest: Path) -> Future:
+        """Write an in-memory payload (e.g. screenshot bytes) to ``dest``."""
+
+        def _job() -> int:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(data)
+            return len(data)
+
+        return self._submit(f"write {dest.name}", _job)
+
+    def move(self, src: Path, dest: Path, compress: bool = False) -> Future:
+        """Move a finalized file to ``dest``, gzip-compressing it when requested.
+
+        Parameters
+        ----------
+        src : Path
+            Finalized source file (no longer written by the browser).
+        dest : Path
+            Target path; ``.gz`` is appended when ``compress`` is True.
+        compress : bool, default=False
+            Whether to gzip the file instead of moving it verbatim.
+        """
+
+        src = Path(src)
+
+        def _job() -> int:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            if not compress:
+                shutil.move(str(src), str(dest))
+                return dest.stat().st_size
+            gz_dest = dest.with_name(dest.name + ".gz")
+            with (
+                open(src, "rb") as f_in,
+                gzip.open(gz_dest, "wb", compresslevel=6) as f_out,
+            ):
+                shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
+            src.unlink()
+            return gz_dest.stat().st_size
+
+        return self._submit(f"move {src.name}", _job)
+
+    def delete(self, path: Path) -> Future:
+        """Delete a discarded artifact file if it still exists."""
+
+        def _job() -> int:
+            Path(path).unlink(missing_ok=True)
+            return 0
+
+        return self._submit(f"delete {Path(path).name}", _job)
+
+    def flush(self, timeout: float | None = None) -> list[str]:
+        """Block until all queued jobs finish and return collected error messages.
+
+        Parameters
+        ----------
+        timeout : float | None, default=None
+            Maximum seconds to wait; unfinished jobs are reported as errors.
+
+        Returns
+        -------
+        list[str]
+            Error descriptions for failed or unfinished jobs since the last flush.
+        """
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+        _, not_done = wait(pending, timeout=timeout)
+        with self._lock:
+            errors = list(self._errors)
+            self._errors.clear()
+        if not_done:
+            errors.append(f"{len(not_done)} artifact job(s) still running after flush")
+        return errors
+
+    def shutdown(self) -> list[str]:
+        """Flush outstanding jobs and stop the worker threads."""
+        errors = self.flush()
+        self._executor.shutdown(wait=True)
+        return errors
+
+
+def write_terminal_summary(
+    terminalreporter: Any, entries: list[dict], writer_stats: dict[str, Any] | None
+) -> None:
+    """Output diagnostics teardown latency vs. background writer time."""
+    teardown_total = sum(
+        entry.get("diagnostics_teardown_sec", 0.0) for entry in entries
+    )
+    if not teardown_total and not writer_stats:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("Diagnostics Teardown Latency", sep="=", bold=True)
+    terminalreporter.write_line(
+        f"Diagnostics Teardown : {round(teardown_total, 4)}s (critical path)"
+    )
+    if writer_stats:
+        terminalreporter.write_line(
+            f"Background Writer    : {writer_stats['jobs']} jobs | "
+            f"{writer_stats['busy_sec']}s off the critical path | "
+            f"{writer_stats['bytes_written']} bytes | "
+            f"{writer_stats['failed_jobs']} failed"
+        )
+    terminalreporter.ensure_newline()
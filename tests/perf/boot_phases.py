@@ -0,0 +1,166 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/boot_phases.py
+"""Break the WASM boot down into phases for Playwright E2E tests.
+
+``init_page_and_wait_ready`` measures one number: navigation until
+``window.godotInitialized``. This module splits that into:
+
+* ``download_ms`` - fetching the ``.wasm`` binary (Resource Timing)
+* ``compile_instantiate_ms`` - end of the download until ``engine.init``
+  resolves (``skylock:wasm-ready``); streaming compilation that overlaps the
+  download is counted as download
+* ``pck_load_ms`` - fetching the ``.pck`` until ``skylock:pck-loaded``
+* ``godot_ready_ms`` - ``engine.start`` until ``Globals._ready``
+  (``skylock:engine-start`` -> ``skylock:godot-ready``)
+* ``first_frame_ms`` - ``Globals._ready`` until the first drawn frame
+  (``skylock:first-frame``)
+
+The ``skylock:*`` marks come from ``custom_shell.html`` and ``Globals._ready``.
+A boot is reported once per document, so on a shared page only the test that
+booted it gets the breakdown.
+"""
+
+from typing import Any
+
+from tests.perf.frame_timing import format_ms
+from tests.perf.page_metrics import PageMetricsPlugin
+
+BOOT_PHASE_KEYS = (
+    "download_ms",
+    "compile_instantiate_ms",
+    "pck_load_ms",
+    "godot_ready_ms",
+    "first_frame_ms",
+)
+
+# Returns null until Godot is ready or when this document's boot was reported
+BOOT_TIMING_SCRIPT = """
+() => {
+    if (window.__bootPhasesReported) return null;
+    const marks = {};
+    for (const mark of performance.getEntriesByType('mark')) {
+        if (mark.name.startsWith('skylock:')) marks[mark.name] = mark.startTime;
+    }
+    if (!('skylock:godot-ready' in marks)) return null;
+    window.__bootPhasesReported = true;
+    const transferBytes = performance.getEntriesByType('navigation')
+        .concat(performance.getEntriesByType('resource'))
+        .reduce((sum, entry) => sum + (entry.transferSize || 0), 0);
+    const resources = performance.getEntriesByType('resource')
+        .filter((entry) => /\\.(wasm|pck)(\\?|$)/.test(entry.name))
+        .map((entry) => ({
+            name: entry.name,
+            startTime: entry.startTime,
+            responseEnd: entry.responseEnd,
+            transferSize: entry.transferSize,
+            encodedBodySize: entry.encodedBodySize,
+        }));
+    return { marks, resources, transfer_bytes: transferBytes };
+}
+"""
+
+
+def _find_resource(
+    resources: list[dict[str, Any]], suffix: str
+) -> dict[str, Any] | None:
+    """Return the first Resource Timing entry whose URL path ends in ``suffix``."""
+    for entry in resources:
+        if entry["name"].split("?", 1)[0].endswith(suffix):
+            return entry
+    return None
+
+
+def _span(start: float | None, end: float | None) -> float | None:
+    """Return ``end - start`` in ms (rounded), or None if either bound is missing."""
+    if start is None or end is None:
+        return None
+    return round(max(end - start, 0.0), 2)
+
+
+def compute_boot_phases(payload: dict[str, Any]) -> dict[str, Any]:
+    """Turn page-side marks and Resource Timing entries into boot phases.
+
+    Parameters
+    ----------
+    payload : dict[str, Any]
+        ``{"marks": {name: ms}, "resources": [...]}`` as returned by
+        ``BOOT_TIMING_SCRIPT``; times are relative to navigation start.
+
+    Returns
+    -------
+    dict[str, Any]
+        Phase durations in ms (None when a mark or resource entry is missing),
+        ``total_ms`` to the last observed milestone, and transfer sizes
+        (``transfer_bytes`` covers every resource the document fetched).
+    """
+    marks = payload.get("marks", {})
+    resources = payload.get("resources", [])
+    wasm = _find_resource(resources, ".wasm")
+    pck = _find_resource(resources, ".pck")
+
+    wasm_ready = marks.get("skylock:wasm-ready")
+    pck_loaded = marks.get("skylock:pck-loaded")
+    godot_ready = marks.get("skylock:godot-ready")
+    first_frame = marks.get("skylock:first-frame")
+
+    phases: dict[str, Any] = {
+        "download_ms": _span(
+            wasm["startTime"] if wasm else None, wasm["responseEnd"] if wasm else None
+        ),
+        "compile_instantiate_ms": _span(
+            wasm["responseEnd"] if wasm else None, wasm_ready
+        ),
+        "pck_load_ms": _span(
+            pck["startTime"] if pck else marks.get("skylock:shell-start"), pck_loaded
+        ),
+        "godot_ready_ms": _span(marks.get("skylock:engine-start"), godot_ready),
+        "first_frame_ms": _span(godot_ready, first_frame),
+    }
+    milestones = [value for value in (godot_ready, first_frame) if value is not None]
+    phases["total_ms"] = round(max(milestones), 2) if milestones else None
+    phases["wasm_bytes"] = wasm.get("encodedBodySize") if wasm else None
+    phases["pck_bytes"] = pck.get("encodedBodySize") if pck else None
+    phases["transfer_bytes"] = payload.get("transfer_bytes")
+    return phases
+
+
+def collect_boot_phases(page: Any) -> dict[str, Any] | None:
+    """Fetch this document's boot marks once and compute the phase breakdown.
+
+    Returns None when the page has not finished booting or its boot was already
+    reported to an earlier test.
+    """
+    payload = page.evaluate(BOOT_TIMING_SCRIPT)
+    if not payload:
+        return None
+    return compute_boot_phases(payload)
+
+
+class BootPhasesPlugin(PageMetricsPlugin):
+    """Attach the WASM boot phase breakdown to the test that booted the page."""
+
+    metric_key = "boot_phases"
+    label = "Boot phase"
+
+    def finish(self, item: Any, page: Any, started: Any) -> dict[str, Any] | None:
+        _ = (item, started)
+        return collect_boot_phases(page)
+
+
+def write_terminal_summary(terminalreporter: Any, entries: list[dict]) -> None:
+    """Output the WASM boot phase breakdown for tests that booted a page."""
+    boot_entries = [entry for entry in entries if entry.get("boot_phases")]
+    if not boot_entries:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("WASM Boot Phases", sep="=", bold=True)
+    for entry in boot_entries:
+        phases = entry["boot_phases"]
+        cells = " | ".join(
+            f"{key[:-3]} {format_ms(phases.get(key))}" for key in BOOT_PHASE_KEYS
+        )
+        terminalreporter.write_line(
+            f"  • {entry['nodeid'].split('::')[-1]:<45} | {cells}"
+        )
+    terminalreporter.ensure_newline()
@@ -0,0 +1,200 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/budget.py
+"""Performance budgets checked against each test's metrics entry.
+
+``tests/perf_budget.json`` declares ceilings for the metrics in
+``BUDGET_METRICS``::
+
+    {
+      "version": 1,
+      "global": {"wasm_boot_sec": 15.0, "frame_p95_ms": 100.0},
+      "tests": {"tests/soak_test.py::*": {"js_heap_mb": 512.0}},
+      "environments": {
+        "ci": {"global": {"wasm_boot_sec": 30.0}, "tests": {}}
+      }
+    }
+
+``global`` limits apply to every test; ``tests`` keys are ``fnmatch``
+patterns on the node id, applied in file order so later patterns win. The
+selected environment's ``global`` and ``tests`` sections are layered on top.
+A limit of ``null`` removes an inherited ceiling. Tests that did not record a
+metric are never checked against it.
+"""
+
+import fnmatch
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+BUDGET_VERSION = 1
+
+DEFAULT_BUDGET_PATH = Path(__file__).resolve().parents[1] / "perf_budget.json"
+
+
+def _peak_js_heap_mb(entry: dict[str, Any]) -> float | None:
+    timeline = (entry.get("memory_timeline") or {}).get("timeline") or []
+    values = [row[1] for row in timeline if row[1] is not None]
+    return max(values) if values else None
+
+
+def _nested(*keys: str) -> Callable[[dict[str, Any]], float | None]:
+    def extract(entry: dict[str, Any]) -> float | None:
+        value: Any = entry
+        for key in keys:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    return extract
+
+
+# Budget metric -> (unit, extractor reading it from a metrics_baseline entry)
+BUDGET_METRICS: dict[str, tuple[str, Callable[[dict[str, Any]], float | None]]] = {
+    "wasm_boot_sec": ("s", _nested("wasm_boot_duration_sec")),
+    "js_heap_mb": ("MB", _peak_js_heap_mb),
+    "frame_p95_ms": ("ms", _nested("frame_timing", "p95_ms")),
+    "transfer_bytes": ("B", _nested("boot_phases", "transfer_bytes")),
+}
+
+
+def _check_limits(limits: Any, where: str) -> dict[str, float | None]:
+    if not isinstance(limits, dict):
+        raise ValueError(f"{where} must be an object of metric limits")
+    for metric, limit in limits.items():
+        if metric not in BUDGET_METRICS:
+            raise ValueError(
+                f"{where}: unknown budget metric {metric!r} "
+                f"(expected one of {', '.join(BUDGET_METRICS)})"
+            )
+        if limit is not None and not isinstance(limit, (int, float)):
+            raise ValueError(f"{where}.{metric} must be a number or null")
+    return limits
+
+
+def load_budget(path: Path, environment: str = "") -> dict[str, Any]:
+    """Load a budget file and layer the chosen environment over it.
+
+    Parameters
+    ----------
+    path : Path
+        Budget JSON file.
+    environment : str, default=""
+        Key under ``environments`` to apply; empty for the base budget.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``{"environment", "global", "tests": [(pattern, limits), ...]}``.
+
+    Raises
+    ------
+    ValueError
+        If the file is malformed, names an unknown metric, or the environment
+        is not declared.
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("version") != BUDGET_VERSION:
+        raise ValueError(f"{path}: unsupported budget version {data.get('version')}")
+
+    layers = [data]
+    if environment:
+        environments = data.get("environments", {})
+        if environment not in environments:
+            raise ValueError(
+                f"{path}: no budget environment {environment!r} "
+                f"(declared: {', '.join(sorted(environments)) or 'none'})"
+            )
+        layers.append(environments[environment])
+
+    global_limits: dict[str, float | None] = {}
+    tests: list[tuple[str, dict[str, float | None]]] = []
+    for layer in layers:
+        global_limits.update(_check_limits(layer.get("global", {}), "global"))
+        for pattern, limits in layer.get("tests", {}).items():
+            tests.append((pattern, _check_limits(limits, f"tests[{pattern!r}]")))
+    return {"environment": environment, "global": global_limits, "tests": tests}
+
+
+def resolve_limits(budget: dict[str, Any], nodeid: str) -> dict[str, tuple[float, str]]:
+    """Effective ceilings for one test.
+
+    Returns
+    -------
+    dict[str, tuple[float, str]]
+        Metric to ``(limit, source)``; the source is ``"global"`` or the
+        matching test pattern.
+    """
+    limits = {metric: (limit, "global") for metric, limit in budget["global"].items()}
+    for pattern, overrides in budget["tests"]:
+        if fnmatch.fnmatchcase(nodeid, pattern):
+            for metric, limit in overrides.items():
+                limits[metric] = (limit, pattern)
+    return {
+        metric: (limit, source)
+        for metric, (limit, source) in limits.items()
+        if limit is not None
+    }
+
+
+def check_budget(entry: dict[str, Any], budget: dict[str, Any]) -> list[dict[str, Any]]:
+    """Compare a test's metrics entry with its ceilings.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        One ``{"metric", "value", "limit", "unit", "source"}`` per exceeded
+        ceiling, in ``BUDGET_METRICS`` order.
+    """
+    limits = resolve_limits(budget, entry["nodeid"])
+    violations = []
+    for metric, (unit, extract) in BUDGET_METRICS.items():
+        if metric not in limits:
+            continue
+        value = extract(entry)
+        limit, source = limits[metric]
+        if value is not None and value > limit:
+            violations.append(
+                {
+                    "metric": metric,
+                    "value": value,
+                    "limit": limit,
+                    "unit": unit,
+                    "source": source,
+                }
+            )
+    return violations
+
+
+def describe_violation(violation: dict[str, Any]) -> str:
+    """One-line ``value > limit`` diff for a budget violation."""
+    over = violation["value"] - violation["limit"]
+    percent = f", {over / violation['limit']:+.1%}" if violation["limit"] else ""
+    unit = violation["unit"]
+    return (
+        f"{violation['metric']}: {violation['value']:g} {unit} > "
+        f"{violation['limit']:g} {unit} (+{over:g} {unit}{percent}) "
+        f"[{violation['source']}]"
+    )
+
+
+def format_violations(violations: list[dict[str, Any]], environment: str) -> str:
+    """Failure text listing every exceeded ceiling."""
+    lines = [f"Performance budget exceeded (environment: {environment or 'default'})"]
+    lines += [f"  {describe_violation(violation)}" for violation in violations]
+    return "\n".join(lines)
+
+
+def write_terminal_summary(terminalreporter: Any, entries: list[dict]) -> None:
+    """Output every performance budget ceiling a test exceeded."""
+    budget_entries = [entry for entry in entries if entry.get("budget_violations")]
+    if not budget_entries:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("Performance Budget Violations", sep="=", bold=True)
+    for entry in budget_entries:
+        terminalreporter.write_line(f"  • {entry['nodeid'].split('::')[-1]}")
+        for violation in entry["budget_violations"]:
+            terminalreporter.write_line(f"      {describe_violation(violation)}")
+    terminalreporter.ensure_newline()
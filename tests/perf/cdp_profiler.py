@@ -0,0 +1,284 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/cdp_profiler.py
+"""Per-test CDP performance metrics and sampled CPU profiles.
+
+``CdpPerfCapture`` opens a dedicated CDP session on a page, snapshots
+``Performance.getMetrics`` and starts the V8 sampling profiler; ``stop()``
+returns the metric deltas and the raw ``Profiler.Profile``. ``to_speedscope``
+converts that profile into speedscope's sampled file format so it can be
+opened at https://www.speedscope.app.
+
+The session is separate from the one ``init_cdp_coverage`` uses, so precise
+coverage and sampling can run side by side. ``CdpProfilePlugin`` runs a capture
+around every ``--cdp-profile`` or ``cdp_profile``-marked test.
+"""
+
+import json
+import re
+import warnings
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from tests.perf.page_metrics import AttachMetric, item_page
+
+DEFAULT_SAMPLING_INTERVAL_US = 1000
+
+# Cumulative Performance.getMetrics counters reported as per-test deltas
+CDP_DELTA_METRICS = (
+    "ScriptDuration",
+    "LayoutDuration",
+    "RecalcStyleDuration",
+    "TaskDuration",
+    "LayoutCount",
+    "RecalcStyleCount",
+)
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+def metrics_to_dict(metrics: list[dict[str, Any]]) -> dict[str, float]:
+    """Flatten a ``Performance.getMetrics`` result into a name -> value map."""
+    return {metric["name"]: metric["value"] for metric in metrics}
+
+
+def metrics_delta(
+    before: dict[str, float], after: dict[str, float]
+) -> dict[str, float]:
+    """Compute per-test deltas for the cumulative counters in ``CDP_DELTA_METRICS``.
+
+    Durations are reported by CDP in seconds and rounded to microseconds.
+    """
+    delta: dict[str, float] = {}
+    for name in CDP_DELTA_METRICS:
+        if name in before and name in after:
+            delta[name] = round(after[name] - before[name], 6)
+    return delta
+
+
+def to_speedscope(profile: dict[str, Any], name: str) -> dict[str, Any]:
+    """Convert a CDP ``Profiler.Profile`` into a speedscope sampled profile.
+
+    Parameters
+    ----------
+    profile : dict[str, Any]
+        The ``profile`` object returned by ``Profiler.stop``.
+    name : str
+        Profile name shown in speedscope (usually the test node ID).
+
+    Returns
+    -------
+    dict[str, Any]
+        A speedscope file payload with one "sampled" profile in microseconds.
+    """
+    nodes = {node["id"]: node for node in profile.get("nodes", [])}
+    parents: dict[int, int] = {}
+    for node in nodes.values():
+        for child_id in node.get("children", []):
+            parents[child_id] = node["id"]
+
+    frames: list[dict[str, Any]] = []
+    frame_index: dict[tuple[str, str, int, int], int] = {}
+    node_frame: dict[int, int | None] = {}
+    for node_id, node in nodes.items():
+        call_frame = node.get("callFrame", {})
+        function_name = call_frame.get("functionName") or "(anonymous)"
+        if function_name == "(root)":
+            node_frame[node_id] = None
+            continue
+        key = (
+            function_name,
+            call_frame.get("url", ""),
+            call_frame.get("lineNumber", -1),
+            call_frame.get("columnNumber", -1),
+        )
+        if key not in frame_index:
+            frame: dict[str, Any] = {"name": function_name}
+            if key[1]:
+                frame["file"] = key[1]
+            if key[2] >= 0:
+                # CDP positions are 0-based; speedscope expects 1-based
+                frame["line"] = key[2] + 1
+                frame["col"] = key[3] + 1
+            frame_index[key] = len(frames)
+            frames.append(frame)
+        node_frame[node_id] = frame_index[key]
+
+    stack_cache: dict[int, list[int]] = {}
+
+    def _stack(node_id: int) -> list[int]:
+        if node_id not in stack_cache:
+            chain: list[int] = []
+            current: int | None = node_id
+            while current is not None:
+                index = node_frame.get(current)
+                if index is not None:
+                    chain.append(index)
+                current = parents.get(current)
+            stack_cache[node_id] = chain[::-1]
+        return stack_cache[node_id]
+
+    sample_ids = profile.get("samples", [])
+    deltas = profile.get("timeDeltas", [])
+    samples: list[list[int]] = []
+    weights: list[float] = []
+    for i, node_id in enumerate(sample_ids):
+        # timeDeltas[i] precedes sample i, so sample i lasts until the next one
+        weight = deltas[i + 1] if i + 1 < len(deltas) else 0
+        samples.append(_stack(node_id))
+        weights.append(max(weight, 0))
+
+    return {
+        "$schema": SPEEDSCOPE_SCHEMA,
+        "name": name,
+        "exporter": "skylock-e2e",
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "microseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        ],
+    }
+
+
+class CdpPerfCapture:
+    """Capture CDP performance metric deltas and a CPU profile for one page.
+
+    Parameters
+    ----------
+    page : playwright.sync_api.Page
+        The page to profile (Chromium only).
+    sampling_interval_us : int, default=DEFAULT_SAMPLING_INTERVAL_US
+        V8 sampling profiler interval in microseconds.
+    """
+
+    def __init__(
+        self, page: Any, sampling_interval_us: int = DEFAULT_SAMPLING_INTERVAL_US
+    ) -> None:
+        self.page = page
+        self.sampling_interval_us = sampling_interval_us
+        self._cdp: Any = None
+        self._before: dict[str, float] = {}
+
+    def start(self) -> None:
+        """Open the CDP session, snapshot metrics, and start sampling."""
+        self._cdp = self.page.context.new_cdp_session(self.page)
+        self._cdp.send("Performance.enable", {"timeDomain": "timeTicks"})
+        self._before = metrics_to_dict(
+            self._cdp.send("Performance.getMetrics")["metrics"]
+        )
+        self._cdp.send("Profiler.enable")
+        self._cdp.send(
+            "Profiler.setSamplingInterval", {"interval": self.sampling_interval_us}
+        )
+        self._cdp.send("Profiler.start")
+
+    def stop(self) -> tuple[dict[str, float], dict[str, Any]]:
+        """Stop sampling and return ``(metric_deltas, cdp_profile)``."""
+        try:
+            profile = self._cdp.send("Profiler.stop")["profile"]
+            after = metrics_to_dict(self._cdp.send("Performance.getMetrics")["metrics"])
+            return metrics_delta(self._before, after), profile
+        finally:
+            try:
+                self._cdp.detach()
+            except Exception:
+                pass
+            self._cdp = None
+
+
+class CdpProfilePlugin:
+    """Opt-in CDP metric deltas and sampled CPU profile for each test.
+
+    Metric deltas (script, layout, style, task duration) go into the test's
+    ``metrics_baseline.json`` entry under ``cdp_metrics``; the CPU profile is
+    saved as ``cpuprofile_<nodeid>.speedscope.json``.
+
+    Parameters
+    ----------
+    attach : Callable[[str, str, Any], None]
+        Stores a metric under ``key`` in the entry of test ``nodeid``.
+    save_artifact : Callable[[str, bytes], None]
+        Writes an artifact file by name.
+    sampling_interval_us : int, default=DEFAULT_SAMPLING_INTERVAL_US
+        V8 sampling profiler interval in microseconds.
+    all_tests : bool, default=False
+        Profile every test (``--cdp-profile``) rather than only those marked
+        ``cdp_profile``.
+    """
+
+    def __init__(
+        self,
+        attach: AttachMetric,
+        save_artifact: Callable[[str, bytes], None],
+        sampling_interval_us: int = DEFAULT_SAMPLING_INTERVAL_US,
+        all_tests: bool = False,
+    ) -> None:
+        self._attach = attach
+        self._save_artifact = save_artifact
+        self._interval = sampling_interval_us
+        self._all_tests = all_tests
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        page = item_page(item)
+        if page is None or not (
+            self._all_tests or item.get_closest_marker("cdp_profile")
+        ):
+            yield
+            return
+        capture = CdpPerfCapture(page, sampling_interval_us=self._interval)
+        try:
+            capture.start()
+        except Exception as exc:  # noqa: BLE001 - profiling is best-effort
+            warnings.warn(
+                f"CDP profiling could not start: {exc}", UserWarning, stacklevel=2
+            )
+            yield
+            return
+        yield
+
+        try:
+            deltas, profile = capture.stop()
+        except Exception as exc:  # noqa: BLE001 - profiling is best-effort
+            warnings.warn(
+                f"CDP profiling could not stop: {exc}", UserWarning, stacklevel=2
+            )
+            return
+        self._attach(item.nodeid, "cdp_metrics", deltas)
+        safe_nodeid = re.sub(r"[^A-Za-z0-9._-]+", "_", item.nodeid)
+        payload = json.dumps(to_speedscope(profile, item.nodeid)).encode("utf-8")
+        self._save_artifact(f"cpuprofile_{safe_nodeid}.speedscope.json", payload)
+
+
+def write_terminal_summary(
+    terminalreporter: Any, entries: list[dict], artifacts_dir: Path
+) -> None:
+    """Output the opt-in CDP main-thread time breakdown."""
+    cdp_entries = [entry for entry in entries if entry.get("cdp_metrics")]
+    if not cdp_entries:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("CDP Performance Metrics", sep="=", bold=True)
+    for entry in cdp_entries:
+        metrics = entry["cdp_metrics"]
+        terminalreporter.write_line(
+            f"  • {entry['nodeid'].split('::')[-1]:<45} | "
+            f"Script {metrics.get('ScriptDuration', 0.0):.3f}s | "
+            f"Layout {metrics.get('LayoutDuration', 0.0):.3f}s | "
+            f"Style {metrics.get('RecalcStyleDuration', 0.0):.3f}s | "
+            f"Task {metrics.get('TaskDuration', 0.0):.3f}s"
+        )
+    terminalreporter.write_line(
+        f"CPU profiles: {artifacts_dir}/cpuprofile_*.speedscope.json"
+    )
+    terminalreporter.ensure_newline()
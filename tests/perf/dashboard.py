@@ -0,0 +1,322 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/dashboard.py
+"""Offline HTML performance dashboard built from the metrics history.
+
+Renders the ``metrics_history`` database (or ``metrics_baseline*.json`` files
+ingested on the fly) into one self-contained HTML file: styles and inline SVG
+trend charts are embedded, with no scripts, CDN or network access, so the file
+can be uploaded as a CI artifact and opened locally.
+
+The dashboard shows suite wall time per shard and, for each metric in
+``DASHBOARD_METRICS``, the per-run median across tests plus a per-test table
+with sparklines::
+
+    python -m tests.perf.dashboard --db artifacts/metrics_history.sqlite
+    python -m tests.perf.dashboard --baseline artifacts/metrics_baseline*.json
+"""
+
+import argparse
+import html
+import sqlite3
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from tests.perf import metrics_history
+from tests.test_utils import ARTIFACTS_DIR
+
+# Flattened metric name -> (chart title, unit, scale applied to stored values)
+DASHBOARD_METRICS = {
+    "duration_sec": ("Test duration", "s", 1.0),
+    "wasm_boot_duration_sec": ("WASM boot", "s", 1.0),
+    "boot_phases.total_ms": ("Boot phases total", "ms", 1.0),
+    "frame_timing.p95_ms": ("Frame time p95", "ms", 1.0),
+    "memory_timeline.js_heap_slope_mb_per_min": ("JS heap growth", "MB/min", 1.0),
+    "browser_process.cpu_sec": ("Chromium CPU time", "s", 1.0),
+    "browser_process.rss_peak_mb": ("Chromium peak RSS", "MB", 1.0),
+    "engine_monitors.end.static_memory_bytes": (
+        "Godot static memory",
+        "MB",
+        1.0 / 1048576.0,
+    ),
+}
+
+DEFAULT_RUNS = 50
+
+# Line colours cycled across series (colour-blind friendly)
+_PALETTE = ("#0072b2", "#e69f00", "#009e73", "#cc79a7", "#56b4e9", "#d55e00")
+
+_CHART_WIDTH = 640
+_CHART_HEIGHT = 200
+_CHART_PAD = 36
+
+_STYLE = """
+body { font: 14px/1.4 system-ui, sans-serif; margin: 24px; color: #222; }
+h1 { font-size: 22px; } h2 { font-size: 18px; margin-top: 32px; }
+table { border-collapse: collapse; margin-top: 8px; }
+th, td { padding: 3px 8px; border-bottom: 1px solid #ddd; text-align: right; }
+th:first-child, td:first-child { text-align: left; font-family: monospace; }
+.legend span { margin-right: 14px; }
+.muted { color: #777; }
+svg text { font: 11px system-ui, sans-serif; fill: #555; }
+"""
+
+
+def _fmt(value: float | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value:.4g}"
+
+
+def svg_line_chart(
+    series: dict[str, list[tuple[int, float]]],
+    x_labels: list[str],
+    unit: str,
+    width: int = _CHART_WIDTH,
+    height: int = _CHART_HEIGHT,
+) -> str:
+    """Render named ``(x_index, value)`` series as an inline SVG line chart.
+
+    Parameters
+    ----------
+    series : dict[str, list[tuple[int, float]]]
+        Points per series; ``x_index`` indexes ``x_labels``.
+    x_labels : list[str]
+        Label per x position (first and last are drawn).
+    unit : str
+        Unit appended to the y-axis labels and point tooltips.
+
+    Returns
+    -------
+    str
+        An ``<svg>`` element, or a short note when there are no points.
+    """
+    values = [value for points in series.values() for _, value in points]
+    if not values:
+        return '<p class="muted">No data recorded.</p>'
+    low, high = min(values), max(values)
+    if high == low:
+        low, high = low - 1.0, high + 1.0
+    span_x = max(len(x_labels) - 1, 1)
+    plot_w = width - 2 * _CHART_PAD
+    plot_h = height - 2 * _CHART_PAD
+
+    def x_pos(index: int) -> float:
+        return round(_CHART_PAD + plot_w * index / span_x, 1)
+
+    def y_pos(value: float) -> float:
+        return round(_CHART_PAD + plot_h * (high - value) / (high - low), 1)
+
+    parts = [
+        f'<svg width="{width}" '
+        f'height="{height}" viewBox="0 0 {width} {height}" role="img">',
+        f'<rect x="{_CHART_PAD}" y="{_CHART_PAD}" width="{plot_w}" '
+        f'height="{plot_h}" fill="none" stroke="#ccc"/>',
+        f'<text x="4" y="{_CHART_PAD + 4}">{_fmt(high)} {html.escape(unit)}</text>',
+        f'<text x="4" y="{height - _CHART_PAD}">{_fmt(low)} {html.escape(unit)}</text>',
+    ]
+    if x_labels:
+        parts.append(
+            f'<text x="{_CHART_PAD}" y="{height - 8}">'
+            f"{html.escape(x_labels[0])}</text>"
+        )
+        parts.append(
+            f'<text x="{width - _CHART_PAD}" y="{height - 8}" text-anchor="end">'
+            f"{html.escape(x_labels[-1])}</text>"
+        )
+    for number, (name, points) in enumerate(sorted(series.items())):
+        colour = _PALETTE[number % len(_PALETTE)]
+        coords = " ".join(f"{x_pos(x)},{y_pos(value)}" for x, value in points)
+        parts.append(
+            f'<polyline points="{coords}" fill="none" stroke="{colour}" '
+            'stroke-width="2"/>'
+        )
+        for x, value in points:
+            label = f"{name} @ {x_labels[x]}: {_fmt(value)} {unit}"
+            parts.append(
+                f'<circle cx="{x_pos(x)}" cy="{y_pos(value)}" r="3" '
+                f'fill="{colour}"><title>{html.escape(label)}</title></circle>'
+            )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def svg_sparkline(values: list[float], width: int = 120, height: int = 24) -> str:
+    """Render a bare inline SVG sparkline of ``values`` (oldest first)."""
+    if len(values) < 2:
+        return ""
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    step = (width - 4) / (len(values) - 1)
+    coords = " ".join(
+        f"{round(2 + step * index, 1)},"
+        f"{round(2 + (height - 4) * (high - value) / span, 1)}"
+        for index, value in enumerate(values)
+    )
+    return (
+        f'<svg width="{width}" '
+        f'height="{height}"><polyline points="{coords}" fill="none" '
+        f'stroke="{_PALETTE[0]}" stroke-width="1.5"/></svg>'
+    )
+
+
+def collect_dashboard_data(
+    conn: sqlite3.Connection, runs: int = DEFAULT_RUNS
+) -> dict[str, Any]:
+    """Gather the dashboard series from the history database.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        Connection from ``metrics_history.connect``.
+    runs : int, default=DEFAULT_RUNS
+        Number of most recent runs to chart.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``runs`` (oldest first), ``x_labels``, ``wall`` (suite wall time per
+        shard) and ``metrics`` keyed by ``DASHBOARD_METRICS`` with the per-run
+        ``median`` series and per-test ``tests`` value lists.
+    """
+    recent = list(reversed(metrics_history.list_runs(conn, limit=runs)))
+    index = {run["id"]: position for position, run in enumerate(recent)}
+    x_labels = [
+        f"{run['commit_sha'][:7]} {run['timestamp'][:10]}".strip() for run in recent
+    ]
+
+    wall: dict[str, list[tuple[int, float]]] = {}
+    for run in recent:
+        if run["total_duration_sec"] is not None:
+            wall.setdefault(run["shard"] or "suite", []).append(
+                (index[run["id"]], run["total_duration_sec"])
+            )
+
+    metrics: dict[str, Any] = {}
+    placeholders = ",".join("?" * len(index))
+    for metric, (_, _, scale) in DASHBOARD_METRICS.items():
+        per_run: dict[int, list[float]] = {}
+        per_test: dict[str, list[float]] = {}
+        if index:
+            rows = conn.execute(
+                "SELECT run_id, nodeid, value FROM test_metrics "
+                f"WHERE metric = ? AND run_id IN ({placeholders})",
+                [metric, *index],
+            ).fetchall()
+            for run_id, nodeid, value in sorted(rows, key=lambda row: index[row[0]]):
+                per_run.setdefault(index[run_id], []).append(value * scale)
+                per_test.setdefault(nodeid, []).append(value * scale)
+        metrics[metric] = {
+            "median": [
+                (position, statistics.median(values))
+                for position, values in sorted(per_run.items())
+            ],
+            "tests": dict(sorted(per_test.items())),
+        }
+    return {"runs": recent, "x_labels": x_labels, "wall": wall, "metrics": metrics}
+
+
+def render_dashboard(
+    data: dict[str, Any], title: str = "SkyLockAssault Performance"
+) -> str:
+    """Render collected dashboard data as a standalone HTML document."""
+    runs = data["runs"]
+    latest = runs[-1] if runs else None
+    body = [
+        f"<h1>{html.escape(title)}</h1>",
+        '<p class="muted">'
+        f"Generated {time.strftime('%Y-%m-%d %H:%M UTC', time.gmtime())} from "
+        f"{len(runs)} run(s)"
+        + (
+            f"; latest commit {html.escape(latest['commit_sha'][:12])} "
+            f"at {html.escape(latest['timestamp'])}"
+            if latest
+            else ""
+        )
+        + ".</p>",
+        "<h2>Suite wall time</h2>",
+        _legend(data["wall"]),
+        svg_line_chart(data["wall"], data["x_labels"], "s"),
+    ]
+    for metric, (name, unit, _) in DASHBOARD_METRICS.items():
+        series = data["metrics"][metric]
+        body += [
+            f'<h2>{html.escape(name)} <span class="muted">({html.escape(metric)}, '
+            "median across tests)</span></h2>",
+            svg_line_chart({"median": series["median"]}, data["x_labels"], unit),
+        ]
+        if series["tests"]:
+            body.append(_test_table(series["tests"], unit))
+    return (
+        '<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">'
+        f"<title>{html.escape(title)}</title><style>{_STYLE}</style></head>"
+        f"<body>{''.join(body)}</body></html>\n"
+    )
+
+
+def _legend(series: dict[str, Any]) -> str:
+    items = "".join(
+        f'<span style="color:{_PALETTE[number % len(_PALETTE)]}">&#9632; '
+        f"{html.escape(name)}</span>"
+        for number, name in enumerate(sorted(series))
+    )
+    return f'<p class="legend">{items}</p>'
+
+
+def _test_table(tests: dict[str, list[float]], unit: str) -> str:
+    rows = "".join(
+        f"<tr><td>{html.escape(nodeid)}</td><td>{_fmt(values[-1])}</td>"
+        f"<td>{_fmt(min(values))}</td><td>{_fmt(max(values))}</td>"
+        f"<td>{svg_sparkline(values)}</td></tr>"
+        for nodeid, values in tests.items()
+    )
+    unit = html.escape(unit)
+    return (
+        f"<table><tr><th>Test</th><th>Latest ({unit})</th><th>Min</th>"
+        f"<th>Max</th><th>Trend</th></tr>{rows}</table>"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: write the dashboard HTML."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, default=metrics_history.DEFAULT_DB_PATH)
+    parser.add_argument(
+        "--baseline",
+        nargs="+",
+        type=Path,
+        default=[],
+        help="Chart these metrics_baseline*.json files instead of --db.",
+    )
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument(
+        "--output", type=Path, default=ARTIFACTS_DIR / "perf_dashboard.html"
+    )
+    args = parser.parse_args(argv)
+
+    if args.baseline:
+        conn = metrics_history.connect(Path(":memory:"))
+        commit = metrics_history.resolve_commit()
+        for path in args.baseline:
+            metrics_history.ingest_file(conn, path, commit)
+    elif args.db.is_file():
+        conn = metrics_history.connect(args.db)
+    else:
+        print(f"No metrics history at {args.db}", file=sys.stderr)
+        return 1
+    try:
+        data = collect_dashboard_data(conn, runs=args.runs)
+    finally:
+        conn.close()
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(render_dashboard(data), encoding="utf-8")
+    print(f"Wrote dashboard for {len(data['runs'])} run(s) -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/engine_monitors.py
+"""Godot ``Performance`` monitor snapshots at test boundaries.
+
+JS heap numbers miss almost all of Godot's memory, which lives in WebAssembly
+linear memory and engine objects. ``Globals`` binds
+``window.requestEngineMonitors``; calling it synchronously publishes static
+memory, object/resource/node/orphan counts and draw calls to
+``window.engineMonitors``. ``EngineMonitorsPlugin`` snapshots it before and
+after each test and records both plus the delta.
+"""
+
+from typing import Any
+
+from tests.perf.page_metrics import PageMetricsPlugin
+
+ENGINE_MONITOR_KEYS = (
+    "static_memory_bytes",
+    "static_memory_max_bytes",
+    "object_count",
+    "resource_count",
+    "node_count",
+    "orphan_node_count",
+    "draw_calls",
+)
+
+# Counters compared across a test; draw calls are per frame and not cumulative
+ENGINE_MONITOR_DELTA_KEYS = (
+    "static_memory_bytes",
+    "object_count",
+    "resource_count",
+    "node_count",
+    "orphan_node_count",
+)
+
+ENGINE_MONITORS_SCRIPT = """
+() => {
+    if (typeof window.requestEngineMonitors !== 'function') return null;
+    window.engineMonitors = null;
+    window.requestEngineMonitors([]);
+    const raw = window.engineMonitors;
+    return typeof raw === 'string' ? JSON.parse(raw) : raw;
+}
+"""
+
+
+def snapshot_engine_monitors(page: Any) -> dict[str, int] | None:
+    """Request a monitor snapshot from ``Globals``; None if not exposed yet."""
+    snapshot = page.evaluate(ENGINE_MONITORS_SCRIPT)
+    if not snapshot:
+        return None
+    return {key: int(snapshot[key]) for key in ENGINE_MONITOR_KEYS if key in snapshot}
+
+
+def monitors_delta(
+    start: dict[str, int] | None, end: dict[str, int] | None
+) -> dict[str, int] | None:
+    """Compute per-test deltas of the cumulative monitors.
+
+    Parameters
+    ----------
+    start : dict[str, int] | None
+        Snapshot taken at test setup (None when the engine was not booted yet).
+    end : dict[str, int] | None
+        Snapshot taken at test teardown.
+
+    Returns
+    -------
+    dict[str, int] | None
+        ``end - start`` for ``ENGINE_MONITOR_DELTA_KEYS``, or None when either
+        snapshot is missing.
+    """
+    if not start or not end:
+        return None
+    return {
+        key: end[key] - start[key]
+        for key in ENGINE_MONITOR_DELTA_KEYS
+        if key in start and key in end
+    }
+
+
+class EngineMonitorsPlugin(PageMetricsPlugin):
+    """Record ``{"start", "end", "delta"}`` monitor snapshots per test.
+
+    Pages that boot during the test only get an end snapshot.
+    """
+
+    metric_key = "engine_monitors"
+    label = "Engine monitor"
+
+    def start(self, page: Any) -> dict[str, int] | None:
+        return snapshot_engine_monitors(page)
+
+    def finish(self, item: Any, page: Any, started: Any) -> dict[str, Any] | None:
+        _ = item
+        end = snapshot_engine_monitors(page)
+        if not end:
+            return None
+        return {"start": started, "end": end, "delta": monitors_delta(started, end)}
+
+
+def write_terminal_summary(terminalreporter: Any, entries: list[dict]) -> None:
+    """Output Godot engine monitors at the end of each test."""
+    monitor_entries = [entry for entry in entries if entry.get("engine_monitors")]
+    if not monitor_entries:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("Godot Engine Monitors", sep="=", bold=True)
+    for entry in monitor_entries:
+        end = entry["engine_monitors"]["end"]
+        delta = entry["engine_monitors"]["delta"] or {}
+        orphans = delta.get("orphan_node_count")
+        terminalreporter.write_line(
+            f"  • {entry['nodeid'].split('::')[-1]:<45} | "
+            f"objects {end.get('object_count')} | "
+            f"nodes {end.get('node_count')} | "
+            f"orphans {end.get('orphan_node_count')}"
+            f"{f' ({orphans:+d})' if orphans else ''} | "
+            f"draw calls {end.get('draw_calls')}"
+        )
+    terminalreporter.ensure_newline()
@@ -0,0 +1,151 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/fixture_timing.py
+"""Per-fixture setup and teardown timing for the metrics baseline.
+
+``FixtureTimingPlugin`` times every fixture's setup and teardown. Totals are
+aggregated per ``(fixture, scope)`` for the ``fixture_timings`` ranking and
+per test for the ``fixtures`` key of its ``metrics_baseline.json`` entry.
+Module- and session-scoped fixtures are attributed to the test whose setup or
+teardown phase they ran in, like ``diagnostics_teardown_sec``.
+"""
+
+import time
+from typing import Any, Callable
+
+import pytest
+
+# Number of slowest fixtures listed in the terminal summary
+SLOWEST_FIXTURES_SHOWN = 10
+
+# Per-test entries only list fixtures that took at least this long
+FIXTURE_TIMING_MIN_SEC = 0.001
+
+
+class FixtureTimingPlugin:
+    """Times every fixture's setup and teardown.
+
+    Registered as a plugin rather than defined as conftest hooks: fixture
+    hooks are dispatched through the requesting node's hook proxy, which for
+    session-scoped fixtures (browser launch, shared engine boot) does not
+    include conftests below the rootdir.
+
+    Parameters
+    ----------
+    paused : Callable[[], bool], optional
+        Returns True while fixtures must not be counted, e.g. during an
+        "on-retry" diagnostic rerun whose cost is reported separately.
+    """
+
+    def __init__(self, paused: Callable[[], bool] | None = None) -> None:
+        self._paused = paused or (lambda: False)
+        # Aggregated durations keyed by (fixture name, scope)
+        self.timings: dict[tuple[str, str], dict[str, Any]] = {}
+        # Fixture timings of each test, until popped into its entry
+        self.test_timings: dict[str, dict[str, dict[str, float]]] = {}
+        # perf_counter() at which each active fixture's teardown began
+        self._teardown_started: dict[int, float] = {}
+        self.current_nodeid: str | None = None
+
+    def record(self, fixturedef: Any, phase: str, seconds: float) -> None:
+        """Aggregate one fixture setup or teardown and attribute it to the running test.
+
+        Parameters
+        ----------
+        fixturedef : _pytest.fixtures.FixtureDef
+            The fixture definition being set up or finalized.
+        phase : str
+            ``"setup"`` or ``"teardown"``.
+        seconds : float
+            Measured duration.
+        """
+        if self._paused():
+            return
+        stats = self.timings.setdefault(
+            (fixturedef.argname, fixturedef.scope),
+            {
+                "setup_count": 0,
+                "setup_sec": 0.0,
+                "setup_max_sec": 0.0,
+                "teardown_sec": 0.0,
+            },
+        )
+        if phase == "setup":
+            stats["setup_count"] += 1
+            stats["setup_max_sec"] = max(stats["setup_max_sec"], seconds)
+        stats[f"{phase}_sec"] += seconds
+
+        if self.current_nodeid:
+            fixtures = self.test_timings.setdefault(self.current_nodeid, {})
+            timing = fixtures.setdefault(fixturedef.argname, {})
+            timing[f"{phase}_sec"] = round(timing.get(f"{phase}_sec", 0.0) + seconds, 4)
+
+    def pop_test_timings(self, nodeid: str) -> dict[str, dict[str, float]]:
+        """Remove a test's fixture timings, keeping only non-trivial fixtures."""
+        return {
+            name: timing
+            for name, timing in self.test_timings.pop(nodeid, {}).items()
+            if max(timing.values()) >= FIXTURE_TIMING_MIN_SEC
+        }
+
+    def slowest_fixtures(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Rank fixtures by total setup plus teardown time, slowest first."""
+        ranked = sorted(
+            (
+                {
+                    "fixture": name,
+                    "scope": scope,
+                    "setup_count": stats["setup_count"],
+                    "setup_sec": round(stats["setup_sec"], 4),
+                    "setup_max_sec": round(stats["setup_max_sec"], 4),
+                    "teardown_sec": round(stats["teardown_sec"], 4),
+                    "total_sec": round(stats["setup_sec"] + stats["teardown_sec"], 4),
+                }
+                for (name, scope), stats in self.timings.items()
+            ),
+            key=lambda row: row["total_sec"],
+            reverse=True,
+        )
+        return ranked[:limit] if limit is not None else ranked
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        _ = location
+        self.current_nodeid = nodeid
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        _ = (nodeid, location)
+        self.current_nodeid = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        _ = request
+        started = time.perf_counter()
+        yield
+        self.record(fixturedef, "setup", time.perf_counter() - started)
+        # Finalizers run LIFO: this one fires before the fixture's own teardown
+        key = id(fixturedef)
+        fixturedef.addfinalizer(
+            lambda: self._teardown_started.__setitem__(key, time.perf_counter())
+        )
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        _ = request
+        started = self._teardown_started.pop(id(fixturedef), None)
+        if started is not None:
+            self.record(fixturedef, "teardown", time.perf_counter() - started)
+
+
+def write_terminal_summary(terminalreporter: Any, rows: list[dict[str, Any]]) -> None:
+    """Output the slowest fixtures by total setup + teardown time."""
+    if not rows:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("Slowest Fixtures", sep="=", bold=True)
+    for row in rows:
+        terminalreporter.write_line(
+            f"  • {row['fixture']:<45} | {row['scope']:<8} | "
+            f"setup {row['setup_sec']}s x{row['setup_count']} "
+            f"(max {row['setup_max_sec']}s) | "
+            f"teardown {row['teardown_sec']}s | total {row['total_sec']}s"
+        )
+    terminalreporter.ensure_newline()
@@ -0,0 +1,169 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/frame_timing.py
+"""Frame-time sampling for Playwright E2E tests.
+
+``FRAME_SAMPLER_SCRIPT`` is installed as a context init script and records every
+``requestAnimationFrame`` delta into a page-side ``Float32Array`` ring buffer
+(``window.__frameTiming``). ``FrameTimingPlugin`` resets the buffer before a
+test and collects it afterwards; ``summarize_frame_times`` reduces the samples
+to percentiles and long-frame counts.
+"""
+
+import math
+from typing import Any
+
+from tests.perf.page_metrics import PageMetricsPlugin
+
+# Ring buffer capacity: ~2 minutes of frames at 60 FPS
+FRAME_BUFFER_SIZE = 7200
+
+# A frame longer than this missed at least two 60 Hz vsyncs and is visible jank
+LONG_FRAME_MS = 50.0
+
+FRAME_SAMPLER_SCRIPT = """
+(() => {
+    if (window.__frameTiming) return;
+    const capacity = %d;
+    const samples = new Float32Array(capacity);
+    const state = { count: 0, next: 0, last: null };
+    const tick = (ts) => {
+        if (state.last !== null) {
+            samples[state.next] = ts - state.last;
+            state.next = (state.next + 1) %% capacity;
+            state.count += 1;
+        }
+        state.last = ts;
+        requestAnimationFrame(tick);
+    };
+    window.__frameTiming = {
+        reset() {
+            state.count = 0;
+            state.next = 0;
+            state.last = null;
+        },
+        collect() {
+            const size = Math.min(state.count, capacity);
+            const start = state.count > capacity ? state.next : 0;
+            const ordered = new Array(size);
+            for (let i = 0; i < size; i++) {
+                ordered[i] = samples[(start + i) %% capacity];
+            }
+            return { total: state.count, samples: ordered };
+        },
+    };
+    requestAnimationFrame(tick);
+})();
+""" % (FRAME_BUFFER_SIZE,)
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of an ascending list."""
+    rank = max(1, math.ceil(percent / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize_frame_times(
+    samples: list[float], total: int | None = None
+) -> dict[str, Any] | None:
+    """Reduce frame deltas to percentile and long-frame statistics.
+
+    Parameters
+    ----------
+    samples : list[float]
+        Frame deltas in milliseconds (oldest first).
+    total : int | None, default=None
+        Frames observed page-side; exceeds ``len(samples)`` if the ring wrapped.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Frame count, p50/p95/p99/max in ms, and long-frame count, or None when
+        no frames were recorded.
+    """
+    if not samples:
+        return None
+    ordered = sorted(float(value) for value in samples)
+    return {
+        "frames": total if total is not None else len(ordered),
+        "sampled_frames": len(ordered),
+        "p50_ms": round(_percentile(ordered, 50), 2),
+        "p95_ms": round(_percentile(ordered, 95), 2),
+        "p99_ms": round(_percentile(ordered, 99), 2),
+        "max_ms": round(ordered[-1], 2),
+        "long_frames": sum(1 for value in ordered if value > LONG_FRAME_MS),
+    }
+
+
+def reset_frame_samples(page: Any) -> None:
+    """Discard frames recorded so far (e.g. by a previous test on a shared page)."""
+    page.evaluate("() => window.__frameTiming && window.__frameTiming.reset()")
+
+
+def collect_frame_stats(page: Any) -> dict[str, Any] | None:
+    """Fetch the page-side frame buffer and summarize it."""
+    payload = page.evaluate(
+        "() => window.__frameTiming ? window.__frameTiming.collect() : null"
+    )
+    if not payload:
+        return None
+    return summarize_frame_times(payload["samples"], payload["total"])
+
+
+def frame_samples_since(page: Any, total: int | None) -> list[float] | None:
+    """Return the frame deltas recorded after the sampler had seen ``total``.
+
+    Lets long-running callers window the buffer without resetting it under
+    the per-test ``FrameTimingPlugin``.
+    """
+    if total is None:
+        return None
+    payload = page.evaluate(
+        "() => window.__frameTiming ? window.__frameTiming.collect() : null"
+    )
+    if not payload:
+        return None
+    new_frames = min(payload["total"] - total, len(payload["samples"]))
+    return payload["samples"][-new_frames:] if new_frames > 0 else []
+
+
+def format_ms(value: float | None) -> str:
+    """Format an optional millisecond value for the terminal summary."""
+    return f"{value:.0f} ms" if value is not None else "n/a"
+
+
+class FrameTimingPlugin(PageMetricsPlugin):
+    """Record each test's frame-time statistics under ``frame_timing``.
+
+    Shared pages are reset before the test body so each test only reports
+    its own frames.
+    """
+
+    metric_key = "frame_timing"
+    label = "Frame timing"
+
+    def start(self, page: Any) -> None:
+        reset_frame_samples(page)
+
+    def finish(self, item: Any, page: Any, started: Any) -> dict[str, Any] | None:
+        _ = (item, started)
+        return collect_frame_stats(page)
+
+
+def write_terminal_summary(terminalreporter: Any, entries: list[dict]) -> None:
+    """Output per-test frame-time percentiles and long-frame counts."""
+    frame_entries = [entry for entry in entries if entry.get("frame_timing")]
+    if not frame_entries:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("Frame Timing", sep="=", bold=True)
+    for entry in frame_entries:
+        stats = entry["frame_timing"]
+        terminalreporter.write_line(
+            f"  • {entry['nodeid'].split('::')[-1]:<45} | "
+            f"p50 {stats['p50_ms']:>6} ms | p95 {stats['p95_ms']:>6} ms | "
+            f"p99 {stats['p99_ms']:>6} ms | "
+            f"long (>{LONG_FRAME_MS:g} ms): {stats['long_frames']}"
+            f" / {stats['frames']}"
+        )
+    terminalreporter.ensure_newline()
@@ -0,0 +1,326 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/harness_profiler.py
+"""Per-test profile of the Python harness itself (``--profile-harness``).
+
+Suite time splits between the browser doing work and Python doing harness
+bookkeeping: polling loops, log scanning, JSON dumps, fixture plumbing.
+``HarnessProfiler`` runs ``cProfile`` and ``tracemalloc`` over a test's setup,
+call and teardown. ``summarize_profile`` then buckets every function's *self*
+time:
+
+* ``playwright_sec`` - Playwright's sync API, its greenlet dispatcher and the
+  asyncio/selector loop waiting on the driver, i.e. blocked on the browser;
+* ``sleep_sec`` - explicit ``time.sleep`` back-off in polling loops;
+* ``harness_sec`` - everything else, the Python cost of the harness.
+
+Self times are used rather than cumulative ones because the sync API switches
+greenlets inside a single thread, which makes cProfile's call edges
+unreliable while per-function self time stays exact.
+
+``HarnessProfilerPlugin`` wraps every test in a ``HarnessProfiler``.
+"""
+
+import cProfile
+import pstats
+import re
+import sysconfig
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests.perf.page_metrics import AttachMetric
+
+# Installed packages whose self time is spent waiting on the browser
+PLAYWRIGHT_PACKAGES = ("playwright", "greenlet", "pyee")
+
+# Standard library event loop machinery the Playwright driver connection runs on
+STDLIB_WAIT_MODULES = ("asyncio/", "selectors.py")
+
+# Built-in function labels (no source file) that block on the driver connection
+BUILTIN_WAIT_MARKERS = ("greenlet.greenlet", "select.", "_overlapped")
+
+_PACKAGE_DIRS = tuple(
+    f"/{site}/{package}/"
+    for site in ("site-packages", "dist-packages")
+    for package in PLAYWRIGHT_PACKAGES
+)
+_STDLIB_DIR = Path(sysconfig.get_paths()["stdlib"]).as_posix().rstrip("/") + "/"
+
+SLEEP_FUNCTIONS = ("<built-in method time.sleep>",)
+
+TOP_FUNCTIONS = 5
+
+# Frames kept per traced allocation; 1 is enough for line-level attribution
+TRACEMALLOC_FRAMES = 1
+
+_MB = 1048576.0
+
+
+def _label(func: tuple[str, int, str]) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{filename}:{line}({name})"
+
+
+def classify_function(func: tuple[str, int, str]) -> str:
+    """Bucket a pstats function key as ``playwright``, ``sleep`` or ``harness``.
+
+    Source functions are matched on their installed location, so harness
+    modules that merely mention Playwright or asyncio in their path (e.g.
+    ``tests/async_utils.py``) still count as harness time.
+    """
+    filename, _, name = func
+    if filename == "~":
+        if name in SLEEP_FUNCTIONS:
+            return "sleep"
+        if any(marker in name for marker in BUILTIN_WAIT_MARKERS):
+            return "playwright"
+        return "harness"
+    path = filename.replace("\\", "/")
+    if any(package_dir in path for package_dir in _PACKAGE_DIRS):
+        return "playwright"
+    if path.startswith(_STDLIB_DIR) and path[len(_STDLIB_DIR) :].startswith(
+        STDLIB_WAIT_MODULES
+    ):
+        return "playwright"
+    return "harness"
+
+
+def summarize_profile(
+    stats: dict[tuple[str, int, str], tuple], top: int = TOP_FUNCTIONS
+) -> dict[str, Any]:
+    """Split raw ``pstats`` data into harness, Playwright and sleep time.
+
+    Parameters
+    ----------
+    stats : dict
+        ``pstats.Stats(...).stats``: function key to
+        ``(primitive_calls, calls, tottime, cumtime, callers)``.
+    top : int, default=TOP_FUNCTIONS
+        Number of most expensive harness functions (by self time) to list.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``harness_sec``, ``playwright_sec``, ``sleep_sec``, ``calls`` and
+        ``top_functions`` (``[label, self_sec, calls]``).
+    """
+    totals = {"harness": 0.0, "playwright": 0.0, "sleep": 0.0}
+    calls = 0
+    harness_functions = []
+    for func, (_, ncalls, tottime, _, _) in stats.items():
+        bucket = classify_function(func)
+        totals[bucket] += tottime
+        calls += ncalls
+        if bucket == "harness":
+            harness_functions.append((tottime, ncalls, func))
+    harness_functions.sort(reverse=True)
+    return {
+        "harness_sec": round(totals["harness"], 4),
+        "playwright_sec": round(totals["playwright"], 4),
+        "sleep_sec": round(totals["sleep"], 4),
+        "calls": calls,
+        "top_functions": [
+            [_label(func), round(tottime, 4), ncalls]
+            for tottime, ncalls, func in harness_functions[:top]
+        ],
+    }
+
+
+class HarnessProfiler:
+    """cProfile + tracemalloc session around one test.
+
+    Parameters
+    ----------
+    trace_allocations : bool, default=True
+        Also trace Python allocations; ``tracemalloc`` is started on first use
+        and stopped again by ``shutdown``.
+    """
+
+    def __init__(self, trace_allocations: bool = True) -> None:
+        self._trace = trace_allocations
+        self._profile: cProfile.Profile | None = None
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._started_tracing = False
+        self._wall = 0.0
+        self._cpu = 0.0
+        self._traced = 0
+
+    def start(self) -> None:
+        """Begin profiling the calling thread.
+
+        Raises
+        ------
+        ValueError
+            If another profiler is already active (Python 3.12+).
+        """
+        if self._trace:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            self._traced = tracemalloc.get_traced_memory()[0]
+            self._snapshot = tracemalloc.take_snapshot()
+        self._profile = cProfile.Profile()
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        self._profile.enable()
+
+    def stop(
+        self, dump_path: Path | None = None, top: int = TOP_FUNCTIONS
+    ) -> dict[str, Any]:
+        """Stop profiling and summarize the test.
+
+        Parameters
+        ----------
+        dump_path : Path | None, default=None
+            Where to write the raw ``.pstats`` profile for ``snakeviz`` /
+            ``python -m pstats``; its file name (None if the write failed) is
+            returned under ``pstats``.
+        top : int, default=TOP_FUNCTIONS
+            Length of the top function and allocation lists.
+
+        Returns
+        -------
+        dict[str, Any]
+            ``wall_sec`` and main-thread ``cpu_sec`` plus the
+            ``summarize_profile`` buckets and, when tracing, ``alloc_peak_mb``,
+            ``alloc_net_kb`` and ``top_allocations`` (``[site, kb, count]``).
+        """
+        self._profile.disable()
+        wall = time.perf_counter() - self._wall
+        cpu = time.thread_time() - self._cpu
+        summary: dict[str, Any] = {
+            "wall_sec": round(wall, 4),
+            "cpu_sec": round(cpu, 4),
+        }
+        summary.update(summarize_profile(pstats.Stats(self._profile).stats, top))
+        if self._snapshot is not None:
+            current, peak = tracemalloc.get_traced_memory()
+            growth = tracemalloc.take_snapshot().compare_to(self._snapshot, "lineno")
+            summary["alloc_peak_mb"] = round((peak - self._traced) / _MB, 3)
+            summary["alloc_net_kb"] = round((current - self._traced) / 1024.0, 1)
+            summary["top_allocations"] = [
+                [
+                    str(stat.traceback[0]),
+                    round(stat.size_diff / 1024.0, 1),
+                    stat.count_diff,
+                ]
+                for stat in growth[:top]
+                if stat.size_diff > 0
+            ]
+            self._snapshot = None
+        if dump_path is not None:
+            try:
+                self._profile.dump_stats(str(dump_path))
+                summary["pstats"] = dump_path.name
+            except OSError:
+                summary["pstats"] = None
+        self._profile = None
+        return summary
+
+    def shutdown(self) -> None:
+        """Stop ``tracemalloc`` if this profiler started it."""
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+
+
+class HarnessProfilerPlugin:
+    """Profiles the harness's own Python code per test (``--profile-harness``).
+
+    Profiling spans setup, call and teardown and stops before the teardown
+    report is made, so the summary lands in the test's metrics entry under
+    ``harness_profile``.
+
+    Parameters
+    ----------
+    attach : Callable[[str, str, Any], None]
+        Stores a metric under ``key`` in the entry of test ``nodeid``.
+    artifacts_dir : Path
+        Directory receiving ``harness_profile_<nodeid>.pstats`` dumps.
+    """
+
+    def __init__(self, attach: AttachMetric, artifacts_dir: Path) -> None:
+        self._attach = attach
+        self._artifacts_dir = artifacts_dir
+        self._profiler = HarnessProfiler()
+        self._active = False
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        try:
+            self._profiler.start()
+            self._active = True
+        except ValueError as exc:  # Another profiler (coverage, debugger) owns the hook
+            warnings.warn(
+                f"Harness profiling skipped for {item.nodeid}: {exc}",
+                UserWarning,
+                stacklevel=2,
+            )
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        _ = nextitem
+        yield
+        if not self._active:
+            return
+        self._active = False
+        safe_nodeid = re.sub(r"[^A-Za-z0-9._-]+", "_", item.nodeid)
+        dump_path = self._artifacts_dir / f"harness_profile_{safe_nodeid}.pstats"
+        summary = self._profiler.stop(dump_path)
+        if summary["pstats"] is None:
+            warnings.warn(
+                f"Harness profile could not be written to {dump_path}",
+                UserWarning,
+                stacklevel=2,
+            )
+        self._attach(item.nodeid, "harness_profile", summary)
+
+    def pytest_unconfigure(self, config):
+        _ = config
+        self._profiler.shutdown()
+
+
+def write_terminal_summary(
+    terminalreporter: Any, entries: list[dict], artifacts_dir: Path
+) -> None:
+    """Output Python harness overhead, split from time blocked on Playwright."""
+    harness_entries = [entry for entry in entries if entry.get("harness_profile")]
+    if not harness_entries:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("Harness Overhead", sep="=", bold=True)
+    totals = {"harness_sec": 0.0, "playwright_sec": 0.0, "sleep_sec": 0.0}
+    for entry in harness_entries:
+        profile = entry["harness_profile"]
+        for key in totals:
+            totals[key] += profile[key]
+        alloc = (
+            f" | alloc peak {profile['alloc_peak_mb']} MB"
+            if "alloc_peak_mb" in profile
+            else ""
+        )
+        terminalreporter.write_line(
+            f"  • {entry['nodeid'].split('::')[-1]:<45} | "
+            f"harness {profile['harness_sec']:.3f}s | "
+            f"playwright {profile['playwright_sec']:.3f}s | "
+            f"sleep {profile['sleep_sec']:.3f}s{alloc}"
+        )
+        if profile.get("top_functions"):
+            label, self_sec, _ = profile["top_functions"][0]
+            terminalreporter.write_line(f"      hottest: {label} {self_sec:.3f}s")
+    terminalreporter.write_line(
+        f"Total: harness {totals['harness_sec']:.3f}s | "
+        f"playwright {totals['playwright_sec']:.3f}s | "
+        f"sleep {totals['sleep_sec']:.3f}s"
+    )
+    terminalreporter.write_line(f"Profiles: {artifacts_dir}/harness_profile_*.pstats")
+    terminalreporter.ensure_newline()
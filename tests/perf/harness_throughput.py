@@ -0,0 +1,142 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/harness_throughput.py
+"""Compare E2E flow throughput of the sync and async Playwright harnesses.
+
+Runs the same "boot, configure settings, start game" flow N times: once
+sequentially through ``tests.test_utils`` (one page at a time, as the sync
+fixtures do) and once concurrently through ``tests.async_utils`` on N pages of
+one browser. Writes ``artifacts/harness_throughput.json``.
+
+Usage::
+
+    python -m tests.perf.harness_throughput --flows 4
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+
+from tests import async_utils, test_utils
+
+DEFAULT_FLOWS = 4
+VIEWPORT = {"width": 1280, "height": 720}
+
+
+def summarize_run(mode: str, flows: int, wall_sec: float) -> dict[str, Any]:
+    """Build the throughput record for one harness run.
+
+    Parameters
+    ----------
+    mode : str
+        Harness label ("sync" or "async").
+    flows : int
+        Number of completed flows.
+    wall_sec : float
+        Wall-clock duration of the whole run.
+
+    Returns
+    -------
+    dict[str, Any]
+        Mode, flow count, wall time, and flows per minute.
+    """
+    per_min = round(flows / wall_sec * 60, 2) if wall_sec > 0 else None
+    return {
+        "mode": mode,
+        "flows": flows,
+        "wall_sec": round(wall_sec, 4),
+        "flows_per_min": per_min,
+    }
+
+
+def compare_runs(sync_run: dict[str, Any], async_run: dict[str, Any]) -> dict[str, Any]:
+    """Combine both runs and compute the async speedup over the sync harness."""
+    speedup = None
+    if sync_run["wall_sec"] and async_run["wall_sec"]:
+        speedup = round(sync_run["wall_sec"] / async_run["wall_sec"], 2)
+    return {"sync": sync_run, "async": async_run, "speedup": speedup}
+
+
+def run_sync(flows: int, url: str, difficulty: float) -> dict[str, Any]:
+    """Run the flow sequentially with the sync harness."""
+    with sync_playwright() as pw:
+        browser = pw.chromium.launch(
+            headless=True, args=list(test_utils.CHROMIUM_LAUNCH_ARGS)
+        )
+        start = time.perf_counter()
+        for _ in range(flows):
+            context = browser.new_context(viewport=dict(VIEWPORT))
+            page = context.new_page()
+            logs: list[dict[str, str]] = []
+            page.on("console", lambda msg: logs.append({"text": msg.text}))
+            test_utils.init_page_and_wait_ready(page, url=url)
+            test_utils.start_game_and_wait_ready(page, logs, difficulty=difficulty)
+            context.close()
+        wall_sec = time.perf_counter() - start
+        browser.close()
+    return summarize_run("sync", flows, wall_sec)
+
+
+async def run_async(flows: int, url: str, difficulty: float) -> dict[str, Any]:
+    """Run the flows concurrently on separate pages with the async harness."""
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(
+            headless=True, args=list(test_utils.CHROMIUM_LAUNCH_ARGS)
+        )
+
+        async def _flow() -> None:
+            context = await browser.new_context(viewport=dict(VIEWPORT))
+            page = await context.new_page()
+            logs: list[dict[str, str]] = []
+            page.on("console", lambda msg: logs.append({"text": msg.text}))
+            await async_utils.init_page_and_wait_ready(page, url=url)
+            await async_utils.start_game_and_wait_ready(
+                page, logs, difficulty=difficulty
+            )
+            await context.close()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_flow() for _ in range(flows)))
+        wall_sec = time.perf_counter() - start
+        await browser.close()
+    return summarize_run("async", flows, wall_sec)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: run both harnesses, print and export the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flows", type=int, default=DEFAULT_FLOWS)
+    parser.add_argument("--url", default=async_utils.GAME_URL)
+    parser.add_argument("--difficulty", type=float, default=2.0)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=test_utils.ARTIFACTS_DIR / "harness_throughput.json",
+    )
+    args = parser.parse_args(argv)
+
+    sync_run = run_sync(args.flows, args.url, args.difficulty)
+    async_run = asyncio.run(run_async(args.flows, args.url, args.difficulty))
+    report = compare_runs(sync_run, async_run)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=4), encoding="utf-8")
+
+    for run in (sync_run, async_run):
+        print(
+            f"{run['mode']:>5}: {run['flows']} flows in {run['wall_sec']}s "
+            f"({run['flows_per_min']} flows/min)"
+        )
+    print(f"Speedup: {report['speedup']}x -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,426 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/input_replay.py
+"""Deterministic keyboard input recording and frame-accurate replay.
+
+``INPUT_CLOCK_SCRIPT`` installs ``window.__inputClock``, a
+``requestAnimationFrame`` counter, and ``window.__inputRecorder``, which
+captures ``keydown``/``keyup`` (auto-repeat excluded) with the frame they
+arrived on. Recordings are stored as compact JSON::
+
+    {"version": 1, "frame_ms": 16.67, "events": [[2, "d", "KeyW"], ...]}
+
+Each event is ``[frames since previous event, "d" | "u", KeyboardEvent.code]``.
+``replay_inputs`` waits for each target frame page-side and dispatches the
+event through ``page.keyboard`` so Godot sees trusted input. While replaying,
+``window.__inputRecorder`` stamps the frame each event actually reached the
+page, so drift includes the keyboard round trip, and is reported alongside
+frame time, heap and engine node counts over the replay window.
+
+Record a scenario from a headed browser::
+
+    python -m tests.perf.input_replay --output tests/replays/my_run.keys.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from playwright.sync_api import sync_playwright
+
+from tests import async_utils, test_utils
+from tests.perf import engine_monitors
+from tests.perf.frame_timing import (
+    format_ms,
+    frame_samples_since,
+    summarize_frame_times,
+)
+
+RECORDING_VERSION = 1
+
+# Nominal 60 Hz frame; only used to estimate durations offline
+DEFAULT_FRAME_MS = 1000.0 / 60.0
+
+REPLAYS_DIR = Path(__file__).resolve().parents[1] / "replays"
+
+_MB = 1048576.0
+
+INPUT_CLOCK_SCRIPT = """
+(() => {
+    if (window.__inputClock) return;
+    const clock = { frame: 0 };
+    const tick = () => {
+        clock.frame += 1;
+        requestAnimationFrame(tick);
+    };
+    requestAnimationFrame(tick);
+    window.__inputClock = clock;
+
+    const recorder = { active: false, events: [] };
+    const capture = (type) => (event) => {
+        if (!recorder.active || event.repeat) return;
+        recorder.events.push([clock.frame, performance.now(), type, event.code]);
+    };
+    window.addEventListener('keydown', capture('d'), true);
+    window.addEventListener('keyup', capture('u'), true);
+    window.__inputRecorder = {
+        start() {
+            recorder.events = [];
+            recorder.active = true;
+            return clock.frame;
+        },
+        stop() {
+            recorder.active = false;
+            return recorder.events;
+        },
+    };
+})();
+"""
+
+# Resolves on the first frame at or after the target; returns the actual frame
+_WAIT_FRAME_SCRIPT = (
+    "(target) => window.__inputClock.frame >= target"
+    " ? { frame: window.__inputClock.frame } : null"
+)
+
+_REPLAY_PROBE_SCRIPT = """
+() => {
+    const mem = performance.memory;
+    const rtenv = window.engine && window.engine.rtenv;
+    return {
+        frame: window.__inputClock.frame,
+        frames_total: window.__frameTiming ? window.__frameTiming.collect().total : null,
+        js_heap: mem ? mem.usedJSHeapSize : null,
+        wasm_heap: rtenv && rtenv.HEAP8 ? rtenv.HEAP8.length : null,
+    };
+}
+"""
+
+
+def encode_events(raw_events: list[list[Any]], start_frame: int = 0) -> list[list[Any]]:
+    """Convert page-side ``[frame, ts, type, code]`` events to delta encoding.
+
+    Parameters
+    ----------
+    raw_events : list[list[Any]]
+        Events as captured by ``window.__inputRecorder``.
+    start_frame : int, default=0
+        Frame the recording started on; the first delta is relative to it.
+
+    Returns
+    -------
+    list[list[Any]]
+        ``[frame_delta, type, code]`` triples.
+    """
+    encoded = []
+    previous = start_frame
+    for frame, _ts, kind, code in raw_events:
+        encoded.append([max(0, int(frame) - previous), kind, code])
+        previous = max(previous, int(frame))
+    return encoded
+
+
+def build_recording(
+    events: list[list[Any]], frame_ms: float = DEFAULT_FRAME_MS
+) -> dict[str, Any]:
+    """Wrap delta-encoded events in the versioned recording envelope."""
+    return {
+        "version": RECORDING_VERSION,
+        "frame_ms": round(frame_ms, 3),
+        "events": events,
+    }
+
+
+def save_recording(recording: dict[str, Any], path: Path) -> Path:
+    """Write a recording with one event per line to keep diffs readable."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    events = ",\n".join(
+        "    " + json.dumps(event, separators=(",", ":"))
+        for event in recording["events"]
+    )
+    path.write_text(
+        f'{{"version": {recording["version"]}, "frame_ms": {recording["frame_ms"]}, '
+        f'"events": [\n{events}\n]}}\n',
+        encoding="utf-8",
+    )
+    return path
+
+
+def load_recording(path: Path) -> dict[str, Any]:
+    """Load and validate a recording file.
+
+    Raises
+    ------
+    ValueError
+        If the version is unsupported or an event is malformed.
+    """
+    recording = json.loads(Path(path).read_text(encoding="utf-8"))
+    if recording.get("version") != RECORDING_VERSION:
+        raise ValueError(
+            f"Unsupported input recording version {recording.get('version')!r} "
+            f"in {path}"
+        )
+    for event in recording["events"]:
+        if (
+            len(event) != 3
+            or not isinstance(event[0], int)
+            or event[0] < 0
+            or event[1] not in ("d", "u")
+            or not isinstance(event[2], str)
+        ):
+            raise ValueError(f"Malformed input event {event!r} in {path}")
+    return recording
+
+
+def schedule_events(
+    recording: dict[str, Any], base_frame: int
+) -> list[tuple[int, str, str]]:
+    """Resolve delta-encoded events to absolute ``(frame, type, code)`` targets."""
+    frame = base_frame
+    scheduled = []
+    for delta, kind, code in recording["events"]:
+        frame += delta
+        scheduled.append((frame, kind, code))
+    return scheduled
+
+
+def recording_frames(recording: dict[str, Any]) -> int:
+    """Total frames spanned by a recording."""
+    return sum(event[0] for event in recording["events"])
+
+
+def arrival_drifts(
+    scheduled: list[tuple[int, str, str]], arrivals: list[list[Any]]
+) -> list[int | None]:
+    """Match dispatched events to their page-side arrival stamps.
+
+    Parameters
+    ----------
+    scheduled : list[tuple[int, str, str]]
+        ``schedule_events`` targets, in dispatch order.
+    arrivals : list[list[Any]]
+        ``[frame, ts, type, code]`` events captured by ``window.__inputRecorder``
+        during the replay; unmatched extras (e.g. releasing held keys) are
+        ignored.
+
+    Returns
+    -------
+    list[int | None]
+        Per scheduled event ``arrival_frame - target_frame``, or None when the
+        event never reached the page (e.g. the canvas lost focus).
+    """
+    drifts: list[int | None] = []
+    cursor = 0
+    for target, kind, code in scheduled:
+        for index in range(cursor, len(arrivals)):
+            frame, _ts, arrived_kind, arrived_code = arrivals[index]
+            if arrived_kind == kind and arrived_code == code:
+                drifts.append(int(frame) - target)
+                cursor = index + 1
+                break
+        else:
+            drifts.append(None)
+    return drifts
+
+
+def summarize_replay(
+    drifts: list[int | None],
+    start: dict[str, Any],
+    end: dict[str, Any],
+    frame_samples: list[float] | None,
+    monitors_start: dict[str, int] | None,
+    monitors_end: dict[str, int] | None,
+    wall_sec: float,
+) -> dict[str, Any]:
+    """Reduce replay bookkeeping and probes to a JSON-friendly summary.
+
+    Parameters
+    ----------
+    drifts : list[int | None]
+        Per-event ``arrival_frame - target_frame`` (0 is frame-accurate; None
+        for events that never arrived).
+    start, end : dict[str, Any]
+        ``_REPLAY_PROBE_SCRIPT`` results before and after the replay.
+    frame_samples : list[float] | None
+        Frame deltas recorded during the replay window.
+    monitors_start, monitors_end : dict[str, int] | None
+        Godot monitor snapshots before and after the replay.
+    wall_sec : float
+        Wall-clock duration of the replay.
+
+    Returns
+    -------
+    dict[str, Any]
+        Event count, arrival drift, missing events, frame-time stats, heap deltas (MB) and
+        engine monitor deltas.
+    """
+
+    def _heap_delta(key: str) -> float | None:
+        if start.get(key) is None or end.get(key) is None:
+            return None
+        return round((end[key] - start[key]) / _MB, 3)
+
+    arrived = [drift for drift in drifts if drift is not None]
+    return {
+        "events": len(drifts),
+        "frames": end["frame"] - start["frame"],
+        "wall_sec": round(wall_sec, 3),
+        "max_drift_frames": max(arrived, default=0),
+        "late_events": sum(1 for drift in arrived if drift > 0),
+        "missing_events": len(drifts) - len(arrived),
+        "frame_stats": summarize_frame_times(frame_samples) if frame_samples else None,
+        "js_heap_delta_mb": _heap_delta("js_heap"),
+        "wasm_heap_delta_mb": _heap_delta("wasm_heap"),
+        "engine_monitors_delta": engine_monitors.monitors_delta(
+            monitors_start, monitors_end
+        ),
+    }
+
+
+def replay_inputs(
+    page: Any, recording: dict[str, Any], request: Any = None
+) -> dict[str, Any]:
+    """Replay a recording frame-accurately through ``page.keyboard``.
+
+    Drift is measured from the frame ``window.__inputRecorder``'s capturing
+    listeners saw each event arrive, not the frame the wait resolved on, so
+    the latency of the separate keyboard round trip is counted. Keys still held when the recording ends are released so a truncated
+    recording cannot leak input into the next test.
+
+    Parameters
+    ----------
+    page : Any
+        A Playwright page with a running game (canvas focused).
+    recording : dict[str, Any]
+        A recording as returned by ``load_recording``.
+    request : Any, default=None
+        When given, the summary is stored on ``request.node._input_replay`` and
+        exported with the test's profiling entry.
+
+    Returns
+    -------
+    dict[str, Any]
+        The ``summarize_replay`` summary.
+    """
+    page.evaluate(INPUT_CLOCK_SCRIPT)
+    monitors_start = engine_monitors.snapshot_engine_monitors(page)
+    start = page.evaluate(_REPLAY_PROBE_SCRIPT)
+    started = time.perf_counter()
+
+    held: set[str] = set()
+    scheduled = schedule_events(recording, start["frame"])
+    page.evaluate("() => window.__inputRecorder.start()")
+    for target, kind, code in scheduled:
+        page.wait_for_function(_WAIT_FRAME_SCRIPT, arg=target, polling="raf")
+        if kind == "d":
+            page.keyboard.down(code)
+            held.add(code)
+        else:
+            page.keyboard.up(code)
+            held.discard(code)
+    for code in sorted(held):
+        page.keyboard.up(code)
+    drifts = arrival_drifts(
+        scheduled, page.evaluate("() => window.__inputRecorder.stop()")
+    )
+
+    wall_sec = time.perf_counter() - started
+    end = page.evaluate(_REPLAY_PROBE_SCRIPT)
+    summary = summarize_replay(
+        drifts,
+        start,
+        end,
+        frame_samples_since(page, start["frames_total"]),
+        monitors_start,
+        engine_monitors.snapshot_engine_monitors(page),
+        wall_sec,
+    )
+    if request is not None:
+        request.node._input_replay = summary
+    return summary
+
+
+def record_inputs(page: Any, stop: Any) -> dict[str, Any]:
+    """Record keyboard input until ``stop()`` returns.
+
+    Parameters
+    ----------
+    page : Any
+        A Playwright page with a running game.
+    stop : Callable[[], Any]
+        Blocks until recording should end (e.g. waits for Enter on stdin).
+
+    Returns
+    -------
+    dict[str, Any]
+        A recording ready for ``save_recording``.
+    """
+    page.evaluate(INPUT_CLOCK_SCRIPT)
+    start_frame = page.evaluate("() => window.__inputRecorder.start()")
+    started = time.perf_counter()
+    stop()
+    raw_events = page.evaluate("() => window.__inputRecorder.stop()")
+    end_frame = page.evaluate("() => window.__inputClock.frame")
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    frames = max(1, end_frame - start_frame)
+    return build_recording(encode_events(raw_events, start_frame), elapsed_ms / frames)
+
+
+def write_terminal_summary(terminalreporter: Any, entries: list[dict]) -> None:
+    """Output gameplay input replay drift and per-replay resource deltas."""
+    replay_entries = [entry for entry in entries if entry.get("input_replay")]
+    if not replay_entries:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("Input Replay", sep="=", bold=True)
+    for entry in replay_entries:
+        replay = entry["input_replay"]
+        frame_stats = replay.get("frame_stats") or {}
+        nodes = (replay.get("engine_monitors_delta") or {}).get("node_count")
+        terminalreporter.write_line(
+            f"  • {entry['nodeid'].split('::')[-1]:<45} | "
+            f"{replay['events']} events / {replay['frames']} frames | "
+            f"max drift {replay['max_drift_frames']}f | "
+            f"p95 {format_ms(frame_stats.get('p95_ms'))} | "
+            f"wasm {replay.get('wasm_heap_delta_mb')}MB | "
+            f"nodes {nodes if nodes is not None else 'n/a'}"
+        )
+    terminalreporter.ensure_newline()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: open a headed game, record until Enter, save the recording."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=async_utils.GAME_URL)
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument("--difficulty", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(
+            headless=False, args=list(test_utils.CHROMIUM_LAUNCH_ARGS)
+        )
+        page = browser.new_page()
+        logs: list[dict[str, str]] = []
+        page.on("console", lambda msg: logs.append({"text": msg.text}))
+        test_utils.init_page_and_wait_ready(page, url=args.url)
+        test_utils.start_game_and_wait_ready(page, logs, difficulty=args.difficulty)
+        page.locator("canvas").focus()
+        recording = record_inputs(
+            page, lambda: input("Recording... press Enter in this terminal to stop. ")
+        )
+        browser.close()
+
+    save_recording(recording, args.output)
+    print(
+        f"Saved {len(recording['events'])} events over "
+        f"{recording_frames(recording)} frames -> {args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
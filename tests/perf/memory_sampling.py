@@ -0,0 +1,255 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/memory_sampling.py
+"""Periodic JS heap and WASM linear memory sampling with leak heuristics.
+
+The sync Playwright API cannot be driven from a background thread, so the
+sampling runs page-side: ``memory_sampler_script`` is installed as a context
+init script and records ``performance.memory.usedJSHeapSize`` and the
+Emscripten ``HEAP8.length`` (WASM linear memory) every ``interval_ms`` into a
+ring buffer (``window.__memorySampler``). ``MemoryTimelinePlugin`` resets it
+before a test and collects the timeline afterwards.
+
+Two heuristics flag suspected leaks:
+
+* per test, the least-squares slope of the timeline exceeds
+  ``LEAK_SLOPE_MB_PER_MIN`` over at least ``MIN_LEAK_SAMPLES`` samples;
+* per ``shared_page`` module, the end-of-test heap never shrinks across
+  ``MIN_MODULE_TESTS`` or more tests and grows by ``MIN_MODULE_GROWTH_MB``.
+"""
+
+from typing import Any
+
+from tests.perf.page_metrics import PageMetricsPlugin
+
+DEFAULT_SAMPLE_INTERVAL_MS = 500
+
+# Ring buffer capacity: 20 minutes at the default interval
+SAMPLE_BUFFER_SIZE = 2400
+
+LEAK_SLOPE_MB_PER_MIN = 5.0
+MIN_LEAK_SAMPLES = 8
+MIN_MODULE_TESTS = 3
+MIN_MODULE_GROWTH_MB = 1.0
+
+_MB = 1048576.0
+
+_MEMORY_SAMPLER_TEMPLATE = """
+(() => {
+    if (window.__memorySampler) return;
+    const capacity = %(capacity)d;
+    const times = new Float64Array(capacity);
+    const jsHeap = new Float64Array(capacity);
+    const wasmHeap = new Float64Array(capacity);
+    const state = { count: 0, next: 0 };
+    const sample = () => {
+        const mem = performance.memory;
+        const rtenv = window.engine && window.engine.rtenv;
+        times[state.next] = performance.now();
+        jsHeap[state.next] = mem ? mem.usedJSHeapSize : NaN;
+        wasmHeap[state.next] = rtenv && rtenv.HEAP8 ? rtenv.HEAP8.length : NaN;
+        state.next = (state.next + 1) %% capacity;
+        state.count += 1;
+    };
+    window.__memorySampler = {
+        interval: %(interval)d,
+        reset() {
+            state.count = 0;
+            state.next = 0;
+        },
+        collect() {
+            const size = Math.min(state.count, capacity);
+            const start = state.count > capacity ? state.next : 0;
+            const samples = new Array(size);
+            for (let i = 0; i < size; i++) {
+                const idx = (start + i) %% capacity;
+                samples[i] = [
+                    times[idx],
+                    Number.isNaN(jsHeap[idx]) ? null : jsHeap[idx],
+                    Number.isNaN(wasmHeap[idx]) ? null : wasmHeap[idx],
+                ];
+            }
+            return { interval: %(interval)d, total: state.count, samples };
+        },
+    };
+    setInterval(sample, %(interval)d);
+})();
+"""
+
+
+def memory_sampler_script(interval_ms: int = DEFAULT_SAMPLE_INTERVAL_MS) -> str:
+    """Build the page-side sampler init script for the given interval."""
+    return _MEMORY_SAMPLER_TEMPLATE % {
+        "capacity": SAMPLE_BUFFER_SIZE,
+        "interval": max(int(interval_ms), 1),
+    }
+
+
+def linear_slope(points: list[tuple[float, float]]) -> float | None:
+    """Return the least-squares slope of ``(x, y)`` points, or None if undefined."""
+    if len(points) < 2:
+        return None
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return None
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return cov / var_x
+
+
+def _series_slope_mb_per_min(
+    samples: list[list[float | None]], column: int
+) -> float | None:
+    """Slope of one timeline column in MB per minute."""
+    points = [
+        (row[0] / 60000.0, row[column] / _MB)
+        for row in samples
+        if row[column] is not None
+    ]
+    slope = linear_slope(points)
+    return round(slope, 3) if slope is not None else None
+
+
+def summarize_memory_timeline(payload: dict[str, Any]) -> dict[str, Any] | None:
+    """Reduce a collected sampler payload to a timeline plus leak verdict.
+
+    Parameters
+    ----------
+    payload : dict[str, Any]
+        ``{"interval": ms, "total": n, "samples": [[t_ms, js_bytes, wasm_bytes]]}``
+        as returned by ``window.__memorySampler.collect()``.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Timeline in MB relative to the first sample's time, per-series slopes
+        in MB/min, and ``leak_suspected``; None when nothing was sampled.
+    """
+    samples = payload.get("samples") or []
+    if not samples:
+        return None
+    origin = samples[0][0]
+    timeline = [
+        [
+            round(row[0] - origin, 1),
+            round(row[1] / _MB, 3) if row[1] is not None else None,
+            round(row[2] / _MB, 3) if row[2] is not None else None,
+        ]
+        for row in samples
+    ]
+    js_slope = _series_slope_mb_per_min(samples, 1)
+    wasm_slope = _series_slope_mb_per_min(samples, 2)
+    leak_suspected = len(samples) >= MIN_LEAK_SAMPLES and any(
+        slope is not None and slope > LEAK_SLOPE_MB_PER_MIN
+        for slope in (js_slope, wasm_slope)
+    )
+    return {
+        "interval_ms": payload.get("interval"),
+        "samples": len(samples),
+        "timeline": timeline,
+        "js_heap_slope_mb_per_min": js_slope,
+        "wasm_heap_slope_mb_per_min": wasm_slope,
+        "leak_suspected": leak_suspected,
+    }
+
+
+def is_monotonic_growth(values: list[float | None]) -> bool:
+    """Check whether per-test heap readings never shrink and grow overall.
+
+    Parameters
+    ----------
+    values : list[float | None]
+        End-of-test heap readings in MB, in execution order; None is skipped.
+    """
+    series = [value for value in values if value is not None]
+    if len(series) < MIN_MODULE_TESTS:
+        return False
+    if any(later < earlier for earlier, later in zip(series, series[1:])):
+        return False
+    return series[-1] - series[0] >= MIN_MODULE_GROWTH_MB
+
+
+def reset_memory_samples(page: Any) -> None:
+    """Discard samples recorded so far (e.g. by a previous test on a shared page)."""
+    page.evaluate("() => window.__memorySampler && window.__memorySampler.reset()")
+
+
+def collect_memory_timeline(page: Any) -> dict[str, Any] | None:
+    """Fetch the page-side samples and summarize them."""
+    payload = page.evaluate(
+        "() => window.__memorySampler ? window.__memorySampler.collect() : null"
+    )
+    if not payload:
+        return None
+    return summarize_memory_timeline(payload)
+
+
+class MemoryTimelinePlugin(PageMetricsPlugin):
+    """Record each test's memory timeline under ``memory_timeline``.
+
+    ``shared_page`` tests also add their end-of-test heap readings to a
+    per-module series checked by ``flag_heap_growth_modules``.
+    """
+
+    metric_key = "memory_timeline"
+    label = "Memory timeline"
+
+    def __init__(self, attach: Any) -> None:
+        super().__init__(attach)
+        # End-of-test (js_heap_mb, wasm_heap_mb) per shared_page module, in run order
+        self.heap_series: dict[str, list[tuple[float | None, float | None]]] = {}
+
+    def start(self, page: Any) -> None:
+        reset_memory_samples(page)
+
+    def finish(self, item: Any, page: Any, started: Any) -> dict[str, Any] | None:
+        _ = started
+        summary = collect_memory_timeline(page)
+        if summary and "shared_page" in item.funcargs:
+            last = summary["timeline"][-1]
+            module = item.nodeid.split("::")[0]
+            self.heap_series.setdefault(module, []).append((last[1], last[2]))
+        return summary
+
+    def flag_heap_growth_modules(self) -> list[dict[str, Any]]:
+        """List shared_page modules whose end-of-test heap grew monotonically."""
+        flagged = []
+        for module, series in self.heap_series.items():
+            grew = [
+                name
+                for name, column in (("js_heap", 0), ("wasm_heap", 1))
+                if is_monotonic_growth([row[column] for row in series])
+            ]
+            if grew:
+                flagged.append({"module": module, "tests": len(series), "series": grew})
+        return flagged
+
+
+def write_terminal_summary(
+    terminalreporter: Any, entries: list[dict], heap_growth: list[dict]
+) -> None:
+    """Output slope-based leak suspects and monotonic shared_page heap growth."""
+    leak_entries = [
+        entry
+        for entry in entries
+        if (entry.get("memory_timeline") or {}).get("leak_suspected")
+    ]
+    if not leak_entries and not heap_growth:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("Memory Growth", sep="=", bold=True)
+    for entry in leak_entries:
+        timeline = entry["memory_timeline"]
+        terminalreporter.write_line(
+            f"  • {entry['nodeid'].split('::')[-1]:<45} | "
+            f"JS heap {timeline['js_heap_slope_mb_per_min']} MB/min | "
+            f"WASM {timeline['wasm_heap_slope_mb_per_min']} MB/min"
+        )
+    for module in heap_growth:
+        terminalreporter.write_line(
+            f"  • {module['module']:<45} | monotonic growth over "
+            f"{module['tests']} tests ({', '.join(module['series'])})"
+        )
+    terminalreporter.ensure_newline()
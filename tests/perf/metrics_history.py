@@ -0,0 +1,381 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/metrics_history.py
+"""SQLite history of ``metrics_baseline.json`` runs.
+
+Every pytest session overwrites ``artifacts/metrics_baseline.json``. This
+module appends each payload to a local SQLite database keyed by commit and
+run timestamp so per-test trends survive across runs:
+
+* ``runs`` - one row per ingested payload (commit, timestamp, shard, totals
+  and the non-test part of the payload as JSON);
+* ``test_results`` - one row per test and run (outcome);
+* ``test_metrics`` - every numeric leaf of a test entry, flattened to dotted
+  names (``duration_sec``, ``wasm_boot_duration_sec``,
+  ``memory_timeline.js_heap_slope_mb_per_min``, ``frame_timing.p95_ms``, ...).
+
+Usage::
+
+    python -m tests.perf.metrics_history ingest artifacts/metrics_baseline*.json
+    python -m tests.perf.metrics_history trend \\
+        "tests/weapon_firing_test.py::test_weapon_firing" --metric duration_sec
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from tests.test_utils import ARTIFACTS_DIR
+
+SCHEMA_VERSION = 1
+
+DEFAULT_DB_PATH = Path(
+    os.getenv("PW_METRICS_DB", str(ARTIFACTS_DIR / "metrics_history.sqlite"))
+)
+
+# Entry keys that identify a test rather than measure it
+_NON_METRIC_KEYS = ("nodeid", "outcome")
+
+_SHARD_PATTERN = re.compile(r"metrics_baseline_(?P<shard>.+)\.json$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    commit_sha TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    shard TEXT NOT NULL DEFAULT '',
+    source TEXT,
+    total_duration_sec REAL,
+    passed INTEGER,
+    failed INTEGER,
+    skipped INTEGER,
+    extra_json TEXT,
+    UNIQUE (commit_sha, timestamp, shard)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs (timestamp);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    nodeid TEXT NOT NULL,
+    outcome TEXT,
+    PRIMARY KEY (run_id, nodeid)
+);
+CREATE INDEX IF NOT EXISTS idx_test_results_nodeid ON test_results (nodeid);
+CREATE TABLE IF NOT EXISTS test_metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    nodeid TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, nodeid, metric)
+);
+CREATE INDEX IF NOT EXISTS idx_test_metrics_lookup ON test_metrics (nodeid, metric);
+"""
+
+
+def connect(path: Path = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    """Open (and create or migrate) the history database.
+
+    Raises
+    ------
+    RuntimeError
+        If the database was written by a newer schema version.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version > SCHEMA_VERSION:
+        conn.close()
+        raise RuntimeError(
+            f"{path} uses metrics history schema {version}; "
+            f"this checkout supports {SCHEMA_VERSION}"
+        )
+    conn.executescript(_SCHEMA)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def flatten_metrics(entry: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Flatten the numeric leaves of a test entry to dotted metric names.
+
+    Booleans, strings, lists (raw timelines, step lists) and non-finite
+    numbers are skipped.
+    """
+    metrics: dict[str, float] = {}
+    for key, value in entry.items():
+        if not prefix and key in _NON_METRIC_KEYS:
+            continue
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            metrics.update(flatten_metrics(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            if math.isfinite(value):
+                metrics[name] = float(value)
+    return metrics
+
+
+def shard_from_path(path: Path) -> str:
+    """Derive the CI shard from ``metrics_baseline_<shard>.json`` file names."""
+    match = _SHARD_PATTERN.search(Path(path).name)
+    return match.group("shard") if match else ""
+
+
+def resolve_commit() -> str:
+    """Return ``GITHUB_SHA`` or the current ``git`` HEAD, else ``"unknown"``."""
+    if os.getenv("GITHUB_SHA"):
+        return os.environ["GITHUB_SHA"]
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return result.stdout.strip() or "unknown"
+
+
+def ingest_payload(
+    conn: sqlite3.Connection,
+    payload: dict[str, Any],
+    commit: str,
+    shard: str = "",
+    source: str | None = None,
+) -> int | None:
+    """Append one ``metrics_baseline`` payload.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        Connection from ``connect``.
+    payload : dict[str, Any]
+        Parsed ``metrics_baseline.json``.
+    commit : str
+        Commit the run tested.
+    shard : str, default=""
+        CI shard / browser suffix; runs are unique per commit, timestamp and
+        shard.
+    source : str | None, default=None
+        Original file path, for provenance.
+
+    Returns
+    -------
+    int | None
+        The new run id, or None if this run was already ingested.
+    """
+    summary = payload.get("summary", {})
+    extra = {
+        key: value
+        for key, value in payload.items()
+        if key not in ("timestamp", "total_duration_sec", "summary", "tests")
+    }
+    with conn:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO runs (commit_sha, timestamp, shard, source, "
+            "total_duration_sec, passed, failed, skipped, extra_json) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                commit,
+                payload["timestamp"],
+                shard,
+                source,
+                payload.get("total_duration_sec"),
+                summary.get("passed", 0),
+                summary.get("failed", 0),
+                summary.get("skipped", 0),
+                json.dumps(extra),
+            ),
+        )
+        if cursor.rowcount == 0:
+            return None
+        run_id = cursor.lastrowid
+        for entry in payload.get("tests", []):
+            conn.execute(
+                "INSERT OR REPLACE INTO test_results (run_id, nodeid, outcome) "
+                "VALUES (?, ?, ?)",
+                (run_id, entry["nodeid"], entry.get("outcome")),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO test_metrics (run_id, nodeid, metric, value) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (run_id, entry["nodeid"], metric, value)
+                    for metric, value in flatten_metrics(entry).items()
+                ],
+            )
+    return run_id
+
+
+def ingest_file(
+    conn: sqlite3.Connection, path: Path, commit: str, shard: str | None = None
+) -> int | None:
+    """Ingest a ``metrics_baseline*.json`` file; the shard defaults to its suffix."""
+    path = Path(path)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return ingest_payload(
+        conn,
+        payload,
+        commit,
+        shard=shard_from_path(path) if shard is None else shard,
+        source=str(path),
+    )
+
+
+def list_runs(conn: sqlite3.Connection, limit: int = 20) -> list[dict[str, Any]]:
+    """Most recent runs first."""
+    rows = conn.execute(
+        "SELECT id, commit_sha, timestamp, shard, total_duration_sec, passed, "
+        "failed, skipped FROM runs ORDER BY timestamp DESC, id DESC LIMIT ?",
+        (limit,),
+    )
+    return [dict(row) for row in rows]
+
+
+def metric_names(conn: sqlite3.Connection, nodeid: str | None = None) -> list[str]:
+    """Distinct metric names, optionally only those recorded for ``nodeid``."""
+    if nodeid is None:
+        rows = conn.execute("SELECT DISTINCT metric FROM test_metrics ORDER BY metric")
+    else:
+        rows = conn.execute(
+            "SELECT DISTINCT metric FROM test_metrics WHERE nodeid = ? ORDER BY metric",
+            (nodeid,),
+        )
+    return [row[0] for row in rows]
+
+
+def query_test_trend(
+    conn: sqlite3.Connection,
+    nodeid: str,
+    metric: str = "duration_sec",
+    limit: int = 50,
+    shard: str | None = None,
+) -> list[dict[str, Any]]:
+    """Values of one test metric across runs, oldest first.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        Connection from ``connect``.
+    nodeid : str
+        Full pytest node id.
+    metric : str, default="duration_sec"
+        Flattened metric name (see ``metric_names``).
+    limit : int, default=50
+        Number of most recent runs to return.
+    shard : str | None, default=None
+        Restrict to one shard; None includes all shards.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Rows with ``run_id``, ``commit_sha``, ``timestamp``, ``shard``,
+        ``outcome`` and ``value``.
+    """
+    query = (
+        "SELECT m.run_id, r.commit_sha, r.timestamp, r.shard, t.outcome, m.value "
+        "FROM test_metrics m JOIN runs r ON r.id = m.run_id "
+        "LEFT JOIN test_results t ON t.run_id = m.run_id AND t.nodeid = m.nodeid "
+        "WHERE m.nodeid = ? AND m.metric = ?"
+    )
+    params: list[Any] = [nodeid, metric]
+    if shard is not None:
+        query += " AND r.shard = ?"
+        params.append(shard)
+    query += " ORDER BY r.timestamp DESC, r.id DESC LIMIT ?"
+    params.append(limit)
+    rows = [dict(row) for row in conn.execute(query, params)]
+    rows.reverse()
+    return rows
+
+
+def metric_values_by_commit(
+    conn: sqlite3.Connection,
+    metric: str,
+    commit: str,
+    outcome: str | None = "passed",
+) -> dict[str, list[float]]:
+    """All values of ``metric`` recorded for ``commit``, grouped by test.
+
+    Only tests with the given ``outcome`` are included (None for any), so
+    failed runs do not skew duration samples.
+    """
+    query = (
+        "SELECT m.nodeid, m.value FROM test_metrics m "
+        "JOIN runs r ON r.id = m.run_id "
+        "LEFT JOIN test_results t ON t.run_id = m.run_id AND t.nodeid = m.nodeid "
+        "WHERE m.metric = ? AND r.commit_sha = ?"
+    )
+    params: list[Any] = [metric, commit]
+    if outcome is not None:
+        query += " AND t.outcome = ?"
+        params.append(outcome)
+    values: dict[str, list[float]] = {}
+    for nodeid, value in conn.execute(query + " ORDER BY r.timestamp", params):
+        values.setdefault(nodeid, []).append(value)
+    return values
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: ingest baseline files or print runs / per-test trends."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="Append metrics_baseline files.")
+    ingest.add_argument("files", nargs="+", type=Path)
+    ingest.add_argument("--commit", default=None)
+    ingest.add_argument("--shard", default=None)
+
+    runs = commands.add_parser("runs", help="List recent runs.")
+    runs.add_argument("--limit", type=int, default=20)
+
+    trend = commands.add_parser("trend", help="Print one test metric over runs.")
+    trend.add_argument("nodeid")
+    trend.add_argument("--metric", default="duration_sec")
+    trend.add_argument("--limit", type=int, default=50)
+    trend.add_argument("--shard", default=None)
+
+    args = parser.parse_args(argv)
+    conn = connect(args.db)
+    try:
+        if args.command == "ingest":
+            commit = args.commit or resolve_commit()
+            for path in args.files:
+                run_id = ingest_file(conn, path, commit, shard=args.shard)
+                status = f"run {run_id}" if run_id else "already ingested"
+                print(f"{path}: {status} ({commit[:12]})")
+        elif args.command == "runs":
+            for run in list_runs(conn, args.limit):
+                print(
+                    f"{run['id']:>5} {run['timestamp']} {run['commit_sha'][:12]} "
+                    f"{run['shard'] or '-':<12} {run['total_duration_sec']}s "
+                    f"passed={run['passed']} failed={run['failed']}"
+                )
+        else:
+            rows = query_test_trend(
+                conn, args.nodeid, args.metric, args.limit, args.shard
+            )
+            if not rows:
+                print(f"No '{args.metric}' history for {args.nodeid}")
+                return 1
+            for row in rows:
+                print(
+                    f"{row['timestamp']} {row['commit_sha'][:12]} "
+                    f"{row['shard'] or '-':<12} {row['value']:.4f} ({row['outcome']})"
+                )
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/metrics_stream.py
+"""Crash-safe JSONL journal behind ``metrics_baseline.json``.
+
+Profiling entries used to live only in memory until ``pytest_sessionfinish``,
+so a killed or timed-out shard lost every metric. ``MetricsStream`` appends one
+JSON line per record and flushes + fsyncs it immediately:
+
+* ``session_start`` - run timestamp;
+* ``test`` - a test's profiling entry, written as soon as its teardown ends;
+* ``rerun`` - an "on-retry" diagnostic rerun outcome for an earlier entry;
+* ``lifecycle`` - an end-of-test JS heap reading;
+* ``session_end`` - total duration and session-level payload sections.
+
+``materialize`` folds the records into the ``metrics_baseline.json`` payload;
+it runs at session end and, after a crash, from the recovery CLI::
+
+    python -m tests.perf.metrics_stream recover
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from tests.test_utils import ARTIFACTS_DIR
+
+STREAM_FILE_NAME = "metrics_stream.jsonl"
+
+# Payload keys produced from individual records rather than session_end
+_BASE_PAYLOAD_KEYS = ("timestamp", "total_duration_sec", "summary", "tests")
+
+
+class MetricsStream:
+    """Append-only JSONL writer that makes every record durable on write.
+
+    Parameters
+    ----------
+    path : Path
+        Stream file; truncated so each session starts a fresh journal.
+    fsync : bool, default=True
+        Also ``os.fsync`` after each flush so records survive a host crash,
+        not just a killed process.
+    """
+
+    def __init__(self, path: Path, fsync: bool = True) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fsync = fsync
+        self._file = open(self.path, "w", encoding="utf-8")
+
+    def write(self, kind: str, data: dict[str, Any]) -> None:
+        """Append one record and push it to disk."""
+        line = json.dumps({"kind": kind, "t": round(time.time(), 4), "data": data})
+        self._file.write(line + "\n")
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Close the stream; further writes raise ``ValueError``."""
+        self._file.close()
+
+
+def read_stream(path: Path) -> tuple[list[dict[str, Any]], int]:
+    """Read every intact record.
+
+    A crash can leave a partially written final line; undecodable lines are
+    skipped and counted rather than failing the whole recovery.
+
+    Returns
+    -------
+    tuple[list[dict[str, Any]], int]
+        The records in write order and the number of corrupt lines.
+    """
+    records = []
+    corrupt = 0
+    with open(path, encoding="utf-8") as stream:
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                corrupt += 1
+                continue
+            if isinstance(record, dict) and "kind" in record:
+                records.append(record)
+            else:
+                corrupt += 1
+    return records, corrupt
+
+
+def materialize(
+    records: list[dict[str, Any]], corrupt_lines: int = 0
+) -> dict[str, Any]:
+    """Fold stream records into the ``metrics_baseline.json`` payload.
+
+    Parameters
+    ----------
+    records : list[dict[str, Any]]
+        Records as returned by ``read_stream``.
+    corrupt_lines : int, default=0
+        Lines ``read_stream`` had to skip.
+
+    Returns
+    -------
+    dict[str, Any]
+        The baseline payload. Without a ``session_end`` record the duration is
+        estimated from record times and a ``recovered`` section notes that
+        the session did not finish.
+    """
+    start = next((r for r in records if r["kind"] == "session_start"), None)
+    end = next((r for r in reversed(records) if r["kind"] == "session_end"), None)
+
+    tests: list[dict[str, Any]] = []
+    lifecycle: list[dict[str, Any]] = []
+    summary = {"passed": 0, "failed": 0, "skipped": 0}
+    for record in records:
+        data = record["data"]
+        if record["kind"] == "test":
+            tests.append(data)
+            summary[data["outcome"]] = summary.get(data["outcome"], 0) + 1
+        elif record["kind"] == "rerun":
+            for entry in reversed(tests):
+                if entry["nodeid"] == data["nodeid"]:
+                    entry["diagnostic_rerun"] = data["diagnostic_rerun"]
+                    break
+        elif record["kind"] == "lifecycle":
+            lifecycle.append(data)
+
+    if end is not None:
+        total_duration = end["data"]["total_duration_sec"]
+    elif start is not None and records:
+        total_duration = round(records[-1]["t"] - start["t"], 4)
+    else:
+        total_duration = 0.0
+
+    payload: dict[str, Any] = {
+        "timestamp": start["data"]["timestamp"] if start else "",
+        "total_duration_sec": total_duration,
+        "summary": summary,
+        "tests": tests,
+    }
+    if lifecycle:
+        payload["lifecycle_metrics"] = lifecycle
+    if end is not None:
+        payload.update(end["data"].get("sections", {}))
+    else:
+        payload["recovered"] = {
+            "complete": False,
+            "records": len(records),
+            "corrupt_lines": corrupt_lines,
+        }
+    return payload
+
+
+def session_sections(payload: dict[str, Any]) -> dict[str, Any]:
+    """Session-level payload sections stored in the ``session_end`` record."""
+    return {
+        key: value
+        for key, value in payload.items()
+        if key not in _BASE_PAYLOAD_KEYS and key != "lifecycle_metrics"
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: rebuild ``metrics_baseline.json`` from a stream."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    recover = commands.add_parser(
+        "recover", help="Materialize metrics_baseline.json from the stream."
+    )
+    recover.add_argument(
+        "--stream", type=Path, default=ARTIFACTS_DIR / STREAM_FILE_NAME
+    )
+    recover.add_argument(
+        "--output", type=Path, default=ARTIFACTS_DIR / "metrics_baseline.json"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.stream.is_file():
+        print(f"No metrics stream at {args.stream}", file=sys.stderr)
+        return 1
+    records, corrupt = read_stream(args.stream)
+    if not records:
+        print(f"No intact records in {args.stream}", file=sys.stderr)
+        return 1
+
+    payload = materialize(records, corrupt)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    state = "complete" if "recovered" not in payload else "incomplete"
+    print(
+        f"Recovered {len(payload['tests'])} test entries ({state} session, "
+        f"{corrupt} corrupt lines) -> {args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/page_metrics.py
+"""Base pytest plugin for per-test metrics read from the test's page.
+
+Frame timing, memory timeline, engine monitor and boot phase capture all
+follow one shape: resolve the sync page a test runs on (``shared_page`` or
+``page``), prime a page-side sampler before the test body and read it back
+afterwards. ``PageMetricsPlugin`` does this around ``pytest_runtest_call``,
+while every fixture is still set up, so tests without a page pay nothing
+beyond a dictionary lookup.
+
+Plugins are registered by ``tests/conftest.py`` and hand results back
+through an ``attach(nodeid, key, value)`` callback, which parks them for the
+test's ``metrics_baseline.json`` entry.
+"""
+
+import warnings
+from typing import Any, Callable
+
+import pytest
+
+# Fixtures a test may run on, in order of preference
+PAGE_FIXTURES = ("shared_page", "page")
+
+AttachMetric = Callable[[str, str, Any], None]
+
+
+def item_page(item: Any) -> Any | None:
+    """Return the sync page a test item runs on, if it requested one."""
+    funcargs = getattr(item, "funcargs", None) or {}
+    for name in PAGE_FIXTURES:
+        if name in funcargs:
+            return funcargs[name]
+    return None
+
+
+class PageMetricsPlugin:
+    """Capture one metric from the test's page around the test body.
+
+    Subclasses set ``metric_key`` and ``label`` and implement ``start`` and
+    ``finish``.
+
+    Parameters
+    ----------
+    attach : Callable[[str, str, Any], None]
+        Stores a metric under ``key`` in the entry of test ``nodeid``.
+    """
+
+    metric_key = ""
+    label = ""
+
+    def __init__(self, attach: AttachMetric) -> None:
+        self._attach = attach
+
+    def start(self, page: Any) -> Any:
+        """Prime the page-side sampler; the result is passed to ``finish``."""
+        _ = page
+
+    def finish(self, item: Any, page: Any, started: Any) -> Any:
+        """Collect the metric, or return None when there is nothing to report."""
+        raise NotImplementedError
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        page = item_page(item)
+        if page is None:
+            yield
+            return
+        try:
+            started = self.start(page)
+        except Exception:  # noqa: BLE001 - page may not be navigated yet
+            started = None
+        yield
+
+        try:
+            value = self.finish(item, page, started)
+        except Exception as exc:  # noqa: BLE001 - metrics are best-effort
+            warnings.warn(
+                f"{self.label} capture failed: {exc}", UserWarning, stacklevel=2
+            )
+            return
+        if value:
+            self._attach(item.nodeid, self.metric_key, value)
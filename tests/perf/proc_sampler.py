@@ -0,0 +1,303 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/proc_sampler.py
+"""CPU and RSS sampling of the Chromium process tree via ``/proc``.
+
+``performance.memory`` only sees the renderer's JS heap. What a test costs the
+CI runner is the whole browser: the browser process, GPU and network
+utilities and every renderer. ``browser_instance`` records the Chromium root
+processes it launched (``find_browser_roots``). For each test a background
+``ProcessTreeSampler`` thread then reads ``/proc/<pid>/stat`` for those roots
+and all their descendants at a fixed interval.
+
+``ProcessUsagePlugin`` runs one sampler per test on ``browser_instance``.
+
+Linux only; elsewhere ``PROC_AVAILABLE`` is False and nothing is sampled.
+"""
+
+import os
+import threading
+import time
+import warnings
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from tests.perf.page_metrics import AttachMetric
+
+PROC_ROOT = Path("/proc")
+PROC_AVAILABLE = (PROC_ROOT / "self" / "stat").is_file()
+
+DEFAULT_PROC_SAMPLE_INTERVAL_MS = 250
+
+# Substring of the executable name identifying Chromium processes
+BROWSER_PROCESS_HINT = "chrom"
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_MB = 1048576.0
+
+
+def parse_stat(text: str) -> tuple[str, int, int, int]:
+    """Parse a ``/proc/<pid>/stat`` line.
+
+    The command name may itself contain spaces and parentheses, so fields are
+    split after its closing parenthesis.
+
+    Returns
+    -------
+    tuple[str, int, int, int]
+        Command name, parent pid, user+system CPU ticks and RSS in pages.
+    """
+    comm = text[text.index("(") + 1 : text.rindex(")")]
+    fields = text[text.rindex(")") + 2 :].split()
+    # fields[0] is field 3 (state) of proc(5)
+    return comm, int(fields[1]), int(fields[11]) + int(fields[12]), int(fields[21])
+
+
+def process_table(proc_root: Path = PROC_ROOT) -> dict[int, tuple[str, int, int, int]]:
+    """Snapshot ``parse_stat`` for every visible process, keyed by pid."""
+    table = {}
+    for entry in proc_root.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            table[int(entry.name)] = parse_stat(
+                (entry / "stat").read_text(encoding="utf-8", errors="replace")
+            )
+        except (OSError, ValueError, IndexError):
+            continue  # Exited between listing and reading
+    return table
+
+
+def descendants(
+    table: dict[int, tuple[str, int, int, int]], roots: set[int]
+) -> set[int]:
+    """The ``roots`` still alive plus every process descending from them."""
+    children: dict[int, list[int]] = {}
+    for pid, (_, ppid, _, _) in table.items():
+        children.setdefault(ppid, []).append(pid)
+    found = set()
+    stack = [pid for pid in roots if pid in table]
+    while stack:
+        pid = stack.pop()
+        if pid not in found:
+            found.add(pid)
+            stack.extend(children.get(pid, []))
+    return found
+
+
+def find_browser_roots(
+    table: dict[int, tuple[str, int, int, int]] | None = None,
+    ancestor: int | None = None,
+    hint: str = BROWSER_PROCESS_HINT,
+) -> set[int]:
+    """Topmost Chromium processes descending from ``ancestor``.
+
+    Parameters
+    ----------
+    table : dict | None, default=None
+        Process snapshot; taken now when omitted.
+    ancestor : int | None, default=None
+        Process whose subtree is searched; defaults to this Python process
+        (Playwright's driver runs Chromium as its child).
+    hint : str, default=BROWSER_PROCESS_HINT
+        Case-insensitive substring of the command name marking Chromium.
+
+    Returns
+    -------
+    set[int]
+        Chromium pids whose parent is not itself a Chromium process.
+    """
+    table = process_table() if table is None else table
+    subtree = descendants(table, {os.getpid() if ancestor is None else ancestor})
+
+    def is_browser(pid: int) -> bool:
+        return pid in table and hint in table[pid][0].lower()
+
+    return {pid for pid in subtree if is_browser(pid) and not is_browser(table[pid][1])}
+
+
+class ProcessTreeSampler:
+    """Background thread sampling CPU time and RSS of a process tree.
+
+    Parameters
+    ----------
+    roots : Callable[[], set[int]]
+        Returns the tree's root pids; read on every sample so a browser that
+        launches after the sampler starts is still picked up.
+    interval_sec : float
+        Time between samples.
+    proc_root : Path, default=PROC_ROOT
+        ``/proc`` mount to read.
+    """
+
+    def __init__(
+        self,
+        roots: Callable[[], set[int]],
+        interval_sec: float,
+        proc_root: Path = PROC_ROOT,
+    ) -> None:
+        self._roots = roots
+        self._interval = interval_sec
+        self._proc_root = proc_root
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="proc-sampler", daemon=True
+        )
+        self._first_ticks: dict[int, int] = {}
+        self._last_ticks: dict[int, int] = {}
+        self.samples: list[tuple[float, int, int, int]] = []
+
+    def sample(self) -> None:
+        """Record one ``(t, total_ticks, rss_pages, processes)`` sample."""
+        table = process_table(self._proc_root)
+        tree = descendants(table, self._roots())
+        for pid in tree:
+            ticks = table[pid][2]
+            self._first_ticks.setdefault(pid, ticks)
+            self._last_ticks[pid] = ticks
+        # Ticks of processes that exited stay counted at their last reading
+        total_ticks = sum(
+            self._last_ticks[pid] - self._first_ticks[pid] for pid in self._last_ticks
+        )
+        rss_pages = sum(table[pid][3] for pid in tree)
+        self.samples.append((time.perf_counter(), total_ticks, rss_pages, len(tree)))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.sample()
+
+    def start(self) -> None:
+        """Take the first sample and start sampling in the background."""
+        self.sample()
+        self._thread.start()
+
+    def stop(self) -> dict[str, Any] | None:
+        """Stop sampling, take a final sample and summarize the run."""
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+        return summarize_process_samples(self.samples)
+
+
+def summarize_process_samples(
+    samples: list[tuple[float, int, int, int]],
+) -> dict[str, Any] | None:
+    """Reduce tree samples to per-test CPU and RSS figures.
+
+    Parameters
+    ----------
+    samples : list[tuple[float, int, int, int]]
+        ``(perf_counter, cumulative_cpu_ticks, rss_pages, processes)``.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        CPU seconds with average and peak utilisation (100% = one core), RSS
+        average and peak in MB, and the peak process count; None when the
+        tree was never seen.
+    """
+    seen = [sample for sample in samples if sample[3]]
+    if not seen or len(samples) < 2:
+        return None
+    wall = samples[-1][0] - samples[0][0]
+    cpu_sec = (samples[-1][1] - samples[0][1]) / _CLK_TCK
+    peak_percent = max(
+        (
+            (later[1] - earlier[1]) / _CLK_TCK / (later[0] - earlier[0]) * 100.0
+            for earlier, later in zip(samples, samples[1:])
+            if later[0] > earlier[0]
+        ),
+        default=0.0,
+    )
+    rss = [sample[2] * _PAGE_SIZE / _MB for sample in seen]
+    return {
+        "samples": len(samples),
+        "processes_peak": max(sample[3] for sample in seen),
+        "cpu_sec": round(cpu_sec, 3),
+        "cpu_avg_percent": round(cpu_sec / wall * 100.0, 1) if wall > 0 else None,
+        "cpu_peak_percent": round(peak_percent, 1),
+        "rss_avg_mb": round(sum(rss) / len(rss), 1),
+        "rss_peak_mb": round(max(rss), 1),
+    }
+
+
+class ProcessUsagePlugin:
+    """Sample the Chromium process tree from test setup to teardown.
+
+    Only tests running on ``browser_instance`` are sampled; the peak and
+    average figures go into the test's entry under ``browser_process``.
+
+    Parameters
+    ----------
+    attach : Callable[[str, str, Any], None]
+        Stores a metric under ``key`` in the entry of test ``nodeid``.
+    roots : Callable[[], set[int]]
+        Returns the browser's root pids.
+    interval_sec : float
+        Time between samples.
+    """
+
+    def __init__(
+        self,
+        attach: AttachMetric,
+        roots: Callable[[], set[int]],
+        interval_sec: float,
+    ) -> None:
+        self._attach = attach
+        self._roots = roots
+        self._interval = interval_sec
+        self._sampler: ProcessTreeSampler | None = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        if "browser_instance" in getattr(item, "fixturenames", ()):
+            sampler = ProcessTreeSampler(self._roots, self._interval)
+            try:
+                sampler.start()
+                self._sampler = sampler
+            except OSError as exc:
+                warnings.warn(
+                    f"Browser process sampling could not start: {exc}",
+                    UserWarning,
+                    stacklevel=2,
+                )
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        _ = nextitem
+        yield
+        sampler, self._sampler = self._sampler, None
+        if sampler is None:
+            return
+        try:
+            summary = sampler.stop()
+        except OSError as exc:
+            warnings.warn(
+                f"Browser process sampling failed: {exc}", UserWarning, stacklevel=2
+            )
+            return
+        if summary:
+            self._attach(item.nodeid, "browser_process", summary)
+
+
+def write_terminal_summary(terminalreporter: Any, entries: list[dict]) -> None:
+    """Output per-test CPU and RSS of the Chromium process tree."""
+    process_entries = [entry for entry in entries if entry.get("browser_process")]
+    if not process_entries:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("Chromium Process Usage", sep="=", bold=True)
+    for entry in process_entries:
+        usage = entry["browser_process"]
+        terminalreporter.write_line(
+            f"  • {entry['nodeid'].split('::')[-1]:<45} | "
+            f"CPU {usage['cpu_sec']}s "
+            f"(avg {usage['cpu_avg_percent']}%, peak {usage['cpu_peak_percent']}%) "
+            f"| RSS avg {usage['rss_avg_mb']} MB, peak {usage['rss_peak_mb']} MB "
+            f"| {usage['processes_peak']} processes"
+        )
+    terminalreporter.ensure_newline()
@@ -0,0 +1,357 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/regression_detector.py
+"""Statistical performance regression detection between metrics runs.
+
+A single ``duration_sec`` per test is noise; this tool compares two *sets* of
+``metrics_baseline`` results (repeated runs, shards, or commits in the
+``metrics_history`` database) per test and metric. A metric regresses when the
+candidate is significantly larger than the baseline - one-sided Mann-Whitney U
+(default) or a bootstrap confidence interval of the median difference - *and*
+the median shift exceeds both a relative and a per-metric absolute floor, so
+tiny but consistent shifts do not gate CI.
+
+Exit status is 1 when any regression is found, 0 otherwise.
+
+Usage::
+
+    python -m tests.perf.regression_detector \\
+        --baseline runs/main/metrics_baseline*.json \\
+        --candidate artifacts/metrics_baseline*.json
+    python -m tests.perf.regression_detector --db artifacts/metrics_history.sqlite \\
+        --baseline-commit <sha> --candidate-commit <sha>
+"""
+
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+from pathlib import Path
+from typing import Any
+
+from tests.perf import metrics_history
+from tests.test_utils import ARTIFACTS_DIR
+
+# Flattened metric name -> smallest absolute median increase worth flagging
+DEFAULT_METRICS = {
+    "duration_sec": 0.1,
+    "wasm_boot_duration_sec": 0.1,
+    "boot_phases.total_ms": 100.0,
+    "memory_timeline.js_heap_slope_mb_per_min": 0.5,
+    "memory_timeline.wasm_heap_slope_mb_per_min": 0.5,
+    "engine_monitors.end.static_memory_bytes": 1048576.0,
+}
+
+DEFAULT_ALPHA = 0.05
+DEFAULT_MIN_CHANGE = 0.05
+DEFAULT_RESAMPLES = 2000
+MIN_SAMPLES = 3
+
+# Exact U distributions are enumerated up to this many sample pairs
+_EXACT_MAX_PAIRS = 400
+
+
+def _ranks(values: list[float]) -> tuple[list[float], list[int]]:
+    """Average ranks (1-based) and the sizes of tied groups."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties = []
+    index = 0
+    while index < len(order):
+        end = index
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[index]]:
+            end += 1
+        for position in range(index, end + 1):
+            ranks[order[position]] = (index + end) / 2.0 + 1.0
+        ties.append(end - index + 1)
+        index = end + 1
+    return ranks, ties
+
+
+def _exact_u_tail(u_stat: float, n_x: int, n_y: int) -> float:
+    """P(U >= u_stat) under H0 by counting rank arrangements (no ties)."""
+    # counts[i][j][u]: arrangements of i x-values and j y-values with U == u
+    total_pairs = n_x * n_y
+    counts = [[[0] * (total_pairs + 1) for _ in range(n_y + 1)] for _ in range(n_x + 1)]
+    for i in range(n_x + 1):
+        counts[i][0][0] = 1
+    for j in range(n_y + 1):
+        counts[0][j][0] = 1
+    for i in range(1, n_x + 1):
+        for j in range(1, n_y + 1):
+            for u in range(total_pairs + 1):
+                # Largest value is an x (adds j wins for x) or a y (adds none)
+                from_x = counts[i - 1][j][u - j] if u >= j else 0
+                counts[i][j][u] = from_x + counts[i][j - 1][u]
+    distribution = counts[n_x][n_y]
+    tail = sum(distribution[math.ceil(u_stat) :])
+    return tail / math.comb(n_x + n_y, n_x)
+
+
+def mann_whitney_greater(baseline: list[float], candidate: list[float]) -> float:
+    """One-sided Mann-Whitney U p-value for "candidate tends to be larger".
+
+    Exact for small tie-free samples, otherwise the tie-corrected normal
+    approximation with continuity correction.
+    """
+    n_x, n_y = len(candidate), len(baseline)
+    if not n_x or not n_y:
+        return 1.0
+    ranks, ties = _ranks(list(candidate) + list(baseline))
+    u_stat = sum(ranks[:n_x]) - n_x * (n_x + 1) / 2.0
+    if all(size == 1 for size in ties) and n_x * n_y <= _EXACT_MAX_PAIRS:
+        return _exact_u_tail(u_stat, n_x, n_y)
+    n = n_x + n_y
+    tie_term = sum(size**3 - size for size in ties) / (n * (n - 1))
+    variance = n_x * n_y / 12.0 * ((n + 1) - tie_term)
+    if variance <= 0:
+        return 1.0
+    z = (u_stat - n_x * n_y / 2.0 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2.0))
+
+
+def bootstrap_median_diff_ci(
+    baseline: list[float],
+    candidate: list[float],
+    confidence: float = 1.0 - DEFAULT_ALPHA,
+    resamples: int = DEFAULT_RESAMPLES,
+    seed: int = 0,
+) -> tuple[float, float]:
+    """Percentile bootstrap CI of ``median(candidate) - median(baseline)``."""
+    rng = random.Random(seed)
+    diffs = sorted(
+        statistics.median(rng.choices(candidate, k=len(candidate)))
+        - statistics.median(rng.choices(baseline, k=len(baseline)))
+        for _ in range(resamples)
+    )
+    tail = (1.0 - confidence) / 2.0
+    low = diffs[int(math.floor(tail * (resamples - 1)))]
+    high = diffs[int(math.ceil((1.0 - tail) * (resamples - 1)))]
+    return low, high
+
+
+def compare_samples(
+    baseline: list[float],
+    candidate: list[float],
+    min_abs_change: float,
+    method: str = "mannwhitney",
+    alpha: float = DEFAULT_ALPHA,
+    min_change: float = DEFAULT_MIN_CHANGE,
+) -> dict[str, Any]:
+    """Compare one metric of one test between the two sets.
+
+    Parameters
+    ----------
+    baseline, candidate : list[float]
+        Samples of the metric (one per run).
+    min_abs_change : float
+        Smallest absolute median increase that counts as a regression.
+    method : str, default="mannwhitney"
+        ``"mannwhitney"`` or ``"bootstrap"``.
+    alpha : float, default=DEFAULT_ALPHA
+        Significance level (bootstrap uses a ``1 - alpha`` interval).
+    min_change : float, default=DEFAULT_MIN_CHANGE
+        Smallest relative median increase that counts as a regression.
+
+    Returns
+    -------
+    dict[str, Any]
+        Sample sizes, medians, change, test statistic (``p_value`` or
+        ``ci``), ``significant`` and ``regression`` flags; ``status`` is
+        ``"insufficient"`` when either side has fewer than ``MIN_SAMPLES``.
+    """
+    result: dict[str, Any] = {
+        "n_baseline": len(baseline),
+        "n_candidate": len(candidate),
+        "regression": False,
+    }
+    if len(baseline) < MIN_SAMPLES or len(candidate) < MIN_SAMPLES:
+        result["status"] = "insufficient"
+        return result
+
+    base_median = statistics.median(baseline)
+    cand_median = statistics.median(candidate)
+    change = cand_median - base_median
+    if base_median:
+        relative = change / abs(base_median)
+    else:
+        relative = math.inf if change > 0 else 0.0
+    result.update(
+        baseline_median=round(base_median, 6),
+        candidate_median=round(cand_median, 6),
+        change=round(change, 6),
+        change_pct=round(relative * 100.0, 2) if math.isfinite(relative) else None,
+    )
+    if method == "bootstrap":
+        low, high = bootstrap_median_diff_ci(baseline, candidate, 1.0 - alpha)
+        result["ci"] = [round(low, 6), round(high, 6)]
+        significant = low > 0
+    else:
+        p_value = mann_whitney_greater(baseline, candidate)
+        result["p_value"] = round(p_value, 6)
+        significant = p_value < alpha
+    result["significant"] = significant
+    result["regression"] = (
+        significant and change >= min_abs_change and relative >= min_change
+    )
+    result["status"] = "regression" if result["regression"] else "ok"
+    return result
+
+
+def load_sample_sets(paths: list[Path], metrics: list[str]) -> dict[tuple, list]:
+    """Collect ``(nodeid, metric) -> values`` across baseline files.
+
+    Only passed tests contribute; failed runs would skew durations.
+    """
+    samples: dict[tuple, list] = {}
+    for path in paths:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        for entry in payload.get("tests", []):
+            if entry.get("outcome") != "passed":
+                continue
+            flat = metrics_history.flatten_metrics(entry)
+            for metric in metrics:
+                if metric in flat:
+                    samples.setdefault((entry["nodeid"], metric), []).append(
+                        flat[metric]
+                    )
+    return samples
+
+
+def load_commit_samples(
+    conn: Any, commit: str, metrics: list[str]
+) -> dict[tuple, list]:
+    """Collect ``(nodeid, metric) -> values`` for a commit from the history DB."""
+    samples: dict[tuple, list] = {}
+    for metric in metrics:
+        by_test = metrics_history.metric_values_by_commit(conn, metric, commit)
+        for nodeid, values in by_test.items():
+            samples[(nodeid, metric)] = values
+    return samples
+
+
+def detect_regressions(
+    baseline: dict[tuple, list],
+    candidate: dict[tuple, list],
+    thresholds: dict[str, float],
+    method: str = "mannwhitney",
+    alpha: float = DEFAULT_ALPHA,
+    min_change: float = DEFAULT_MIN_CHANGE,
+) -> list[dict[str, Any]]:
+    """Compare every ``(nodeid, metric)`` present in both sets."""
+    findings = []
+    for key in sorted(set(baseline) & set(candidate)):
+        nodeid, metric = key
+        result = compare_samples(
+            baseline[key],
+            candidate[key],
+            thresholds[metric],
+            method=method,
+            alpha=alpha,
+            min_change=min_change,
+        )
+        findings.append({"nodeid": nodeid, "metric": metric, **result})
+    return findings
+
+
+def _format_finding(finding: dict[str, Any]) -> str:
+    name = finding["nodeid"].split("::")[-1]
+    if finding["status"] == "insufficient":
+        return (
+            f"  {name:<45} {finding['metric']:<45} insufficient samples "
+            f"({finding['n_baseline']} vs {finding['n_candidate']})"
+        )
+    evidence = (
+        f"p={finding['p_value']:.4f}"
+        if "p_value" in finding
+        else f"CI [{finding['ci'][0]:+.4g}, {finding['ci'][1]:+.4g}]"
+    )
+    change = (
+        f"{finding['change_pct']:+.1f}%" if finding["change_pct"] is not None else "new"
+    )
+    marker = "REGRESSION" if finding["regression"] else "ok"
+    return (
+        f"  {name:<45} {finding['metric']:<45} "
+        f"{finding['baseline_median']:.4g} -> {finding['candidate_median']:.4g} "
+        f"({change}, {evidence}) {marker}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: compare two result sets and exit 1 on any regression."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", nargs="+", type=Path, default=[])
+    parser.add_argument("--candidate", nargs="+", type=Path, default=[])
+    parser.add_argument("--db", type=Path, default=None)
+    parser.add_argument("--baseline-commit", default=None)
+    parser.add_argument("--candidate-commit", default=None)
+    parser.add_argument(
+        "--metric",
+        action="append",
+        choices=sorted(DEFAULT_METRICS),
+        help="Metric to compare (repeatable; default: all).",
+    )
+    parser.add_argument(
+        "--method", choices=("mannwhitney", "bootstrap"), default="mannwhitney"
+    )
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+    parser.add_argument("--min-change", type=float, default=DEFAULT_MIN_CHANGE)
+    parser.add_argument(
+        "--output", type=Path, default=ARTIFACTS_DIR / "regression_report.json"
+    )
+    args = parser.parse_args(argv)
+
+    metrics = args.metric or list(DEFAULT_METRICS)
+    if args.db is not None:
+        if not (args.baseline_commit and args.candidate_commit):
+            parser.error("--db requires --baseline-commit and --candidate-commit")
+        conn = metrics_history.connect(args.db)
+        try:
+            baseline = load_commit_samples(conn, args.baseline_commit, metrics)
+            candidate = load_commit_samples(conn, args.candidate_commit, metrics)
+        finally:
+            conn.close()
+    elif args.baseline and args.candidate:
+        baseline = load_sample_sets(args.baseline, metrics)
+        candidate = load_sample_sets(args.candidate, metrics)
+    else:
+        parser.error("pass --baseline/--candidate files or --db with commits")
+
+    findings = detect_regressions(
+        baseline,
+        candidate,
+        DEFAULT_METRICS,
+        method=args.method,
+        alpha=args.alpha,
+        min_change=args.min_change,
+    )
+    regressions = [finding for finding in findings if finding["regression"]]
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(
+            {
+                "method": args.method,
+                "alpha": args.alpha,
+                "min_change": args.min_change,
+                "regressions": len(regressions),
+                "findings": findings,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+    for finding in findings:
+        print(_format_finding(finding))
+    print(
+        f"{len(regressions)} regression(s) across {len(findings)} comparisons "
+        f"-> {args.output}"
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
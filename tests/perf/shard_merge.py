@@ -0,0 +1,274 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/shard_merge.py
+"""Merge per-shard ``metrics_baseline`` files into one suite report.
+
+CI writes ``metrics_baseline_core.json``, ``metrics_baseline_ci.json`` and
+``metrics_baseline_refactor.json`` from parallel shards. This tool folds them,
+plus any repeated runs of the same shard, into a single report:
+
+* per test - run count, outcomes and p50/p90/max of ``duration_sec``;
+* per shard - p50/p90/max session wall time, test time and harness overhead;
+* critical path - shards run in parallel and tests serially within a shard,
+  so the suite takes as long as its slowest shard; that shard and the tests
+  dominating it are reported;
+* imbalance - spread of shard p50 times, the max/mean ratio and the runner
+  time spent idle waiting for the slowest shard.
+
+The report is written as JSON and Markdown (the latter suits
+``$GITHUB_STEP_SUMMARY``)::
+
+    python -m tests.perf.shard_merge artifacts/shards/**/metrics_baseline_*.json
+"""
+
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Any
+
+from tests.perf import metrics_history
+from tests.test_utils import ARTIFACTS_DIR
+
+# Shard label for baselines without a ``metrics_baseline_<shard>.json`` name
+LOCAL_SHARD = "local"
+
+# Slowest tests listed for the critical-path shard
+DEFAULT_TOP_TESTS = 10
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of ``values``."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _spread(values: list[float]) -> dict[str, float]:
+    return {
+        "p50_sec": round(_percentile(values, 50), 4),
+        "p90_sec": round(_percentile(values, 90), 4),
+        "max_sec": round(max(values), 4),
+    }
+
+
+def load_shard_runs(paths: list[Path]) -> list[dict[str, Any]]:
+    """Load baseline payloads tagged with their shard.
+
+    The same run is often present twice (``metrics_baseline.json`` next to its
+    ``metrics_baseline_<shard>.json`` copy); payloads are de-duplicated on
+    shard and timestamp.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        ``{"shard", "source", "payload"}`` per distinct run, in path order.
+    """
+    runs = []
+    seen = set()
+    for path in paths:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        shard = metrics_history.shard_from_path(path) or LOCAL_SHARD
+        key = (shard, payload.get("timestamp"))
+        if key in seen:
+            continue
+        seen.add(key)
+        runs.append({"shard": shard, "source": str(path), "payload": payload})
+    return runs
+
+
+def merge_shard_runs(
+    runs: list[dict[str, Any]], top: int = DEFAULT_TOP_TESTS
+) -> dict[str, Any]:
+    """Aggregate shard runs into per-test, per-shard and suite statistics.
+
+    Parameters
+    ----------
+    runs : list[dict[str, Any]]
+        Runs as returned by ``load_shard_runs``.
+    top : int, default=DEFAULT_TOP_TESTS
+        Number of slowest critical-path tests to list.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``runs``, ``tests`` (slowest p50 first), ``shards``, ``critical_path``
+        and ``imbalance`` sections.
+    """
+    durations: dict[str, list[float]] = {}
+    outcomes: dict[str, dict[str, int]] = {}
+    test_shards: dict[str, str] = {}
+    shard_totals: dict[str, list[float]] = {}
+    for run in runs:
+        payload = run["payload"]
+        shard_totals.setdefault(run["shard"], []).append(
+            float(payload.get("total_duration_sec") or 0.0)
+        )
+        for entry in payload.get("tests", []):
+            nodeid = entry["nodeid"]
+            test_shards.setdefault(nodeid, run["shard"])
+            counts = outcomes.setdefault(nodeid, {})
+            counts[entry["outcome"]] = counts.get(entry["outcome"], 0) + 1
+            if entry.get("duration_sec") is not None:
+                durations.setdefault(nodeid, []).append(float(entry["duration_sec"]))
+
+    tests = []
+    for nodeid, shard in test_shards.items():
+        values = durations.get(nodeid)
+        test = {"nodeid": nodeid, "shard": shard, "outcomes": outcomes[nodeid]}
+        test["runs"] = sum(test["outcomes"].values())
+        test.update(_spread(values) if values else {})
+        tests.append(test)
+    tests.sort(key=lambda test: test.get("p50_sec", 0.0), reverse=True)
+
+    shards = {}
+    for shard, totals in sorted(shard_totals.items()):
+        test_sec = sum(
+            test.get("p50_sec", 0.0) for test in tests if test["shard"] == shard
+        )
+        stats = _spread(totals)
+        shards[shard] = dict(
+            stats,
+            runs=len(totals),
+            tests=sum(1 for test in tests if test["shard"] == shard),
+            test_sec=round(test_sec, 4),
+            overhead_sec=round(max(stats["p50_sec"] - test_sec, 0.0), 4),
+        )
+
+    critical_path = None
+    imbalance = None
+    if shards:
+        critical = max(shards, key=lambda name: shards[name]["p50_sec"])
+        wall = shards[critical]["p50_sec"]
+        critical_path = {
+            "shard": critical,
+            "estimated_wall_sec": wall,
+            "estimated_wall_p90_sec": max(s["p90_sec"] for s in shards.values()),
+            "slowest_tests": [
+                {
+                    "nodeid": test["nodeid"],
+                    "p50_sec": test["p50_sec"],
+                    "share": round(test["p50_sec"] / wall, 4) if wall else None,
+                }
+                for test in tests
+                if test["shard"] == critical and "p50_sec" in test
+            ][:top],
+        }
+        p50s = [stats["p50_sec"] for stats in shards.values()]
+        mean = sum(p50s) / len(p50s)
+        imbalance = {
+            "shards": len(p50s),
+            "mean_sec": round(mean, 4),
+            "min_sec": min(p50s),
+            "max_sec": max(p50s),
+            "spread_sec": round(max(p50s) - min(p50s), 4),
+            "ratio": round(max(p50s) / mean, 4) if mean else None,
+            "idle_runner_sec": round(sum(max(p50s) - value for value in p50s), 4),
+        }
+
+    return {
+        "runs": [{"shard": run["shard"], "source": run["source"]} for run in runs],
+        "tests": tests,
+        "shards": shards,
+        "critical_path": critical_path,
+        "imbalance": imbalance,
+    }
+
+
+def render_markdown(report: dict[str, Any], top: int = DEFAULT_TOP_TESTS) -> str:
+    """Render a merged report as GitHub-flavoured Markdown."""
+    lines = [
+        "## Cross-Shard Metrics",
+        "",
+        f"Merged {len(report['runs'])} run(s) across {len(report['shards'])} shard(s).",
+    ]
+    critical = report["critical_path"]
+    imbalance = report["imbalance"]
+    if critical:
+        lines += [
+            "",
+            f"**Critical path:** `{critical['shard']}` shard, "
+            f"~{critical['estimated_wall_sec']}s wall "
+            f"(p90 {critical['estimated_wall_p90_sec']}s).",
+            f"**Imbalance:** max/mean {imbalance['ratio']}, "
+            f"spread {imbalance['spread_sec']}s, "
+            f"{imbalance['idle_runner_sec']}s idle runner time.",
+        ]
+
+    lines += [
+        "",
+        "### Shards",
+        "",
+        "| Shard | Runs | Tests | p50 (s) | p90 (s) | Max (s) | Test time (s) "
+        "| Overhead (s) |",
+        "| --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: |",
+    ]
+    for name, stats in report["shards"].items():
+        lines.append(
+            f"| {name} | {stats['runs']} | {stats['tests']} | {stats['p50_sec']} "
+            f"| {stats['p90_sec']} | {stats['max_sec']} | {stats['test_sec']} "
+            f"| {stats['overhead_sec']} |"
+        )
+
+    if critical and critical["slowest_tests"]:
+        lines += [
+            "",
+            f"### Slowest Tests on `{critical['shard']}`",
+            "",
+            "| Test | p50 (s) | Share of shard |",
+            "| --- | ---: | ---: |",
+        ]
+        for test in critical["slowest_tests"]:
+            share = f"{test['share']:.1%}" if test["share"] is not None else "n/a"
+            lines.append(f"| `{test['nodeid']}` | {test['p50_sec']} | {share} |")
+
+    timed = [test for test in report["tests"] if "p50_sec" in test]
+    if timed:
+        lines += [
+            "",
+            "### Slowest Tests Overall",
+            "",
+            "| Test | Shard | Runs | p50 (s) | p90 (s) | Max (s) |",
+            "| --- | --- | ---: | ---: | ---: | ---: |",
+        ]
+        for test in timed[:top]:
+            lines.append(
+                f"| `{test['nodeid']}` | {test['shard']} | {test['runs']} "
+                f"| {test['p50_sec']} | {test['p90_sec']} | {test['max_sec']} |"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: merge shard baselines and write JSON and Markdown reports."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", type=Path)
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_TESTS)
+    parser.add_argument(
+        "--json", type=Path, default=ARTIFACTS_DIR / "shard_metrics_report.json"
+    )
+    parser.add_argument(
+        "--markdown", type=Path, default=ARTIFACTS_DIR / "shard_metrics_report.md"
+    )
+    args = parser.parse_args(argv)
+
+    runs = load_shard_runs([path for path in args.paths if path.is_file()])
+    if not runs:
+        print("No metrics baselines to merge", file=sys.stderr)
+        return 1
+
+    report = merge_shard_runs(runs, top=args.top)
+    markdown = render_markdown(report, top=args.top)
+    for path, text in (
+        (args.json, json.dumps(report, indent=2)),
+        (args.markdown, markdown),
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    print(markdown)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/perf/soak.py
+"""Long-running gameplay soak with resource growth detection.
+
+``run_soak`` keeps a level running for ``--soak-minutes`` by looping a recorded
+input scenario (``tests/replays``) and, every ``--soak-interval`` seconds,
+samples frame time (p95 over the interval), JS heap, WASM linear memory and
+Godot object/node/orphan counts. After a warm-up window the series are fitted
+with least-squares slopes; any slope above ``SOAK_DRIFT_THRESHOLDS`` fails the
+soak. The full time series is written to ``artifacts/soak_timeseries.json``.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from tests.perf import engine_monitors, input_replay
+from tests.perf.frame_timing import frame_samples_since, summarize_frame_times
+from tests.perf.memory_sampling import linear_slope
+
+DEFAULT_SOAK_INTERVAL_SEC = 30
+
+# Samples taken before this are boot/level-load transients and not fitted
+SOAK_WARMUP_SEC = 60.0
+MIN_TREND_SAMPLES = 5
+
+# Fuel tank seeded for soaks so the engine never flames out mid-run
+SOAK_MAX_FUEL = 1000000.0
+
+SOAK_SCENARIO = "strafe_and_fire.keys.json"
+
+# Maximum tolerated growth per minute for each sampled series
+SOAK_DRIFT_THRESHOLDS = {
+    "frame_p95_ms": 0.5,
+    "js_heap_mb": 2.0,
+    "wasm_heap_mb": 1.0,
+    "object_count": 50.0,
+    "node_count": 5.0,
+    "orphan_node_count": 0.5,
+}
+
+SOAK_COLUMNS = ("t_sec",) + tuple(SOAK_DRIFT_THRESHOLDS)
+
+_MB = 1048576.0
+
+_HEAP_PROBE_SCRIPT = """
+() => {
+    const mem = performance.memory;
+    const rtenv = window.engine && window.engine.rtenv;
+    return {
+        frames_total: window.__frameTiming ? window.__frameTiming.collect().total : null,
+        js_heap: mem ? mem.usedJSHeapSize : null,
+        wasm_heap: rtenv && rtenv.HEAP8 ? rtenv.HEAP8.length : null,
+    };
+}
+"""
+
+
+def _mb(value: float | None) -> float | None:
+    return round(value / _MB, 3) if value is not None else None
+
+
+def take_soak_sample(
+    page: Any, t_sec: float, frames_total: int | None
+) -> tuple[dict[str, Any], int | None]:
+    """Sample every soak series once.
+
+    Parameters
+    ----------
+    page : Any
+        The page running the soak.
+    t_sec : float
+        Seconds since the soak started.
+    frames_total : int | None
+        Frame sampler position at the previous sample; the frame-time p95
+        covers only frames rendered since then.
+
+    Returns
+    -------
+    tuple[dict[str, Any], int | None]
+        The sample keyed by ``SOAK_COLUMNS`` and the new sampler position.
+    """
+    probe = page.evaluate(_HEAP_PROBE_SCRIPT)
+    frames = frame_samples_since(page, frames_total)
+    frame_stats = summarize_frame_times(frames) if frames else None
+    monitors = engine_monitors.snapshot_engine_monitors(page) or {}
+    sample = {
+        "t_sec": round(t_sec, 2),
+        "frame_p95_ms": frame_stats["p95_ms"] if frame_stats else None,
+        "js_heap_mb": _mb(probe.get("js_heap")),
+        "wasm_heap_mb": _mb(probe.get("wasm_heap")),
+        "object_count": monitors.get("object_count"),
+        "node_count": monitors.get("node_count"),
+        "orphan_node_count": monitors.get("orphan_node_count"),
+    }
+    return sample, probe.get("frames_total")
+
+
+def fit_soak_trends(
+    samples: list[dict[str, Any]], warmup_sec: float = SOAK_WARMUP_SEC
+) -> dict[str, float | None]:
+    """Fit a per-minute growth slope to each series after the warm-up.
+
+    Returns
+    -------
+    dict[str, float | None]
+        Slope per minute for each ``SOAK_DRIFT_THRESHOLDS`` key; None when
+        fewer than ``MIN_TREND_SAMPLES`` usable samples exist.
+    """
+    steady = [sample for sample in samples if sample["t_sec"] >= warmup_sec]
+    trends: dict[str, float | None] = {}
+    for key in SOAK_DRIFT_THRESHOLDS:
+        points = [
+            (sample["t_sec"] / 60.0, float(sample[key]))
+            for sample in steady
+            if sample.get(key) is not None
+        ]
+        slope = linear_slope(points) if len(points) >= MIN_TREND_SAMPLES else None
+        trends[key] = round(slope, 4) if slope is not None else None
+    return trends
+
+
+def find_drift(
+    trends: dict[str, float | None],
+    thresholds: dict[str, float] | None = None,
+) -> list[str]:
+    """Describe every series whose growth slope exceeds its threshold."""
+    thresholds = thresholds or SOAK_DRIFT_THRESHOLDS
+    return [
+        f"{key} grew {slope:+.3f}/min (limit {thresholds[key]}/min)"
+        for key, slope in trends.items()
+        if slope is not None and key in thresholds and slope > thresholds[key]
+    ]
+
+
+def write_soak_timeseries(report: dict[str, Any], path: Path) -> Path:
+    """Export the soak report with samples flattened to ``SOAK_COLUMNS`` rows."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = dict(report)
+    payload["columns"] = list(SOAK_COLUMNS)
+    payload["samples"] = [
+        [sample.get(column) for column in SOAK_COLUMNS] for sample in report["samples"]
+    ]
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return path
+
+
+def run_soak(
+    page: Any,
+    minutes: float,
+    interval_sec: float = DEFAULT_SOAK_INTERVAL_SEC,
+    scenario: str = SOAK_SCENARIO,
+) -> dict[str, Any]:
+    """Loop a recorded scenario for ``minutes`` while sampling resources.
+
+    Parameters
+    ----------
+    page : Any
+        A page with a running level and focused canvas.
+    minutes : float
+        Soak length; the scenario loop in progress finishes past the deadline.
+    interval_sec : float, default=DEFAULT_SOAK_INTERVAL_SEC
+        Minimum time between samples (sampled between scenario loops).
+    scenario : str, default=SOAK_SCENARIO
+        Recording under ``tests/replays`` driving the player.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``minutes``, ``interval_sec``, ``loops``, the worst input arrival
+        drift and missing key events over all loops, ``samples``, ``trends``
+        and ``violations`` (empty when no series drifted).
+    """
+    recording = input_replay.load_recording(input_replay.REPLAYS_DIR / scenario)
+    started = time.perf_counter()
+    deadline = started + minutes * 60.0
+    sample, frames_total = take_soak_sample(page, 0.0, None)
+    samples = [sample]
+    next_sample = interval_sec
+    loops = 0
+    max_drift_frames = 0
+    missing_events = 0
+
+    while time.perf_counter() < deadline:
+        replay = input_replay.replay_inputs(page, recording)
+        loops += 1
+        max_drift_frames = max(max_drift_frames, replay["max_drift_frames"])
+        missing_events += replay["missing_events"]
+        elapsed = time.perf_counter() - started
+        if elapsed >= next_sample:
+            sample, frames_total = take_soak_sample(page, elapsed, frames_total)
+            samples.append(sample)
+            while next_sample <= elapsed:
+                next_sample += interval_sec
+
+    # Short soaks still keep a proportional warm-up out of the fit
+    trends = fit_soak_trends(samples, min(SOAK_WARMUP_SEC, minutes * 60.0 * 0.2))
+    return {
+        "minutes": minutes,
+        "interval_sec": interval_sec,
+        "scenario": scenario,
+        "loops": loops,
+        "max_drift_frames": max_drift_frames,
+        "missing_events": missing_events,
+        "samples": samples,
+        "trends": trends,
+        "violations": find_drift(trends),
+    }
+
+
+def write_terminal_summary(terminalreporter: Any, entries: list[dict]) -> None:
+    """Output fitted soak growth trends and any drift beyond thresholds."""
+    soak_entries = [entry for entry in entries if entry.get("soak")]
+    if not soak_entries:
+        return
+    terminalreporter.ensure_newline()
+    terminalreporter.section("Soak Resource Trends", sep="=", bold=True)
+    for entry in soak_entries:
+        report = entry["soak"]
+        trends = " | ".join(
+            f"{key} {slope:+.2f}/min"
+            for key, slope in report["trends"].items()
+            if slope is not None
+        )
+        terminalreporter.write_line(
+            f"  • {entry['nodeid'].split('::')[-1]:<45} | "
+            f"{report['minutes']} min, {report['loops']} loops | "
+            f"{trends or 'not enough samples'}"
+        )
+        for violation in report["violations"]:
+            terminalreporter.write_line(f"      drift: {violation}")
+    terminalreporter.ensure_newline()
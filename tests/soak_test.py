@@ -0,0 +1,59 @@
+# Copyright (C) 2026 Egor Kostan
+# SPDX-License-Identifier: GPL-3.0-or-later
+# tests/soak_test.py
+"""
+Gameplay Soak Test (Playwright, Python)
+=======================================
+
+Overview
+--------
+Keeps a level running for ``--soak-minutes`` with scripted inputs (a looped
+``tests/replays`` scenario) to exercise long-session behaviour such as
+``ParallaxManager``'s ``wrap_period`` float-precision guard. Frame time, JS
+heap, WASM memory and Godot node/orphan counts are sampled over time and fitted
+for growth; drift beyond ``SOAK_DRIFT_THRESHOLDS`` fails the test. The time
+series is written to ``artifacts/soak_timeseries.json``.
+
+Usage::
+
+    pytest tests/soak_test.py --soak-minutes 30
+"""
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from tests.perf import soak
+from tests.test_utils import ARTIFACTS_DIR, DEFAULT_TIMEOUT, start_preseeded_game
+
+
+@pytest.mark.soak
+@pytest.mark.seed_settings(log_level="WARNING", max_fuel=soak.SOAK_MAX_FUEL)
+def test_gameplay_soak(seeded_page: Page, request: pytest.FixtureRequest) -> None:
+    """
+    E2E: Soaks a running level and fails on resource growth trends.
+
+    Steps:
+    - Boot with a practically bottomless fuel tank and WARNING logging.
+    - Start the level and focus the canvas.
+    - Loop the soak scenario for --soak-minutes, sampling every --soak-interval.
+    - Export the time series and assert no series drifted.
+    """
+    start_preseeded_game(seeded_page, request)
+    canvas = seeded_page.locator("canvas")
+    expect(canvas).to_be_visible(timeout=DEFAULT_TIMEOUT)
+    canvas.focus()
+
+    report = soak.run_soak(
+        seeded_page,
+        request.config.getoption("--soak-minutes"),
+        interval_sec=request.config.getoption("--soak-interval"),
+    )
+    artifact = soak.write_soak_timeseries(
+        report, ARTIFACTS_DIR / "soak_timeseries.json"
+    )
+    report["artifact"] = str(artifact)
+    request.node._soak_report = report
+
+    assert not report["violations"], "Resource drift during soak: " + "; ".join(
+        report["violations"]
+    )
@@ -8,6 +8,7 @@ import json
 import os
 import re
 import time
+import uuid
 from pathlib import Path
 from typing import Any, Callable
 
@@ -17,6 +18,13 @@ from playwright.sync_api import Page, expect
 DEFAULT_TIMEOUT = int(os.getenv("DEFAULT_TIMEOUT", "30000"))
 TEST_TIMEOUT = int(os.getenv("TEST_TIMEOUT", "10000"))
 
+# Software-GL Chromium flags shared by the sync and async harnesses
+CHROMIUM_LAUNCH_ARGS: list[str] = [
+    "--enable-unsafe-swiftshader",
+    "--disable-gpu",
+    "--use-gl=swiftshader",
+]
+
 LOG_LEVEL_MAP: dict[str, int] = {
     "DEBUG": 0,
     "INFO": 1,
@@ -25,6 +33,16 @@ LOG_LEVEL_MAP: dict[str, int] = {
     "NONE": 4,
 }
 
+# Godot web user:// lives in Emscripten IDBFS, persisted to the IndexedDB database
+# named after its mount point. Godot 4 maps user:// to
+# /userfs/godot/app_userdata/<application/config/name>.
+IDBFS_DATABASE = "/userfs"
+IDBFS_DB_VERSION = 21
+GODOT_USER_DIR = os.getenv(
+    "PW_GODOT_USER_DIR", "/userfs/godot/app_userdata/SkyLockAssault"
+)
+SETTINGS_FILE_NAME = "settings.cfg"
+
 # Path configuration
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 _artifacts_path = Path(os.getenv("ARTIFACTS_DIR", "artifacts"))
@@ -91,6 +109,424 @@ def wait_for_console_log(
     )
 
 
+# Page-side navigation orchestrator: runs a declarative list of menu steps in
+# one evaluate. Each step may wait for a visible selector, an exposed Godot
+# callback, and an element's display value, then call the callback and wait for
+# a console log (any of the given substrings, lower-cased) emitted after the call.
+NAV_ORCHESTRATOR_SCRIPT = """
+(() => {
+    if (window.__navOrchestrator) return;
+    const logs = [];
+    let seq = 0;
+    for (const level of ['log', 'info', 'warn', 'error', 'debug']) {
+        const original = console[level].bind(console);
+        console[level] = (...args) => {
+            seq += 1;
+            logs.push({ seq, text: args.map(String).join(' ').toLowerCase() });
+            if (logs.length > 500) logs.shift();
+            original(...args);
+        };
+    }
+    const sleep = () => new Promise((resolve) => setTimeout(resolve, 16));
+    const until = async (check, timeout, what) => {
+        const deadline = performance.now() + timeout;
+        while (!check()) {
+            if (performance.now() > deadline) {
+                throw new Error(`Timed out after ${timeout}ms waiting for ${what}`);
+            }
+            await sleep();
+        }
+    };
+    const visible = (selector) => {
+        const el = document.querySelector(selector);
+        return !!el && el.getClientRects().length > 0
+            && window.getComputedStyle(el).visibility !== 'hidden';
+    };
+    const displayed = (selector, value) => {
+        const el = document.querySelector(selector);
+        return !!el && window.getComputedStyle(el).display === value;
+    };
+    window.__navOrchestrator = {
+        async run(steps, options) {
+            const timings = [];
+            for (const step of steps) {
+                const started = performance.now();
+                try {
+                    if (step.waitVisible) {
+                        await until(() => visible(step.waitVisible),
+                            options.waitTimeout, `${step.waitVisible} to be visible`);
+                    }
+                    if (step.waitFunction) {
+                        await until(() => typeof window[step.waitFunction] !== 'undefined',
+                            options.waitTimeout, `window.${step.waitFunction}`);
+                    }
+                    if (step.waitDisplay) {
+                        const [selector, value] = step.waitDisplay;
+                        await until(() => displayed(selector, value),
+                            options.waitTimeout, `${selector} display ${value}`);
+                    }
+                    const callSeq = seq;
+                    if (step.call) {
+                        const [name, args] = step.call;
+                        window[name](args);
+                    }
+                    if (step.waitLog) {
+                        await until(
+                            () => logs.some((log) => log.seq > callSeq
+                                && step.waitLog.some((text) => log.text.includes(text))),
+                            options.logTimeout,
+                            `console log matching ${JSON.stringify(step.waitLog)}`);
+                    }
+                } catch (err) {
+                    timings.push({ label: step.label, ms: performance.now() - started });
+                    return { ok: false, failed: step.label, error: String(err.message),
+                        steps: timings };
+                }
+                timings.push({ label: step.label, ms: performance.now() - started });
+            }
+            return { ok: true, steps: timings };
+        },
+    };
+})();
+"""
+
+
+def _press(label: str, selector: str, callback: str) -> dict[str, Any]:
+    """Orchestrator step: wait for a visible overlay and its callback, then call it."""
+    return {
+        "label": label,
+        "waitVisible": selector,
+        "waitFunction": callback,
+        "call": [callback, []],
+    }
+
+
+def start_step() -> dict[str, Any]:
+    """Orchestrator step that presses Start and waits for the level to be wired."""
+    return dict(
+        _press("start", "#start-button", "startPressed"),
+        waitLog=["hud successfully wired", "player ready"],
+    )
+
+
+def start_game_navigation_steps(
+    level_index: int, difficulty: float | None = None
+) -> list[dict[str, Any]]:
+    """Build the orchestrator steps for Options -> settings -> Start.
+
+    Covers the same menus as the sync ``open_options_menu``, ``set_log_level``
+    and ``set_difficulty`` helpers plus the back/start sequence; both the sync
+    and async ``start_game_and_wait_ready`` run these steps.
+    """
+    steps = [
+        _press("options", "#options-button", "optionsPressed"),
+        _press("advanced", "#advanced-button", "advancedPressed"),
+        {
+            "label": "log_level",
+            "waitFunction": "changeLogLevel",
+            "waitDisplay": ["#log-level-select", "block"],
+            "call": ["changeLogLevel", [level_index]],
+            "waitLog": ["log level changed to:"],
+        },
+        _press("advanced_back", "#advanced-back-button", "advancedBackPressed"),
+    ]
+    if difficulty is not None:
+        steps += [
+            _press("gameplay", "#gameplay-button", "gameplayPressed"),
+            {
+                "label": "difficulty",
+                "waitFunction": "changeDifficulty",
+                "waitDisplay": ["#difficulty-slider", "block"],
+                "call": ["changeDifficulty", [difficulty]],
+                "waitLog": ["setting 'difficulty' updated to:"],
+            },
+            _press("gameplay_back", "#gameplay-back-button", "gameplayBackPressed"),
+        ]
+    steps += [
+        dict(
+            _press("options_back", "#options-back-button", "optionsBackPressed"),
+            waitLog=[
+                "options back button pressed",
+                "back button pressed",
+                "options menu exited",
+            ],
+        ),
+        start_step(),
+    ]
+    return steps
+
+
+def build_navigation_call(steps: list[dict[str, Any]]) -> tuple[str, list[Any]]:
+    """Return the evaluate expression and argument that run ``steps`` page-side."""
+    expression = (
+        "async ([steps, options]) => {"
+        + NAV_ORCHESTRATOR_SCRIPT
+        + "return window.__navOrchestrator.run(steps, options); }"
+    )
+    options = {"waitTimeout": TEST_TIMEOUT, "logTimeout": DEFAULT_TIMEOUT}
+    return expression, [steps, options]
+
+
+def check_navigation_result(
+    result: dict[str, Any], request: Any | None = None
+) -> list[dict[str, Any]]:
+    """Validate an orchestrator result and record its per-step timings.
+
+    Raises
+    ------
+    AssertionError
+        If a step timed out; the message names the step and what it waited for.
+    """
+    timings = [
+        {"label": step["label"], "ms": round(step["ms"], 1)}
+        for step in result.get("steps", [])
+    ]
+    if request is not None and getattr(request, "node", None) is not None:
+        request.node._navigation_steps = timings
+    if not result.get("ok"):
+        raise AssertionError(
+            f"Navigation step '{result.get('failed')}' failed: {result.get('error')}"
+        )
+    return timings
+
+
+def run_navigation_script(
+    page: Page, steps: list[dict[str, Any]], request: Any | None = None
+) -> list[dict[str, Any]]:
+    """Run declarative menu steps page-side in a single ``evaluate`` round trip.
+
+    Parameters
+    ----------
+    page : Page
+        A page with the Godot engine booted.
+    steps : list[dict[str, Any]]
+        Orchestrator steps (see ``start_game_navigation_steps``).
+    request : Any | None, default=None
+        Pytest request; per-step timings are stored on ``request.node``.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        ``{"label", "ms"}`` per completed step.
+    """
+    expression, arg = build_navigation_call(steps)
+    return check_navigation_result(page.evaluate(expression, arg), request=request)
+
+
+# Writes files into the IDBFS object store the way Emscripten persists them, so
+# Godot's initial FS sync loads them before Globals._load_settings runs.
+SEED_IDBFS_SCRIPT = """
+async ({ database, version, dir, files }) => {
+    const db = await new Promise((resolve, reject) => {
+        const req = indexedDB.open(database, version);
+        req.onupgradeneeded = () => {
+            const store = req.result.objectStoreNames.contains('FILE_DATA')
+                ? req.transaction.objectStore('FILE_DATA')
+                : req.result.createObjectStore('FILE_DATA');
+            if (!store.indexNames.contains('timestamp')) {
+                store.createIndex('timestamp', 'timestamp', { unique: false });
+            }
+        };
+        req.onsuccess = () => resolve(req.result);
+        req.onerror = () => reject(req.error);
+    });
+    const tx = db.transaction(['FILE_DATA'], 'readwrite');
+    const store = tx.objectStore('FILE_DATA');
+    const now = new Date();
+    const parts = dir.split('/').filter(Boolean);
+    // The mount point itself is not persisted; every directory below it is
+    for (let i = 2; i <= parts.length; i++) {
+        store.put({ timestamp: now, mode: 16877 }, '/' + parts.slice(0, i).join('/'));
+    }
+    for (const [name, text] of Object.entries(files)) {
+        store.put(
+            { timestamp: now, mode: 33188, contents: new TextEncoder().encode(text) },
+            dir + '/' + name,
+        );
+    }
+    await new Promise((resolve, reject) => {
+        tx.oncomplete = resolve;
+        tx.onerror = () => reject(tx.error);
+    });
+    db.close();
+    return Object.keys(files).length;
+}
+"""
+
+
+def _config_value(value: Any) -> str:
+    """Format a Python value as a Godot ConfigFile (Variant text) literal."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, int):
+        return str(value)
+    return json.dumps(str(value))
+
+
+def build_settings_config(settings: dict[str, Any]) -> str:
+    """Render a ``[Settings]`` ConfigFile as read by ``Globals._load_settings``.
+
+    ``log_level`` may be given as a name (e.g. "DEBUG") or a menu index.
+    """
+    values = dict(settings)
+    if "log_level" in values:
+        values["log_level"] = resolve_log_level(values["log_level"])
+    lines = ["[Settings]", ""]
+    lines += [f"{key}={_config_value(value)}" for key, value in values.items()]
+    return "\n".join(lines) + "\n"
+
+
+def seed_settings_config(
+    page: Page,
+    settings: dict[str, Any],
+    url: str = "http://localhost:8080/index.html",
+) -> None:
+    """Pre-seed ``user://settings.cfg`` in the game origin's IDBFS before boot.
+
+    A blank same-origin document is routed in place of the game so IndexedDB
+    can be written without starting the engine; the seeding has completed
+    before ``init_page_and_wait_ready`` navigates. The file is written as
+    plaintext: ``Globals`` loads it through the legacy path and immediately
+    re-saves it encrypted with the build's key, which the harness cannot
+    derive (the salt is injected at export time).
+
+    Parameters
+    ----------
+    page : Page
+        A fresh page whose engine has not been booted yet.
+    settings : dict[str, Any]
+        ``[Settings]`` keys, e.g. ``{"difficulty": 2.0, "log_level": "DEBUG"}``.
+    url : str, default="http://localhost:8080/index.html"
+        Game URL; only its origin is used.
+    """
+    match = re.match(r"^[a-z]+://[^/]+", url)
+    if match is None:
+        raise ValueError(f"Cannot derive an origin from {url!r}")
+    seed_url = f"{match.group(0)}/__seed_settings__.html"
+
+    def _blank(route: Any) -> None:
+        route.fulfill(status=200, content_type="text/html", body="<html></html>")
+
+    page.route(seed_url, _blank)
+    try:
+        page.goto(seed_url, wait_until="domcontentloaded", timeout=DEFAULT_TIMEOUT)
+        page.evaluate(
+            SEED_IDBFS_SCRIPT,
+            {
+                "database": IDBFS_DATABASE,
+                "version": IDBFS_DB_VERSION,
+                "dir": GODOT_USER_DIR,
+                "files": {SETTINGS_FILE_NAME: build_settings_config(settings)},
+            },
+        )
+    finally:
+        page.unroute(seed_url, _blank)
+
+
+def set_time_scale(page: Page, scale: float) -> float:
+    """Set the game's ``Engine.time_scale`` via ``window.setTimeScale``.
+
+    Godot Timers, process and physics delta all follow the scale, so
+    time-based gameplay (fuel ticks, weapon cooldowns) runs ``scale`` times
+    faster. ``Globals.reset_game_state`` restores 1.0 on shared pages.
+
+    Returns
+    -------
+    float
+        The applied scale after Globals clamps it to ``[0, MAX_TIME_SCALE]``.
+    """
+    return float(
+        page.evaluate(
+            """(scale) => {
+                if (typeof window.setTimeScale !== 'function') {
+                    throw new Error('window.setTimeScale is not exposed by this build');
+                }
+                window.setTimeScale([scale]);
+                return window.currentTimeScale;
+            }""",
+            scale,
+        )
+    )
+
+
+# Resolves with the first game state snapshot (window.__skylockState, pushed by
+# Globals once per frame) for which the predicate holds; no polling involved.
+WAIT_FOR_GAME_STATE_SCRIPT = """
+async ({ predicate, timeout }) => {
+    const test = new Function('state', `return (${predicate});`);
+    const channel = window.__skylockState;
+    if (!channel) throw new Error('window.__skylockState is not defined by this shell');
+    if (channel.latest && test(channel.latest)) return channel.latest;
+    return await new Promise((resolve, reject) => {
+        const onState = (event) => {
+            if (!test(event.detail)) return;
+            clearTimeout(timer);
+            window.removeEventListener('skylock:state', onState);
+            resolve(event.detail);
+        };
+        const timer = setTimeout(() => {
+            window.removeEventListener('skylock:state', onState);
+            reject(new Error(`Timed out after ${timeout}ms waiting for state: ${predicate}`));
+        }, timeout);
+        window.addEventListener('skylock:state', onState);
+    });
+}
+"""
+
+
+def wait_for_game_state(
+    page: Page, predicate: str, timeout: int = DEFAULT_TIMEOUT
+) -> dict[str, Any]:
+    """Wait for a game state snapshot matching a JS predicate over ``state``.
+
+    Snapshots carry ``fuel``, ``speed``, ``log_level``, ``scene``, ``weapon``
+    (``{"shots", "cooldown"}``), ``frame``, ``time_ms`` and ``seq``; fields
+    appear once the game first reports them.
+
+    Parameters
+    ----------
+    page : Page
+        A booted game page.
+    predicate : str
+        JS expression, e.g. ``"typeof state.fuel === 'number' && state.fuel < 90"``.
+    timeout : int, default=DEFAULT_TIMEOUT
+        Milliseconds to wait for a matching snapshot.
+
+    Returns
+    -------
+    dict[str, Any]
+        The matching snapshot.
+    """
+    return page.evaluate(
+        WAIT_FOR_GAME_STATE_SCRIPT, {"predicate": predicate, "timeout": timeout}
+    )
+
+
+def subscribe_game_state(page: Page) -> list[dict[str, Any]]:
+    """Stream every game state snapshot of the current document into a list.
+
+    Snapshots are delivered through an exposed binding whenever Playwright
+    processes events; a reload drops the page-side listener.
+    """
+    snapshots: list[dict[str, Any]] = []
+    sink = f"__skylockStateSink_{uuid.uuid4().hex}"
+    page.expose_function(sink, snapshots.append)
+    page.evaluate(
+        """(sink) => window.addEventListener(
+            'skylock:state', (event) => window[sink](event.detail)
+        )""",
+        sink,
+    )
+    return snapshots
+
+
+def start_preseeded_game(page: Page, request: Any | None = None) -> None:
+    """Press Start on a page booted with seeded settings and wait for gameplay."""
+    run_navigation_script(page, [start_step()], request=request)
+
+
 def init_cdp_coverage(page: Page) -> tuple[Any, bool]:
     """Initialize V8 coverage profiling via CDP."""
     try:
@@ -151,6 +587,40 @@ def navigate_and_profile_godot_wasm(
     return init_page_and_wait_ready(page, url=url, request=request)
 
 
+def reset_game_state(page: Page, timeout: int = DEFAULT_TIMEOUT) -> dict[str, Any]:
+    """Reset the booted engine in place via ``window.resetGameState``.
+
+    Restores default settings, key bindings, audio buses and the main menu
+    without reloading the WASM module. The call and the wait for Godot's
+    confirmation (``window.gameStateReset``) happen in a single ``evaluate``.
+
+    Returns
+    -------
+    dict[str, Any]
+        The confirmation published by Globals (ok, scene, difficulty, log_level).
+    """
+    result = page.evaluate(
+        """async ({ token, timeout }) => {
+            if (typeof window.resetGameState !== 'function') {
+                throw new Error('window.resetGameState is not exposed by this build');
+            }
+            window.resetGameState([token]);
+            const deadline = performance.now() + timeout;
+            while (!(window.gameStateReset && window.gameStateReset.token === token)) {
+                if (performance.now() > deadline) {
+                    throw new Error('Timed out waiting for resetGameState confirmation');
+                }
+                await new Promise((resolve) => setTimeout(resolve, 16));
+            }
+            return window.gameStateReset;
+        }""",
+        {"token": uuid.uuid4().hex, "timeout": timeout},
+    )
+    if not result.get("ok"):
+        raise RuntimeError(f"resetGameState did not reach the main menu: {result}")
+    return result
+
+
 def open_options_menu(page: Page) -> None:
     """Navigate from Main Menu to Options menu."""
     page.wait_for_selector("#options-button", state="visible", timeout=TEST_TIMEOUT)
@@ -268,6 +738,16 @@ def set_difficulty(
     page.evaluate("window.gameplayBackPressed([])")
 
 
+def resolve_log_level(log_level: str | int) -> int:
+    """Map a log level name (case-insensitive) or index to its menu index."""
+    if isinstance(log_level, str):
+        key = log_level.upper()
+        if key not in LOG_LEVEL_MAP:
+            raise ValueError(f"Unknown log level: {log_level!r}")
+        return LOG_LEVEL_MAP[key]
+    return log_level
+
+
 def start_game_and_wait_ready(
     page: Page,
     logs: list[dict[str, str]],
@@ -277,58 +757,18 @@ def start_game_and_wait_ready(
 ) -> tuple[Any, bool]:
     """Shared E2E setup helper that initializes V8 coverage, loads Godot,
     configures settings, and starts gameplay.
+
+    The menu navigation runs page-side in one round trip
+    (``run_navigation_script``); console logs still reach ``logs`` through the
+    caller's listener.
     """
     cdp_session, coverage_started = init_cdp_coverage(page)
 
     init_page_and_wait_ready(page, request=request)
-    open_options_menu(page)
-
-    if isinstance(log_level, str):
-        key = log_level.upper()
-        if key not in LOG_LEVEL_MAP:
-            raise ValueError(f"Unknown log level: {log_level!r}")
-        lvl_index = LOG_LEVEL_MAP[key]
-    else:
-        lvl_index = log_level
-
-    set_log_level(page, logs, level_index=lvl_index)
-
-    if difficulty is not None:
-        set_difficulty(page, logs, difficulty=difficulty)
-
-    page.wait_for_selector(
-        "#options-back-button", state="visible", timeout=TEST_TIMEOUT
-    )
-    page.wait_for_function(
-        "() => typeof window.optionsBackPressed !== 'undefined'",
-        timeout=TEST_TIMEOUT,
-    )
-    pre_change_log_count = len(logs)
-    page.evaluate("window.optionsBackPressed([])")
-    wait_for_console_log(
-        logs,
-        lambda text: "options back button pressed" in text
-        or "back button pressed" in text
-        or "options menu exited" in text,
-        pre_change_log_count,
-        page,
-        timeout_ms=DEFAULT_TIMEOUT,
-    )
-
-    page.wait_for_selector("#start-button", state="visible", timeout=TEST_TIMEOUT)
-    page.wait_for_function(
-        "() => typeof window.startPressed !== 'undefined'",
-        timeout=TEST_TIMEOUT,
-    )
-    pre_change_log_count = len(logs)
-    page.evaluate("window.startPressed([])")
-
-    wait_for_console_log(
-        logs,
-        lambda text: "hud successfully wired" in text or "player ready" in text,
-        pre_change_log_count,
+    run_navigation_script(
         page,
-        timeout_ms=DEFAULT_TIMEOUT,
+        start_game_navigation_steps(resolve_log_level(log_level), difficulty),
+        request=request,
     )
 
     return cdp_session, coverage_started
@@ -147,10 +147,7 @@ def test_start_game_and_wait_ready_propagates_request_and_sets_wasm_boot_time()
 
     with (
         patch("tests.test_utils.init_cdp_coverage", return_value=(MagicMock(), True)),
-        patch("tests.test_utils.open_options_menu"),
-        patch("tests.test_utils.set_log_level"),
-        patch("tests.test_utils.set_difficulty"),
-        patch("tests.test_utils.wait_for_console_log"),
+        patch("tests.test_utils.run_navigation_script") as mock_navigation,
         patch(
             "tests.test_utils.init_page_and_wait_ready",
             wraps=real_init_page,
@@ -166,6 +163,7 @@ def test_start_game_and_wait_ready_propagates_request_and_sets_wasm_boot_time()
 
     _, kwargs = mock_init.call_args
     assert kwargs["request"] is request
+    assert mock_navigation.call_args.kwargs["request"] is request
     assert hasattr(request.node, "_wasm_boot_time")
     assert request.node._wasm_boot_time == 2.5
 
@@ -17,23 +17,24 @@ import os
 import time
 from typing import Any
 
+import pytest
 from playwright.sync_api import Page, expect
 
 from tests.test_utils import (
     DEFAULT_TIMEOUT,
-    start_game_and_wait_ready,
+    start_preseeded_game,
     wait_for_console_log,
 )
 
 
-def test_weapon_firing(shared_page: Page) -> None:
+@pytest.mark.seed_settings(log_level="DEBUG")
+def test_weapon_firing(seeded_page: Page, seeded_coverage: tuple[Any, bool]) -> None:
     """
     E2E: Verifies that pressing Space during gameplay fires a weapon.
 
     Steps:
-    - Open game page and wait for Godot initialization.
-    - Open Options ➔ Advanced settings and set log level to DEBUG (0).
-    - Return to Main Menu and start the level.
+    - Boot the game with log level DEBUG (0) pre-seeded in user://settings.cfg.
+    - Start the level directly from the Main Menu.
     - Wait for player/HUD readiness.
     - Focus canvas and press Space key.
     - Verify "Firing with scaled cooldown:" appears in console logs.
@@ -44,34 +45,30 @@ def test_weapon_firing(shared_page: Page) -> None:
         """Console message handler to capture logs."""
         logs.append({"type": msg.type, "text": msg.text})
 
-    shared_page.on("console", on_console)
+    seeded_page.on("console", on_console)
 
-    cdp_session = None
-    coverage_started = False
+    # Coverage was started by seeded_page before the engine booted
+    cdp_session, coverage_started = seeded_coverage
 
     try:
-        # 1. Initialize CDP coverage, load page, configure settings & start game
-        cdp_session, coverage_started = start_game_and_wait_ready(
-            page=shared_page,
-            logs=logs,
-            log_level="DEBUG",
-        )
+        # 1. Start the game with pre-seeded settings
+        start_preseeded_game(seeded_page)
 
         # 2. Verify canvas visibility
-        canvas = shared_page.locator("canvas")
+        canvas = seeded_page.locator("canvas")
         expect(canvas).to_be_visible(timeout=DEFAULT_TIMEOUT)
 
         # 3. Focus Canvas and fire weapon
         canvas.focus()
         pre_fire_log_count = len(logs)
-        shared_page.keyboard.press("Space")
+        seeded_page.keyboard.press("Space")
 
         # 4. Verify weapon firing log
         wait_for_console_log(
             logs,
             lambda text: "firing with scaled cooldown:" in text.lower(),
             pre_fire_log_count,
-            shared_page,
+            seeded_page,
             timeout_ms=DEFAULT_TIMEOUT,
         )
 
@@ -88,7 +85,7 @@ def test_weapon_firing(shared_page: Page) -> None:
         print(f"Test suite failed: {str(e)}")
         os.makedirs("artifacts", exist_ok=True)
         timestamp: int = int(time.time())
-        shared_page.screenshot(
+        seeded_page.screenshot(
             path=f"artifacts/test_weapon_firing_failure_{timestamp}.png"
         )
         log_file = f"artifacts/test_weapon_firing_failure_console_logs_{timestamp}.txt"